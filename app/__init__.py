@@ -9,8 +9,9 @@ from flask_migrate import Migrate
 from flask_cors import CORS
 import os
 from datetime import datetime
+from app.database import RoutingSession, configure_database, register_engine_events
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
 
 def create_app(config_name='default'):
@@ -25,11 +26,15 @@ def create_app(config_name='default'):
 
     # Configuration
     # Use /tmp for SQLite on App Engine (read-only filesystem)
-    if os.environ.get('GAE_ENV', '').startswith('standard'):
+    if os.environ.get('SQLITE_PATH'):
+        # Other SQLite file with the same profile (benchmarks, tests)
+        db_path = os.environ['SQLITE_PATH']
+    elif os.environ.get('GAE_ENV', '').startswith('standard'):
         db_path = '/tmp/gestorev2.db'
     else:
         db_path = os.path.join(basedir, 'gestorev2.db')
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    # DATABASE_URL switches to a pooled server database, otherwise SQLite
+    configure_database(app, db_path)
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or os.urandom(24)
     app.config['JSON_AS_ASCII'] = False  # Support PT-PT characters
@@ -44,10 +49,23 @@ def create_app(config_name='default'):
     app.config['SMTP_SERVER'] = os.environ.get('SMTP_SERVER', 'smtp.gmail.com')
     app.config['SMTP_PORT'] = int(os.environ.get('SMTP_PORT', 587))
 
+    # Background jobs: Celery when a broker is configured, else in-process threads
+    app.config['CELERY_BROKER_URL'] = os.environ.get('CELERY_BROKER_URL', '')
+    app.config['CELERY_RESULT_BACKEND'] = os.environ.get('CELERY_RESULT_BACKEND', '')
+
+    # Periodic sync of Google Form responses (0 disables it)
+    from app.constants import GoogleConfig
+    app.config['FORM_SYNC_INTERVAL_SECONDS'] = int(os.environ.get(
+        'FORM_SYNC_INTERVAL_SECONDS', GoogleConfig.FORM_SYNC_INTERVAL_SECONDS))
+
     # Initialize extensions
     db.init_app(app)
+    register_engine_events(app, db)
     migrate.init_app(app, db)
     CORS(app)
+    if app.config['CELERY_BROKER_URL']:
+        from app.tasks import init_celery
+        init_celery(app)
 
     # Create upload folders
     # Use /tmp for App Engine (read-only filesystem)
@@ -55,6 +73,8 @@ def create_app(config_name='default'):
         # Running on App Engine
         app.config['UPLOAD_FOLDER'] = '/tmp/uploads'
         certificados_folder = '/tmp/certificados'
+        # Idle instances are frozen, so background threads cannot be relied on
+        app.config['FORM_SYNC_INTERVAL_SECONDS'] = 0
     else:
         # Running locally
         certificados_folder = os.path.join(basedir, 'certificados')
@@ -63,12 +83,14 @@ def create_app(config_name='default'):
     os.makedirs(certificados_folder, exist_ok=True)
 
     # Register API blueprints
-    from app.api.routes import events, participants, users, certificates, gdrive
+    from app.api.routes import events, participants, users, certificates, gdrive, search, imports
     app.register_blueprint(events.bp)
     app.register_blueprint(participants.bp)
     app.register_blueprint(users.bp)
     app.register_blueprint(certificates.bp)
     app.register_blueprint(gdrive.bp)
+    app.register_blueprint(search.bp)
+    app.register_blueprint(imports.bp)
 
     # Register frontend blueprint (main - beautiful v1 frontend)
     from app.api.routes import main
@@ -88,6 +110,14 @@ def create_app(config_name='default'):
         db.session.rollback()
         return {'error': 'Erro interno do servidor'}, 500
 
+    # Start the form sync scheduler with the first request, not on import
+    # (flask db upgrade and other CLI commands also build the app)
+    from app.services.form_sync_scheduler import form_sync_scheduler
+
+    @app.before_request
+    def start_form_sync():
+        form_sync_scheduler.start(app)
+
     # Context processor for templates
     @app.context_processor
     def inject_now():
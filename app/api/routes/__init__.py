@@ -2,6 +2,6 @@
 API routes initialization
 """
 
-from app.api.routes import events, participants, users, certificates, web
+from app.api.routes import events, participants, users, certificates, search, imports, web
 
-__all__ = ['events', 'participants', 'users', 'certificates', 'web']
+__all__ = ['events', 'participants', 'users', 'certificates', 'search', 'imports', 'web']
@@ -191,3 +191,99 @@ def event_stats(event_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/<int:event_id>/form-mapping', methods=['GET'])
+def get_form_mapping(event_id):
+    """Get how the questions of the event's Google Form map to participant fields"""
+    from app.services.google_forms_service import GoogleFormsService
+
+    try:
+        event = Event.query.get_or_404(event_id)
+
+        if event.deleted_at:
+            return jsonify({'error': 'Evento não encontrado'}), 404
+        if not event.google_form_id:
+            return jsonify({'error': 'Este evento não tem formulário Google associado'}), 400
+
+        mapper = GoogleFormsService().get_field_mapper(event.google_form_id, event.google_form_mapping)
+
+        return jsonify({
+            'form_id': event.google_form_id,
+            'revision_id': mapper.revision_id,
+            'overrides': event.google_form_mapping or {},
+            'questions': mapper.describe(),
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/<int:event_id>/form-mapping', methods=['PUT'])
+def update_form_mapping(event_id):
+    """Set the question -> field overrides of the event's Google Form"""
+    from app.services.form_field_mapper import FormFieldMapper
+
+    try:
+        event = Event.query.get_or_404(event_id)
+
+        if event.deleted_at:
+            return jsonify({'error': 'Evento não encontrado'}), 404
+
+        data = request.get_json() or {}
+        try:
+            overrides = FormFieldMapper.validate_overrides(data.get('overrides', {}))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        event.google_form_mapping = overrides or None
+        # Responses already synced were mapped the old way: read them all again
+        event.google_last_response_at = None
+        db.session.commit()
+
+        return jsonify({'overrides': event.google_form_mapping or {}}), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/<int:event_id>/sheet-sync', methods=['GET'])
+def get_sheet_sync(event_id):
+    """Get the Google Sheet the event's participants are mirrored to"""
+    try:
+        event = Event.query.get_or_404(event_id)
+
+        if event.deleted_at:
+            return jsonify({'error': 'Evento não encontrado'}), 404
+        if event.sheet_sync is None:
+            return jsonify({'error': 'Este evento não tem folha Google associada'}), 404
+
+        return jsonify(event.sheet_sync.to_dict()), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/<int:event_id>/sheet-sync', methods=['POST'])
+def sync_sheet(event_id):
+    """Sync the event's participants with its Google Sheet (optional JSON: spreadsheet_id to link)"""
+    from app.services.sheet_sync_service import SheetSyncService
+
+    try:
+        event = Event.query.get_or_404(event_id)
+
+        if event.deleted_at:
+            return jsonify({'error': 'Evento não encontrado'}), 404
+
+        data = request.get_json() if request.is_json else {}
+        try:
+            result = SheetSyncService().sync_event(event, spreadsheet_id=data.get('spreadsheet_id'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        return jsonify(result), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
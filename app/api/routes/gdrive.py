@@ -1,7 +1,7 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, url_for
 from app.services import GoogleService
-from app import db
-from app.models import Event, Participant
+from app.services.import_job_service import ImportJobService
+from app.models import Event
 from datetime import datetime
 import logging
 
@@ -134,8 +134,9 @@ def import_participants_to_event(event_id):
 
         data = request.get_json()
         spreadsheet_id = data.get('spreadsheet_id')
-        sheet_range = data.get('range', 'A2:Z1000')  # Default: skip header row
+        sheet_range = data.get('range')  # Default: every row after the header
         skip_duplicates = data.get('skip_duplicates', True)
+        dry_run = data.get('dry_run', False)  # Preview only, confirm via /api/imports/<job_id>/confirm
 
         if not spreadsheet_id:
             return jsonify({'error': 'Spreadsheet ID required'}), 400
@@ -151,81 +152,26 @@ def import_participants_to_event(event_id):
         # Convert string keys to int
         column_mapping = {int(k): v for k, v in column_mapping.items()}
 
-        # Read data from sheet
-        raw_values = google_service.get_spreadsheet_data(spreadsheet_id, sheet_range)
-
-        stats = {
-            'total_rows': len(raw_values),
-            'imported': 0,
-            'skipped': 0,
-            'errors': 0,
-            'error_details': []
+        # Read and import in the background (big sheets exceed the request timeout)
+        job = ImportJobService().enqueue(
+            ImportJobService.TIPO_SHEET_PARTICIPANTES, spreadsheet_id,
+            evento_id=event_id,
+            params={
+                'range': sheet_range,
+                'skip_duplicates': skip_duplicates,
+                'column_mapping': column_mapping
+            },
+            dry_run=dry_run
+        )
+
+        response = {
+            'message': 'Importação iniciada',
+            'job_id': job.id,
+            'status_url': url_for('imports.get_import_job', job_id=job.id)
         }
-
-        for idx, row in enumerate(raw_values, start=2):  # Start at 2 (1 is header)
-            try:
-                # Extract data based on column mapping
-                participant_data = {}
-                for col_idx, field_name in column_mapping.items():
-                    if col_idx < len(row):
-                        value = row[col_idx].strip() if row[col_idx] else None
-                        if value:
-                            participant_data[field_name] = value
-
-                # Validate required fields
-                if 'nome' not in participant_data or 'email' not in participant_data:
-                    stats['skipped'] += 1
-                    stats['error_details'].append({
-                        'row': idx,
-                        'error': 'Nome ou email em falta',
-                        'data': row[:5]  # Only first 5 columns for privacy
-                    })
-                    continue
-
-                # Check for duplicates
-                if skip_duplicates:
-                    existing = Participant.query.filter_by(
-                        email=participant_data['email'],
-                        evento_id=event_id,
-                        deleted_at=None
-                    ).first()
-
-                    if existing:
-                        stats['skipped'] += 1
-                        logger.info(f"Participante duplicado ignorado: {participant_data['email']}")
-                        continue
-
-                # Create participant
-                participant = Participant(
-                    nome=participant_data['nome'],
-                    email=participant_data['email'],
-                    evento_id=event_id,
-                    telefone=participant_data.get('telefone'),
-                    empresa=participant_data.get('empresa'),
-                    observacoes=participant_data.get('observacoes'),
-                    status='pendente'
-                )
-
-                db.session.add(participant)
-                db.session.commit()
-                stats['imported'] += 1
-
-                logger.info(f"Participante importado: {participant.nome} ({participant.email})")
-
-            except Exception as e:
-                stats['errors'] += 1
-                stats['error_details'].append({
-                    'row': idx,
-                    'error': str(e),
-                    'data': row[:5] if row else []
-                })
-                logger.error(f"Erro ao importar linha {idx}: {e}")
-                db.session.rollback()
-
-        return jsonify({
-            'message': f'Importação concluída: {stats["imported"]} participantes importados',
-            'stats': stats
-        }), 200
+        if dry_run:
+            response['confirm_url'] = url_for('imports.confirm_import_job', job_id=job.id)
+        return jsonify(response), 202
 
     except Exception as e:
         logger.error(f"Import error: {e}")
@@ -0,0 +1,87 @@
+"""
+Import job API endpoints
+"""
+
+from flask import Blueprint, request, jsonify
+from app.models import ImportJob
+from app.services.date_parser import date_parser
+from app.services.import_job_service import ImportJobService
+from app.services.parse_cache import parse_cache
+
+bp = Blueprint('imports', __name__, url_prefix='/api/imports')
+
+
+@bp.route('/', methods=['GET'])
+def list_import_jobs():
+    """Most recent import jobs (optionally for one event)"""
+    try:
+        query = ImportJob.query
+        evento_id = request.args.get('evento_id', type=int)
+        if evento_id is not None:
+            query = query.filter_by(evento_id=evento_id)
+
+        limit = min(request.args.get('limit', 20, type=int), 100)
+        jobs = query.order_by(ImportJob.created_at.desc()).limit(limit).all()
+        return jsonify([job.to_dict() for job in jobs]), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/stats', methods=['GET'])
+def get_import_stats():
+    """Date formats seen in imports and parse cache usage (since process start)"""
+    try:
+        return jsonify({
+            'datas': date_parser.stats(),
+            'cache': parse_cache.info()
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/<job_id>', methods=['GET'])
+def get_import_job(job_id):
+    """Status and progress of an import job"""
+    try:
+        job = ImportJobService().get(job_id)
+        if job is None:
+            return jsonify({'error': 'Importação não encontrada'}), 404
+
+        return jsonify(job.to_dict()), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/<job_id>/confirm', methods=['POST'])
+def confirm_import_job(job_id):
+    """Apply the previewed diff of a dry-run import"""
+    try:
+        job = ImportJobService().confirm(job_id)
+        if job is None:
+            return jsonify({'error': 'Importação não encontrada'}), 404
+
+        return jsonify(job.to_dict()), 202
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 409
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/<job_id>/cancel', methods=['POST'])
+def cancel_import_job(job_id):
+    """Discard the previewed diff of a dry-run import"""
+    try:
+        job = ImportJobService().cancel(job_id)
+        if job is None:
+            return jsonify({'error': 'Importação não encontrada'}), 404
+
+        return jsonify(job.to_dict()), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 409
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
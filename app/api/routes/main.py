@@ -186,172 +186,24 @@ def criar_evento_from_excel():
             flash(f'Erro: ficheiro não foi guardado corretamente em {filepath}', 'error')
             return redirect(url_for('main.criar_evento'))
 
-        # Parse Excel
-        print(f"DEBUG - Starting to parse Excel file...")
-        data = excel_service.parse_excel_file(filepath)
-        print(f"DEBUG - Excel parsed successfully")
-
-        # Check if multi-event format or single event
-        if 'events' in data:
-            # Multi-event format
-            events_list = data['events']
-            print(f"DEBUG - Multi-event format detected: {len(events_list)} events")
-
-            # Get organization ID from form
-            organizacao_id = request.form.get('organizacao_id', type=int)
-            if not organizacao_id:
-                organizacao_id = 1  # Default to Ana Rita
-
-            created_events = []
-            total_participants = 0
-
-            for event_item in events_list:
-                event_data = event_item['event']
-                participants_data = event_item['participants']
-
-                # Validate required fields
-                nome = event_data.get('nome', '').strip()
-                if not nome:
-                    flash('⚠️ Nome do evento é obrigatório. Evento ignorado.', 'warning')
-                    continue
-
-                # Convert dates (optional - if not found, use None)
-                data_inicio = event_data.get('data') or event_data.get('data_inicio')
-                if data_inicio and hasattr(data_inicio, 'date'):
-                    data_inicio = data_inicio.date()
-
-                # Data is now optional - if not found, event will be created without date
-                if not data_inicio:
-                    print(f"DEBUG - No date found for event '{nome}', proceeding without date")
-
-                data_fim = event_data.get('data_fim')
-                if data_fim and hasattr(data_fim, 'date'):
-                    data_fim = data_fim.date()
-
-                # Get duration in minutes
-                duracao_minutos = event_data.get('duracao', 60)
-
-                # Create event
-                evento = Event(
-                    nome=nome,
-                    data_inicio=data_inicio,
-                    data_fim=data_fim,
-                    duracao_minutos=duracao_minutos,
-                    descricao=event_data.get('descricao', ''),
-                    formadora=event_data.get('formadora', '') or 'Ana Rita Vieira',
-                    local=event_data.get('local', ''),
-                    organizacao_id=organizacao_id
-                )
-                db.session.add(evento)
-                db.session.flush()  # Get evento.id
-
-                # Create participants for this event
-                for participant_data in participants_data:
-                    participante = Participant(
-                        evento_id=evento.id,
-                        nome=participant_data.get('nome', ''),
-                        email=participant_data.get('email', ''),
-                        telefone=participant_data.get('telefone', ''),
-                        empresa=participant_data.get('empresa', ''),
-                        observacoes=participant_data.get('observacoes', '')
-                    )
-                    db.session.add(participante)
-                    total_participants += 1
-
-                created_events.append(evento)
-
-            db.session.commit()
-
-            # Clean up
-            try:
-                os.remove(filepath)
-            except:
-                pass
-
-            flash(f'{len(created_events)} eventos criados com sucesso! {total_participants} participantes importados.', 'success')
-            # Redirect to appropriate organization page
-            if organizacao_id == 2:  # AR da TERRA
-                return redirect(url_for('main.eventos_ardaterra'))
-            else:  # Ana Rita (default)
-                return redirect(url_for('main.eventos_anarita'))
-
-        else:
-            # Single event format (legacy)
-            event_data = data['event']
-            participants_data = data['participants']
-
-            # Get organization ID from form
-            organizacao_id = request.form.get('organizacao_id', type=int)
-            if not organizacao_id:
-                organizacao_id = 1  # Default to Ana Rita
-
-            print("DEBUG - Single event format")
-            print(f"Event data: {event_data}")
-            print(f"Participants count: {len(participants_data)}")
-
-            # Validate required fields
-            nome = event_data.get('nome', '').strip()
-            if not nome:
-                flash('⚠️ Nome do evento é obrigatório', 'error')
-                return redirect(url_for('main.criar_evento'))
-
-            # Convert dates (optional - if not found, use None)
-            data_inicio = event_data.get('data') or event_data.get('data_inicio')
-            if data_inicio and hasattr(data_inicio, 'date'):
-                data_inicio = data_inicio.date()
-
-            # Data is now optional
-            if not data_inicio:
-                print(f"DEBUG - No date found for event '{nome}', proceeding without date")
-
-            data_fim = event_data.get('data_fim')
-            if data_fim and hasattr(data_fim, 'date'):
-                data_fim = data_fim.date()
-
-            # Get duration in minutes
-            duracao_minutos = event_data.get('duracao', 60)
-
-            evento = Event(
-                nome=nome,
-                data_inicio=data_inicio,
-                data_fim=data_fim,
-                duracao_minutos=duracao_minutos,
-                descricao=event_data.get('descricao', ''),
-                formadora=event_data.get('formadora', '') or 'Ana Rita Vieira',
-                local=event_data.get('local', ''),
-                organizacao_id=organizacao_id
-            )
-            db.session.add(evento)
-            db.session.flush()  # Get evento.id
-
-            # Create participants
-            participants_count = 0
-            for participant_data in participants_data:
-                participante = Participant(
-                    evento_id=evento.id,
-                    nome=participant_data.get('nome', ''),
-                    email=participant_data.get('email', ''),
-                    telefone=participant_data.get('telefone', ''),
-                    empresa=participant_data.get('empresa', ''),
-                    observacoes=participant_data.get('observacoes', '')
-                )
-                db.session.add(participante)
-                participants_count += 1
-
-            db.session.commit()
-
-            # Clean up uploaded file
-            try:
-                os.remove(filepath)
-            except:
-                pass
+        # Get organization ID from form
+        organizacao_id = request.form.get('organizacao_id', type=int)
+        if not organizacao_id:
+            organizacao_id = 1  # Default to Ana Rita
+
+        # Parse and create in the background (big files exceed the request timeout)
+        from app.services.import_job_service import ImportJobService
+        job = ImportJobService().enqueue(
+            ImportJobService.TIPO_EXCEL_EVENTO, filepath, organizacao_id=organizacao_id
+        )
+        print(f"DEBUG - Import job queued: {job.id}")
 
-            flash(f'Evento criado com sucesso! {participants_count} participantes importados.', 'success')
-            # Redirect to appropriate organization page
-            if organizacao_id == 2:  # AR da TERRA
-                return redirect(url_for('main.eventos_ardaterra'))
-            else:  # Ana Rita (default)
-                return redirect(url_for('main.eventos_anarita'))
+        flash('A importar Excel em segundo plano. Os eventos aparecem quando a importação terminar.', 'info')
+        # Redirect to appropriate organization page
+        if organizacao_id == 2:  # AR da TERRA
+            return redirect(url_for('main.eventos_ardaterra', import_job=job.id))
+        else:  # Ana Rita (default)
+            return redirect(url_for('main.eventos_anarita', import_job=job.id))
 
     except FileNotFoundError as e:
         db.session.rollback()
@@ -553,10 +405,60 @@ def create_event_automation(evento_id):
         return redirect(url_for('main.gestao_automatica'))
 
 
+@bp.route('/automation/create-batch', methods=['POST'])
+def create_events_automation():
+    """Create Google Forms for several events (evento_ids, or every event without a form)"""
+    from app.services.google_forms_service import GoogleFormsService
+
+    try:
+        evento_ids = request.form.getlist('evento_ids', type=int)
+        query = Event.query.filter(Event.deleted_at.is_(None), Event.google_form_id.is_(None))
+        if evento_ids:
+            query = query.filter(Event.id.in_(evento_ids))
+        else:
+            # Forms need the event dates; undated (e.g. imported) events are linked by hand
+            query = query.filter(Event.data_inicio.isnot(None))
+        eventos = query.all()
+
+        if not eventos:
+            flash('Não há eventos sem formulário para automatizar', 'warning')
+            return redirect(url_for('main.gestao_automatica'))
+
+        # All forms are created and filled in with two batch requests
+        results = GoogleFormsService().create_event_forms(eventos)
+
+        failed = []
+        for evento, result in zip(eventos, results):
+            if 'error' in result:
+                failed.append(f'{evento.nome}: {result["error"]}')
+                continue
+            evento.google_form_id = result['form_id']
+            evento.google_form_url = result['form_url']
+            evento.google_sheet_id = result['sheet_id']
+            evento.google_sheet_url = result['sheet_url']
+
+        db.session.commit()
+
+        created = len(eventos) - len(failed)
+        if created:
+            flash(f'✓ {created} Google Forms criados com sucesso!', 'success')
+        for message in failed:
+            flash(f'Erro ao criar automação: {message}', 'error')
+
+        return redirect(url_for('main.gestao_automatica'))
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f'Erro ao criar automação: {str(e)}', 'error')
+        import traceback
+        traceback.print_exc()
+        return redirect(url_for('main.gestao_automatica'))
+
+
 @bp.route('/automation/sync/<int:evento_id>', methods=['POST'])
 def sync_event_responses(evento_id):
     """Sync responses from Google Forms/Sheets"""
-    from app.services.google_forms_service import GoogleFormsService
+    from app.services.form_sync_service import FormSyncService
 
     try:
         evento = Event.query.get_or_404(evento_id)
@@ -565,42 +467,10 @@ def sync_event_responses(evento_id):
             flash('Este evento não tem formulário Google associado', 'error')
             return redirect(url_for('main.gestao_automatica'))
 
-        # Get form responses
-        forms_service = GoogleFormsService()
-        responses = forms_service.get_form_responses(evento.google_form_id)
-
-        # Sync participants
-        new_participants = 0
-        updated_participants = 0
-
-        for response_data in responses:
-            # Check if participant already exists
-            existing = Participant.query.filter_by(
-                evento_id=evento.id,
-                email=response_data['email']
-            ).first()
-
-            if existing:
-                # Update existing participant
-                existing.nome = response_data['nome']
-                existing.telefone = response_data['telefone']
-                existing.empresa = response_data['empresa']
-                existing.observacoes = response_data['observacoes']
-                updated_participants += 1
-            else:
-                # Create new participant
-                participante = Participant(
-                    evento_id=evento.id,
-                    nome=response_data['nome'],
-                    email=response_data['email'],
-                    telefone=response_data['telefone'],
-                    empresa=response_data['empresa'],
-                    observacoes=response_data['observacoes']
-                )
-                db.session.add(participante)
-                new_participants += 1
-
-        db.session.commit()
+        # Only responses submitted or edited since the last sync are fetched
+        stats = FormSyncService().sync_event(evento)
+        new_participants = stats['imported']
+        updated_participants = stats['updated']
 
         flash(f'✓ Sincronização concluída: {new_participants} novos, {updated_participants} atualizados', 'success')
         return redirect(url_for('main.gestao_automatica'))
@@ -613,6 +483,30 @@ def sync_event_responses(evento_id):
         return redirect(url_for('main.gestao_automatica'))
 
 
+@bp.route('/automation/sync/status')
+def sync_status():
+    """Status of the background form sync (last run, duration and errors per event)"""
+    from app.services.form_sync_scheduler import form_sync_scheduler
+
+    return jsonify(form_sync_scheduler.status())
+
+
+@bp.route('/automation/google/stats')
+def google_api_stats():
+    """Calls, errors, retries and latency of the Google API requests, plus the in-memory caches"""
+    from app.services.google_request_executor import google_requests
+    from app.services.google_client_cache import google_clients
+    from app.services.form_field_mapper import form_mappers
+    from app.services.form_catalog_cache import form_catalog
+
+    return jsonify({
+        'requests': google_requests.info(),
+        'clients': google_clients.info(),
+        'form_mappers': form_mappers.info(),
+        'form_catalog': form_catalog.info(),
+    })
+
+
 @bp.route('/automation/list-forms')
 def list_google_forms():
     """List available Google Forms from Drive"""
@@ -622,9 +516,10 @@ def list_google_forms():
         # Get limit from query parameter, default 100
         limit = request.args.get('limit', 100, type=int)
         limit = min(limit, 500)  # Cap at 500 for performance
+        refresh = request.args.get('refresh', '').lower() in ('1', 'true')
 
         forms_service = GoogleFormsService()
-        forms = forms_service.list_recent_forms(limit=limit)
+        forms = forms_service.list_recent_forms(limit=limit, refresh=refresh)
 
         print(f"DEBUG - Returning {len(forms)} forms to frontend")
 
@@ -674,6 +569,22 @@ def search_google_forms():
         }), 500
 
 
+@bp.route('/automation/forms-cache/invalidate', methods=['POST'])
+def invalidate_forms_cache():
+    """Forget the cached Google Forms list so the next listing reads Drive again"""
+    from app.services.google_forms_service import GoogleFormsService
+
+    try:
+        GoogleFormsService().invalidate_forms_cache()
+        return jsonify({'success': True})
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @bp.route('/automation/link/<int:evento_id>/<form_id>', methods=['POST'])
 def link_existing_form(evento_id, form_id):
     """Link an existing Google Form to an event"""
@@ -712,6 +623,46 @@ def link_existing_form(evento_id, form_id):
         return redirect(url_for('main.gestao_automatica'))
 
 
+@bp.route('/automation/link-batch', methods=['POST'])
+def link_existing_forms():
+    """Link existing Google Forms to several events ({"links": {evento_id: form_id}})"""
+    from app.services.google_forms_service import GoogleFormsService
+
+    try:
+        links = {int(evento_id): form_id for evento_id, form_id in (request.get_json() or {}).get('links', {}).items()}
+        eventos = Event.query.filter(Event.id.in_(links), Event.deleted_at.is_(None)).all()
+
+        # Metadata of every form in one batch request per API
+        forms_info = GoogleFormsService().get_forms_info(sorted(set(links.values())))
+
+        linked, errors = [], {}
+        for evento in eventos:
+            form_id = links[evento.id]
+            if evento.google_form_id:
+                errors[evento.id] = 'Este evento já tem um formulário associado'
+            elif not forms_info.get(form_id):
+                errors[evento.id] = 'Formulário não encontrado'
+            else:
+                evento.google_form_id = form_id
+                evento.google_form_url = forms_info[form_id]['url']
+                linked.append(evento.id)
+        for evento_id in set(links) - {evento.id for evento in eventos}:
+            errors[evento_id] = 'Evento não encontrado'
+
+        db.session.commit()
+
+        return jsonify({'success': True, 'linked': linked, 'errors': errors})
+
+    except Exception as e:
+        db.session.rollback()
+        import traceback
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 # Certificate routes - Frontend wrappers for API endpoints
 @bp.route('/certificado/gerar/<int:participante_id>', methods=['POST'])
 def gerar_certificado(participante_id):
@@ -996,7 +947,6 @@ def remover_participante(evento_id, participante_id):
 def importar_participantes_excel(evento_id):
     """Import participants from Excel file to existing event"""
     from app.services.excel_import_service import ExcelImportService
-    import os
     from flask import current_app
 
     try:
@@ -1020,91 +970,20 @@ def importar_participantes_excel(evento_id):
         upload_folder = current_app.config.get('UPLOAD_FOLDER', 'uploads')
         filepath = excel_service.save_uploaded_file(excel_file, upload_folder)
 
-        # Parse Excel - extract only participants
-        participants_data = excel_service.extract_participants_only(filepath)
-
-        print(f"DEBUG - Found {len(participants_data)} participants in Excel")
-
-        # Filter participants with email
-        participants_with_email = [p for p in participants_data if p.get('email', '').strip()]
-        participants_without_email = len(participants_data) - len(participants_with_email)
-
-        if participants_without_email > 0:
-            flash(f'⚠️ {participants_without_email} participantes sem email foram ignorados', 'warning')
-
-        if not participants_with_email:
-            flash('Nenhum participante com email encontrado no ficheiro', 'error')
-            try:
-                os.remove(filepath)
-            except:
-                pass
-            return redirect(url_for('main.detalhe_evento', id=evento_id))
-
-        # Import participants
-        added = 0
-        updated = 0
-        skipped = 0
-
-        for participant_data in participants_with_email:
-            email = participant_data.get('email', '').strip()
-            nome = participant_data.get('nome', '').strip()
-
-            if not email:
-                continue
-
-            # Check if participant already exists
-            existing = Participant.query.filter_by(
-                evento_id=evento_id,
-                email=email
-            ).first()
-
-            if existing:
-                if existing.deleted_at:
-                    # Reactivate soft-deleted participant
-                    from datetime import datetime
-                    existing.nome = nome
-                    existing.telefone = participant_data.get('telefone', '')
-                    existing.empresa = participant_data.get('empresa', '')
-                    existing.observacoes = participant_data.get('observacoes', '')
-                    existing.deleted_at = None
-                    existing.updated_at = datetime.utcnow()
-                    updated += 1
-                else:
-                    # Skip - already exists and active
-                    skipped += 1
-                    continue
-            else:
-                # Create new participant
-                participante = Participant(
-                    evento_id=evento_id,
-                    nome=nome,
-                    email=email,
-                    telefone=participant_data.get('telefone', ''),
-                    empresa=participant_data.get('empresa', ''),
-                    observacoes=participant_data.get('observacoes', '')
-                )
-                db.session.add(participante)
-                added += 1
-
-        db.session.commit()
+        # Parse and import in the background (big files exceed the request timeout)
+        from app.services.import_job_service import ImportJobService
+        # Optional preview: the diff is shown and applied only after confirmation
+        dry_run = bool(request.form.get('pre_visualizar'))
+        job = ImportJobService().enqueue(
+            ImportJobService.TIPO_EXCEL_PARTICIPANTES, filepath, evento_id=evento.id, dry_run=dry_run
+        )
+        print(f"DEBUG - Import job queued: {job.id}")
 
-        # Clean up uploaded file
-        try:
-            os.remove(filepath)
-        except:
-            pass
-
-        # Show success message
-        message_parts = []
-        if added > 0:
-            message_parts.append(f'{added} novos participantes adicionados')
-        if updated > 0:
-            message_parts.append(f'{updated} participantes reativados')
-        if skipped > 0:
-            message_parts.append(f'{skipped} já existentes (ignorados)')
-
-        flash(f'✓ Importação concluída: {", ".join(message_parts)}', 'success')
-        return redirect(url_for('main.detalhe_evento', id=evento_id))
+        if dry_run:
+            flash('A comparar o ficheiro com os participantes do evento...', 'info')
+        else:
+            flash('A importar participantes em segundo plano...', 'info')
+        return redirect(url_for('main.detalhe_evento', id=evento_id, import_job=job.id))
 
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,39 @@
+"""
+Search API endpoints
+"""
+
+from flask import Blueprint, request, jsonify
+from app.services.search_service import SearchService
+
+bp = Blueprint('search', __name__, url_prefix='/api/search')
+
+
+@bp.route('/', methods=['GET'])
+def search():
+    """Full-text search of participants and events within an organization"""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'error': 'Parâmetro obrigatório: q'}), 400
+
+        # Never search across organizations: their participants are kept apart
+        organizacao_id = request.args.get('organizacao_id', type=int)
+        if organizacao_id is None:
+            return jsonify({'error': 'Parâmetro obrigatório: organizacao_id'}), 400
+
+        scope = request.args.get('tipo', 'all')
+        if scope not in ('all', 'participants', 'events'):
+            return jsonify({'error': 'tipo deve ser all, participants ou events'}), 400
+
+        results = SearchService().search(
+            query,
+            organizacao_id,
+            page=request.args.get('page', 1, type=int),
+            per_page=request.args.get('per_page', 20, type=int),
+            scope=scope
+        )
+
+        return jsonify({'query': query, **results}), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
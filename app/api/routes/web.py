@@ -18,7 +18,9 @@ def api_info():
             'events': '/api/events',
             'participants': '/api/participants',
             'users': '/api/users',
-            'certificates': '/api/certificates'
+            'certificates': '/api/certificates',
+            'search': '/api/search',
+            'imports': '/api/imports'
         }
     })
 
@@ -3,6 +3,8 @@ Application constants and configuration values
 Centralizes magic numbers and repeated values for better maintainability
 """
 
+import os
+import tempfile
 from reportlab.lib.units import cm
 
 # Certificate Layout Constants
@@ -98,3 +100,110 @@ class EmailConfig:
     SMTP_SERVER_DEFAULT = 'smtp.gmail.com'
     SMTP_PORT_DEFAULT = 587
     TIMEOUT_SECONDS = 30
+
+
+# Database Configuration
+class DatabaseConfig:
+    """Database engine profile defaults"""
+
+    # SQLite connection pragmas
+    SQLITE_BUSY_TIMEOUT_MS = 30000
+    SQLITE_CACHE_SIZE_KIB = 64 * 1024  # 64 MiB page cache per connection
+    SQLITE_MMAP_SIZE = 256 * 1024 * 1024  # 256 MiB memory-mapped I/O
+
+    # SQLite pools (readers never block each other under WAL)
+    SQLITE_WRITE_POOL_SIZE = 2
+    SQLITE_WRITE_MAX_OVERFLOW = 2
+    SQLITE_READ_POOL_SIZE = 8
+    SQLITE_READ_MAX_OVERFLOW = 8
+
+    # Server database (DATABASE_URL)
+    SERVER_POOL_SIZE = 5
+    SERVER_MAX_OVERFLOW = 10
+    SERVER_POOL_RECYCLE = 1800  # seconds
+
+
+# Background Import Jobs
+class ImportConfig:
+    """Background import job settings"""
+
+    # In-process worker threads (used when no Celery broker is configured)
+    WORKER_THREADS = 2
+
+    # Progress is saved every N parsed rows
+    PROGRESS_EVERY_ROWS = 500
+
+    # Uploads are stored by content hash and removed after this long
+    UPLOAD_CHUNK_BYTES = 1024 * 1024
+    UPLOAD_RETENTION_SECONDS = 24 * 3600
+
+    # Parsed-upload cache (per process)
+    PARSE_CACHE_MAX_ENTRIES = 32
+    PARSE_CACHE_MAX_ROWS = 250000  # Participants held across all entries
+    PARSE_CACHE_TTL_SECONDS = 15 * 60
+
+    # Dry-run previews can be confirmed for this long (the diff may go stale)
+    PREVIEW_TTL_SECONDS = 60 * 60
+
+    # Multi-event workbooks with at least this many extra sheets are parsed in
+    # a process pool ('spawn' is safe next to the web server's threads)
+    PARALLEL_SHEETS_MIN = 8
+    SHEET_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+    SHEET_PARSE_START_METHOD = 'spawn'
+
+
+class GoogleConfig:
+    """Google API settings"""
+
+    # OAuth token shared by every Google service (written by the web authorization)
+    TOKEN_FILE = 'token.json'
+
+    # Access tokens are refreshed this long before they expire
+    TOKEN_REFRESH_MARGIN_SECONDS = 5 * 60
+
+    # Responses fetched per responses().list() page (the API maximum)
+    FORM_RESPONSES_PAGE_SIZE = 5000
+
+    # Compiled form field mappers kept in memory (one per form revision)
+    FORM_MAPPER_CACHE_SIZE = 256
+
+    # Background sync of form responses (0 disables; FORM_SYNC_INTERVAL_SECONDS env var)
+    FORM_SYNC_INTERVAL_SECONDS = 5 * 60
+    FORM_SYNC_TICK_SECONDS = 15
+    FORM_SYNC_WORKERS = 4
+    # Up to this fraction of the wait is added at random to each event's next run
+    FORM_SYNC_JITTER = 0.2
+    # Failed events wait interval * 2^failures, capped here
+    FORM_SYNC_MAX_BACKOFF_SECONDS = 60 * 60
+    # Only the process holding this lock runs the syncs
+    FORM_SYNC_LOCK_FILE = os.path.join(tempfile.gettempdir(), 'gestorev2_form_sync.lock')
+
+    # Drive form catalog kept in memory per account, refreshed in the background
+    # after the TTL and reloaded in the request after the maximum staleness
+    FORM_CATALOG_TTL_SECONDS = 5 * 60
+    FORM_CATALOG_MAX_STALE_SECONDS = 60 * 60
+    FORM_CATALOG_MAX_FORMS = 2000
+    # Word prefixes longer than this are checked against the name, not indexed
+    FORM_CATALOG_PREFIX_LENGTH = 12
+    # files().list() page size (the API maximum)
+    DRIVE_PAGE_SIZE = 1000
+
+    # Requests per BatchHttpRequest (Google APIs accept up to 100 per batch)
+    BATCH_MAX_REQUESTS = 50
+
+    # Published per-user quotas (requests per minute) used to size the
+    # request executor's token buckets
+    API_QUOTAS_PER_MINUTE = {
+        'forms': {'read': 390, 'write': 150},
+        'sheets': {'read': 60, 'write': 60},
+        'drive': {'read': 12000, 'write': 12000},
+    }
+    API_DEFAULT_QUOTA_PER_MINUTE = 300
+    # Retries of 429/5xx/rate-limit errors, exponential backoff with full jitter
+    API_MAX_RETRIES = 5
+    API_BACKOFF_BASE_SECONDS = 1
+    API_BACKOFF_MAX_SECONDS = 32
+
+    # Google Sheets reads: rows per chunk and chunks per values.batchGet call
+    SHEET_CHUNK_ROWS = 2000
+    SHEET_CHUNKS_PER_REQUEST = 5
@@ -0,0 +1,128 @@
+"""
+Database engine profile
+
+SQLite (default): WAL journal, relaxed fsync, busy timeout, larger page cache
+and mmap I/O on every connection, with separate read and write pools.
+Server database (DATABASE_URL set): a single pooled engine sized from config.
+"""
+
+import os
+import sqlalchemy as sa
+from sqlalchemy import event
+from flask_sqlalchemy.session import Session
+from app.constants import DatabaseConfig
+
+# Bind key for the read-only SQLite pool
+READ_BIND_KEY = 'read'
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to the read pool
+
+    Once the session writes (flush or any non-SELECT statement) it sticks to the
+    write engine until the transaction ends, so reads always see own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is not None:
+            return bind
+
+        engines = self._db.engines
+        if READ_BIND_KEY in engines:
+            if self._flushing or not isinstance(clause, sa.Select):
+                self.info['wrote'] = True
+            elif not self.info.get('wrote'):
+                return engines[READ_BIND_KEY]
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def _reset_write_routing(session, transaction):
+    """Go back to the read pool once the outer transaction is over"""
+    if transaction.parent is None:
+        session.info.pop('wrote', None)
+
+
+def _env_int(name, default):
+    """Read an integer setting from the environment"""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def configure_database(app, sqlite_path):
+    """
+    Set SQLAlchemy URI, binds and engine options on the app config
+
+    Args:
+        app: Flask application
+        sqlite_path: SQLite file used when no DATABASE_URL is configured
+    """
+    database_url = os.environ.get('DATABASE_URL')
+
+    if database_url:
+        # Some providers still hand out the deprecated 'postgres://' scheme
+        if database_url.startswith('postgres://'):
+            database_url = database_url.replace('postgres://', 'postgresql://', 1)
+
+        app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            'pool_size': _env_int('DB_POOL_SIZE', DatabaseConfig.SERVER_POOL_SIZE),
+            'max_overflow': _env_int('DB_MAX_OVERFLOW', DatabaseConfig.SERVER_MAX_OVERFLOW),
+            'pool_recycle': _env_int('DB_POOL_RECYCLE', DatabaseConfig.SERVER_POOL_RECYCLE),
+            'pool_pre_ping': True,
+        }
+        return
+
+    uri = f'sqlite:///{sqlite_path}'
+    busy_timeout_s = _env_int('SQLITE_BUSY_TIMEOUT_MS', DatabaseConfig.SQLITE_BUSY_TIMEOUT_MS) / 1000
+
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': _env_int('SQLITE_WRITE_POOL_SIZE', DatabaseConfig.SQLITE_WRITE_POOL_SIZE),
+        'max_overflow': DatabaseConfig.SQLITE_WRITE_MAX_OVERFLOW,
+        'connect_args': {'timeout': busy_timeout_s, 'check_same_thread': False},
+    }
+    app.config['SQLALCHEMY_BINDS'] = {
+        READ_BIND_KEY: {
+            'url': uri,
+            'pool_size': _env_int('SQLITE_READ_POOL_SIZE', DatabaseConfig.SQLITE_READ_POOL_SIZE),
+            'max_overflow': DatabaseConfig.SQLITE_READ_MAX_OVERFLOW,
+            'connect_args': {'timeout': busy_timeout_s, 'check_same_thread': False},
+        }
+    }
+
+
+def register_engine_events(app, db):
+    """Apply the SQLite pragmas to every new connection of the app's engines"""
+    with app.app_context():
+        engines = db.engines
+
+    for bind_key, engine in engines.items():
+        if engine.dialect.name != 'sqlite' or engine.url.database in (None, '', ':memory:'):
+            continue
+        event.listen(engine, 'connect', _sqlite_pragmas(read_only=bind_key == READ_BIND_KEY))
+
+
+def _sqlite_pragmas(read_only):
+    """Build the connect listener for a SQLite pool"""
+    busy_timeout_ms = _env_int('SQLITE_BUSY_TIMEOUT_MS', DatabaseConfig.SQLITE_BUSY_TIMEOUT_MS)
+
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if not read_only:
+                # Persistent: only the writer needs to switch the file to WAL
+                cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute(f'PRAGMA busy_timeout={busy_timeout_ms}')
+            cursor.execute(f'PRAGMA cache_size=-{DatabaseConfig.SQLITE_CACHE_SIZE_KIB}')
+            cursor.execute(f'PRAGMA mmap_size={DatabaseConfig.SQLITE_MMAP_SIZE}')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            if read_only:
+                cursor.execute('PRAGMA query_only=ON')
+        finally:
+            cursor.close()
+
+    return on_connect
@@ -8,5 +8,8 @@ from app.models.event import Event
 from app.models.participant import Participant
 from app.models.certificate_template import CertificateTemplate
 from app.models.audit_log import AuditLog
+from app.models.import_job import ImportJob
+from app.models.form_template import FormTemplate
+from app.models.sheet_sync import SheetSync
 
-__all__ = ['User', 'Organization', 'Event', 'Participant', 'CertificateTemplate', 'AuditLog']
+__all__ = ['User', 'Organization', 'Event', 'Participant', 'CertificateTemplate', 'AuditLog', 'ImportJob', 'FormTemplate', 'SheetSync']
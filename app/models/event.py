@@ -47,6 +47,12 @@ class Event(db.Model):
     google_form_url = db.Column(db.String(500), nullable=True)
     google_sheet_id = db.Column(db.String(200), nullable=True)
     google_sheet_url = db.Column(db.String(500), nullable=True)
+    # Submission time (Forms API clock, UTC) of the newest response already
+    # synced; the next sync only asks the API for responses after it
+    google_last_response_at = db.Column(db.DateTime, nullable=True)
+    # Question ID or title -> participant field (None ignores the question),
+    # on top of the title matching of FormFieldMapper
+    google_form_mapping = db.Column(db.JSON, nullable=True)
 
     # Relationships
     participantes = db.relationship('Participant', back_populates='evento', cascade='all, delete-orphan', lazy='dynamic')
@@ -60,6 +66,15 @@ class Event(db.Model):
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     creator = db.relationship('User', backref='eventos_criados')
 
+    __table_args__ = (
+        # Organization listings: organizacao_id = ? AND deleted_at IS NULL ORDER BY data_inicio
+        db.Index('ix_events_organizacao_id_deleted_at_data_inicio', 'organizacao_id', 'deleted_at', 'data_inicio'),
+        # Partial index over active events only (listing and ordering by date)
+        db.Index('ix_events_active_data_inicio', 'data_inicio',
+                 sqlite_where=db.text('deleted_at IS NULL'),
+                 postgresql_where=db.text('deleted_at IS NULL')),
+    )
+
     def get_participant_count(self):
         """Get total number of participants"""
         return self.participantes.count()
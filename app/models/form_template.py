@@ -0,0 +1,30 @@
+"""
+Form Template model - Prebuilt Google Forms copied for new event forms
+"""
+
+from app import db
+from datetime import datetime
+
+
+class FormTemplate(db.Model):
+    """Registration form with every question already in place, one per organization and event type"""
+    __tablename__ = 'form_templates'
+
+    id = db.Column(db.Integer, primary_key=True)
+    organizacao_id = db.Column(db.Integer, db.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=True)
+    tipo_evento = db.Column(db.String(50), nullable=False)
+
+    # Google Form copied with Drive files.copy()
+    form_id = db.Column(db.String(200), nullable=False)
+    # Hash of the questions the template was built with; a template built
+    # with an older question layout is replaced
+    layout = db.Column(db.String(16), nullable=False)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_form_templates_organizacao_id_tipo_evento', 'organizacao_id', 'tipo_evento'),
+    )
+
+    def __repr__(self):
+        return f'<FormTemplate {self.organizacao_id}/{self.tipo_evento} {self.form_id}>'
@@ -0,0 +1,78 @@
+"""
+Import Job model for background spreadsheet imports
+"""
+
+from app import db
+from datetime import datetime
+
+
+class ImportJob(db.Model):
+    """Background import of an uploaded file or Google Sheet"""
+    __tablename__ = 'import_jobs'
+
+    DONE_STATUSES = ('concluido', 'erro', 'cancelado')
+
+    id = db.Column(db.String(32), primary_key=True)  # uuid4 hex
+
+    # Type: excel_evento, excel_participantes, sheet_participantes
+    tipo = db.Column(db.String(30), nullable=False)
+
+    # Status: pendente, a_processar, pre_visualizacao (dry run waiting for
+    # confirmation), concluido, erro, cancelado
+    status = db.Column(db.String(20), default='pendente', nullable=False, index=True)
+
+    # Target and source
+    evento_id = db.Column(db.Integer, db.ForeignKey('events.id', ondelete='SET NULL'), nullable=True, index=True)
+    organizacao_id = db.Column(db.Integer, db.ForeignKey('organizations.id'), nullable=True)
+    source = db.Column(db.String(500), nullable=False)  # Stored upload path or spreadsheet ID
+    params = db.Column(db.JSON, nullable=True)
+
+    # Progress
+    rows_parsed = db.Column(db.Integer, default=0, nullable=False)
+    rows_inserted = db.Column(db.Integer, default=0, nullable=False)
+    rows_updated = db.Column(db.Integer, default=0, nullable=False)
+    rows_skipped = db.Column(db.Integer, default=0, nullable=False)
+    rows_errored = db.Column(db.Integer, default=0, nullable=False)
+
+    # Outcome
+    result = db.Column(db.JSON, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+
+    # Diff computed by a dry run, applied as is when the import is confirmed
+    # (deferred: it can be large and status polling never needs it)
+    plan = db.deferred(db.Column(db.JSON, nullable=True))
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    @property
+    def done(self):
+        return self.status in self.DONE_STATUSES
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            'id': self.id,
+            'tipo': self.tipo,
+            'status': self.status,
+            'done': self.done,
+            'evento_id': self.evento_id,
+            'organizacao_id': self.organizacao_id,
+            'progress': {
+                'parsed': self.rows_parsed,
+                'inserted': self.rows_inserted,
+                'updated': self.rows_updated,
+                'skipped': self.rows_skipped,
+                'errored': self.rows_errored,
+            },
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def __repr__(self):
+        return f'<ImportJob {self.id} {self.tipo} {self.status}>'
@@ -42,6 +42,14 @@ class Participant(db.Model):
 
     __table_args__ = (
         db.UniqueConstraint('email', 'evento_id', name='_email_evento_uc'),
+        # Composite indexes for the soft-delete access patterns
+        db.Index('ix_participants_evento_id_deleted_at', 'evento_id', 'deleted_at'),
+        db.Index('ix_participants_evento_id_status', 'evento_id', 'status'),
+        db.Index('ix_participants_evento_id_certificado', 'evento_id', 'certificado_gerado', 'certificado_enviado'),
+        # Partial index over active participants only (global counts and listings)
+        db.Index('ix_participants_active_evento_id', 'evento_id',
+                 sqlite_where=db.text('deleted_at IS NULL'),
+                 postgresql_where=db.text('deleted_at IS NULL')),
     )
 
     def to_dict(self):
@@ -0,0 +1,39 @@
+"""
+Sheet Sync model - Google Sheet kept in step with the participants of an event
+"""
+
+from app import db
+from datetime import datetime
+
+
+class SheetSync(db.Model):
+    """Link between an event and the sheet its participants are mirrored to, with the last synced rows"""
+    __tablename__ = 'sheet_syncs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    evento_id = db.Column(db.Integer, db.ForeignKey('events.id', ondelete='CASCADE'), nullable=False, unique=True)
+    evento = db.relationship('Event', backref=db.backref('sheet_sync', uselist=False, cascade='all, delete-orphan'))
+
+    spreadsheet_id = db.Column(db.String(200), nullable=False)
+    # Numeric ID of the sheet (tab), which survives renames
+    sheet_id = db.Column(db.Integer, default=0, nullable=False)
+
+    # Rows as last written or read: {participant_id: [cell, ...]} in column order
+    snapshot = db.Column(db.JSON, nullable=True)
+    last_synced_at = db.Column(db.DateTime, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            'evento_id': self.evento_id,
+            'spreadsheet_id': self.spreadsheet_id,
+            'sheet_id': self.sheet_id,
+            'spreadsheet_url': f'https://docs.google.com/spreadsheets/d/{self.spreadsheet_id}/edit#gid={self.sheet_id}',
+            'rows': len(self.snapshot or {}),
+            'last_synced_at': self.last_synced_at.isoformat() if self.last_synced_at else None,
+        }
+
+    def __repr__(self):
+        return f'<SheetSync evento={self.evento_id} {self.spreadsheet_id}>'
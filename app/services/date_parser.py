@@ -0,0 +1,259 @@
+"""
+Date Parser - Memoized, vectorized date and duration parsing for imports
+"""
+
+import re
+import threading
+from collections import Counter
+from datetime import date, datetime, time
+from functools import lru_cache
+import pandas as pd
+
+# Formats tried in order (2-digit year first, then 4-digit)
+DATE_FORMATS = [
+    '%d/%m/%y',      # DD/MM/YY (e.g., 15/01/26)
+    '%d-%m-%y',      # DD-MM-YY
+    '%d/%m/%Y',      # DD/MM/YYYY
+    '%d-%m-%Y',      # DD-MM-YYYY
+    '%Y-%m-%d',      # YYYY-MM-DD
+    '%d/%m/%Y %H:%M',
+    '%d-%m-%Y %H:%M',
+    '%d/%m/%y %H:%M',
+    '%d-%m-%y %H:%M'
+]
+
+PORTUGUESE_MONTHS = {
+    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'marco': 3, 'abril': 4,
+    'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
+    'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
+}
+
+# "29 de dezembro de 2025", "12, 14, 19 e 21 de janeiro" (first day is used)
+PORTUGUESE_DATE = re.compile(
+    r'^(\d{1,2})(?:\s*(?:,|\be\b)\s*\d{1,2})*\s+de\s+([a-zç]+)(?:\s+de\s+(\d{4}|\d{2}))?$'
+)
+
+# "1h40", "2 h", "2 horas", "1h 30min"
+DURATION_HOURS = re.compile(r'^(\d+(?:[.,]\d+)?)\s*h(?:oras?|rs?)?\s*(?:(\d+)\s*(?:m|min|mins|minutos?)?)?$')
+# "01:30" (hh:mm)
+DURATION_CLOCK = re.compile(r'^(\d{1,2}):(\d{2})(?::\d{2})?$')
+
+# Labels used in the statistics for values that are not matched by a strptime format
+LABEL_NATIVE = 'datetime'
+LABEL_PORTUGUESE = 'pt_extenso'
+LABEL_EMPTY = 'vazio'
+LABEL_FAILED = 'falhou'
+
+DEFAULT_DURATION = 60
+
+
+class DateParser:
+    """
+    Parse import dates and durations with per-format statistics
+
+    Results are memoized per distinct string, so a column that repeats the
+    same few values is parsed once. Column parsing runs pd.to_datetime with
+    each explicit format in turn and only falls back to the per-value path
+    for what no format matched.
+    """
+
+    def __init__(self):
+        self._stats = Counter()
+        self._lock = threading.Lock()
+
+    def parse_date(self, value):
+        """
+        Parse a date from a cell value.
+        Returns None if the date cannot be parsed (never raises exception).
+        """
+        result, label = self._parse_date_value(value)
+        self._count(label)
+        return result
+
+    def parse_date_column(self, values) -> list:
+        """
+        Parse a column of dates
+
+        Args:
+            values: Sequence or Series of cell values
+
+        Returns:
+            list of datetime/None, same length and order as values
+        """
+        results = []
+        labels = Counter()
+        texts = {}
+
+        for value in values:
+            if isinstance(value, datetime):
+                results.append(value)
+                labels[LABEL_NATIVE] += 1
+            elif isinstance(value, date):
+                results.append(datetime(value.year, value.month, value.day))
+                labels[LABEL_NATIVE] += 1
+            elif _is_missing(value):
+                results.append(None)
+                labels[LABEL_EMPTY] += 1
+            else:
+                value_str = str(value).strip()
+                if not value_str or value_str.lower() in ('nan', 'none'):
+                    results.append(None)
+                    labels[LABEL_EMPTY] += 1
+                else:
+                    # Placeholder, filled once the distinct strings are parsed
+                    results.append(value_str)
+                    texts[value_str] = texts.get(value_str, 0) + 1
+
+        parsed = {}
+        pending = pd.Series(list(texts), dtype=object)
+        for fmt in DATE_FORMATS:
+            if pending.empty:
+                break
+            stamps = pd.to_datetime(pending, format=fmt, errors='coerce')
+            hit = stamps.notna().to_numpy()
+            for value_str, stamp in zip(pending[hit], stamps[hit]):
+                parsed[value_str] = stamp.to_pydatetime()
+                labels[fmt] += texts[value_str]
+            pending = pending[~hit]
+
+        # Leftovers: Portuguese dates and anything pandas did not take
+        year = datetime.now().year
+        for value_str in pending:
+            parsed[value_str], label = _parse_date_text(value_str, year)
+            labels[label] += texts[value_str]
+
+        with self._lock:
+            self._stats.update(labels)
+
+        return [parsed[item] if isinstance(item, str) else item for item in results]
+
+    def parse_duration(self, value) -> int:
+        """Parse a duration in minutes (60 if it cannot be parsed)"""
+        if _is_missing(value):
+            return DEFAULT_DURATION
+
+        if isinstance(value, time):
+            return value.hour * 60 + value.minute
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return int(value)
+
+        return _parse_duration_text(str(value).strip().lower())
+
+    def parse_duration_column(self, values) -> list:
+        """Parse a column of durations, each distinct value once"""
+        series = pd.Series(values, dtype=object)
+        parsed = {}
+        results = []
+        for value in series:
+            key = value if isinstance(value, str) else repr(value)
+            if key not in parsed:
+                parsed[key] = self.parse_duration(value)
+            results.append(parsed[key])
+        return results
+
+    def stats(self) -> dict:
+        """Hits per format since start (or last reset), plus memo cache usage"""
+        with self._lock:
+            formats = dict(self._stats.most_common())
+        info = _parse_date_text.cache_info()
+        return {
+            'formats': formats,
+            'memo': {'hits': info.hits, 'misses': info.misses, 'size': info.currsize},
+        }
+
+    def merge_stats(self, formats: dict):
+        """Add hits counted elsewhere (e.g. in a worker process)"""
+        with self._lock:
+            self._stats.update(formats)
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def _parse_date_value(self, value):
+        """(datetime or None, format label) for one cell value"""
+        if _is_missing(value):
+            return None, LABEL_EMPTY
+
+        if isinstance(value, datetime):
+            return value, LABEL_NATIVE
+
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day), LABEL_NATIVE
+
+        value_str = str(value).strip()
+        if not value_str or value_str.lower() in ('nan', 'none'):
+            return None, LABEL_EMPTY
+
+        return _parse_date_text(value_str, datetime.now().year)
+
+    def _count(self, label):
+        with self._lock:
+            self._stats[label] += 1
+
+
+def _is_missing(value):
+    """None, NaN or NaT"""
+    try:
+        return value is None or bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(value_str, current_year):
+    """
+    Memoized parse of a stripped date string
+
+    current_year is part of the key so dates without a year stay correct
+    across New Year in long-running processes.
+    """
+    match = PORTUGUESE_DATE.match(value_str.lower())
+    if match:
+        day, month_name, year = match.groups()
+        month = PORTUGUESE_MONTHS.get(month_name)
+        if month:
+            try:
+                # No year provided: use current year
+                # (don't auto-advance to next year as this causes confusion)
+                if not year:
+                    year = current_year
+                elif len(year) == 2:
+                    year = 2000 + int(year)
+                return datetime(int(year), month, int(day)), LABEL_PORTUGUESE
+            except ValueError:
+                pass
+
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value_str, fmt), fmt
+        except ValueError:
+            continue
+
+    print(f"DEBUG - Could not parse date: '{value_str}' - ignoring")
+    return None, LABEL_FAILED
+
+
+@lru_cache(maxsize=1024)
+def _parse_duration_text(value_str):
+    """Memoized parse of a lowercased duration string, in minutes"""
+    match = DURATION_HOURS.match(value_str)
+    if match:
+        hours, minutes = match.groups()
+        return int(float(hours.replace(',', '.')) * 60) + (int(minutes) if minutes else 0)
+
+    match = DURATION_CLOCK.match(value_str)
+    if match:
+        return int(match.group(1)) * 60 + int(match.group(2))
+
+    # Try to extract number
+    numeric = ''.join(c for c in value_str if c.isdigit() or c == '.')
+    try:
+        return int(float(numeric)) if numeric else DEFAULT_DURATION
+    except ValueError:
+        return DEFAULT_DURATION
+
+
+# Shared by every importer in the process
+date_parser = DateParser()
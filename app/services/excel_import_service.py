@@ -1,25 +1,104 @@
 """
-Excel Import Service - Import events and participants from Excel files
+Excel Import Service - Import events and participants from Excel and CSV files
 """
 
+import codecs
+import csv
+import hashlib
+import io
+import multiprocessing
+import re
+import tempfile
+import threading
+import time
+import numpy as np
 import pandas as pd
-from datetime import datetime
+import sqlalchemy as sa
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from openpyxl import load_workbook
 from werkzeug.datastructures import FileStorage
 import os
+from app import db
+from app.constants import ImportConfig
+from app.models import Event, ImportJob
+from .date_parser import date_parser
+from .parse_cache import parse_cache
+from .participant_upsert_service import ParticipantUpsertService
+
+# Process pool for multi-event workbooks, created on first use
+_sheet_pool = None
+_sheet_pool_lock = threading.Lock()
+
+
+def _get_sheet_pool():
+    global _sheet_pool
+    with _sheet_pool_lock:
+        if _sheet_pool is None:
+            _sheet_pool = ProcessPoolExecutor(
+                max_workers=ImportConfig.SHEET_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context(ImportConfig.SHEET_PARSE_START_METHOD)
+            )
+        return _sheet_pool
+
+
+def _reset_sheet_pool():
+    """Drop a broken pool so the next workbook starts a fresh one"""
+    global _sheet_pool
+    with _sheet_pool_lock:
+        if _sheet_pool is not None:
+            _sheet_pool.shutdown(wait=False, cancel_futures=True)
+            _sheet_pool = None
+
+
+def _parse_sheets(file_path, indexes):
+    """Pool entry point: parse some sheets of a multi-event workbook"""
+    # Worker processes run one task at a time, so the counters hold this task only
+    date_parser.reset_stats()
+    events = ExcelImportService()._parse_sheet_indexes(file_path, indexes)
+    return events, date_parser.stats()['formats']
 
 
 class ExcelImportService:
     """Service to import events and participants from Excel files"""
 
+    # Map common column names (header text contains any alias)
+    PARTICIPANT_COLUMN_ALIASES = {
+        'nome': ['nome', 'name', 'participante', 'participant'],
+        'email': ['email', 'e-mail', 'mail'],
+        'telefone': ['telefone', 'phone', 'telemóvel', 'telemovel', 'contacto'],
+        'empresa': ['empresa', 'company', 'organization', 'organização'],
+        'observacoes': ['observações', 'observacoes', 'notes', 'notas', 'comments']
+    }
+
+    # Keys that mark event data in columns 2-3 (hybrid layout)
+    EVENT_KEYWORDS = ['nome', 'data', 'duração', 'duracao', 'local', 'formador']
+
+    # Rows read while looking for the participant header before a sheet is
+    # treated as a plain table (keeps streaming memory bounded)
+    HEADER_SCAN_ROWS = 200
+
+    # Formats read with the streaming openpyxl parser (others go through pandas)
+    STREAMING_EXTENSIONS = ('.xlsx', '.xlsm')
+
+    # Delimited text formats (a single sheet, streamed with the csv module)
+    CSV_EXTENSIONS = ('.csv', '.tsv')
+    CSV_DELIMITERS = ',;\t|'
+    CSV_SNIFF_BYTES = 64 * 1024
+    CSV_FALLBACK_ENCODINGS = ['cp1252', 'iso8859_15', 'mac_roman', 'cp850', 'utf_16_le', 'utf_16_be']
+
+    # Stored uploads are named after their SHA-256
+    UPLOAD_NAME_PATTERN = re.compile(r'^upload_([0-9a-f]{64})\.')
+
     def __init__(self):
-        self.supported_extensions = ['.xlsx', '.xls']
+        self.supported_extensions = ['.xlsx', '.xls', '.csv', '.tsv']
 
     def validate_file(self, file: FileStorage) -> tuple[bool, str]:
-        """Validate uploaded Excel file"""
+        """Validate uploaded Excel or CSV file"""
         if not file:
             return False, "Nenhum ficheiro foi enviado"
 
-        filename = file.filename
+        filename = file.filename.lower()
         if not any(filename.endswith(ext) for ext in self.supported_extensions):
             return False, f"Formato inválido. Use {', '.join(self.supported_extensions)}"
 
@@ -39,78 +118,453 @@ class ExcelImportService:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Ficheiro não encontrado: {file_path}")
 
-            # Read all sheets
-            excel_file = pd.ExcelFile(file_path)
-            sheets = excel_file.sheet_names
-            print(f"DEBUG - Found {len(sheets)} sheet(s): {sheets}")
+            # Re-uploads of the same file skip parsing
+            cache_key = (self._content_hash(file_path), 'evento')
+            cached = parse_cache.get(cache_key)
+            if cached is not None:
+                print(f"DEBUG - Parse cache hit for {file_path}")
+                return self._copy_parse_result(cached)
 
-            # Check if this is a multi-event file (each sheet is one complete event)
-            # or the old format (separate sheets for info and participants)
-            if len(sheets) >= 2:
-                # Try to detect format by checking first sheet
-                first_sheet = pd.read_excel(excel_file, sheet_name=0, header=None)
+            result = self._parse_file(file_path)
 
-                # If first sheet has participant data (look for "Nome" + "Email" in same row)
-                # then it's multi-event format (each sheet = one event)
-                has_participant_section = self._find_participant_section(first_sheet) is not None
-
-                if has_participant_section:
-                    # Multi-event format: each sheet is one complete event
-                    return self._parse_multi_event_format(excel_file)
-                else:
-                    # Two sheet format (old): sheet 1 = event, sheet 2 = participants
-                    return self._parse_two_sheet_format(excel_file)
-            else:
-                # Single sheet format
-                return self._parse_single_sheet_format(excel_file)
+            events = result['events'] if 'events' in result else [result]
+            parse_cache.set(cache_key, result, rows=sum(len(item['participants']) for item in events))
+            return self._copy_parse_result(result)
 
         except Exception as e:
             raise Exception(f"Erro ao processar Excel: {str(e)}")
 
-    def _parse_multi_event_format(self, excel_file: pd.ExcelFile) -> dict:
-        """Parse Excel with multiple events - each sheet is one complete event"""
-        events = []
+    def _parse_file(self, file_path: str) -> dict:
+        """Parse a workbook or CSV file according to its extension"""
+        if file_path.lower().endswith(self.CSV_EXTENSIONS):
+            # A CSV file is a single sheet
+            result = self._parse_event_sheet(self._scan_rows(self._iter_csv_rows(file_path)), multi_event=False)
+        elif not file_path.lower().endswith(self.STREAMING_EXTENSIONS):
+            result = self._parse_excel_with_pandas(file_path)
+        else:
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                result = self._parse_workbook(workbook, file_path)
+            finally:
+                workbook.close()
 
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+        return self._parse_event_dates(result)
 
-            # Find where participant list starts
-            participant_start_row = self._find_participant_section(df)
+    def _parse_event_dates(self, result: dict) -> dict:
+        """
+        Turn the raw date and duration cells of every event into values
 
-            if participant_start_row is not None:
-                # Event data is above participant section
-                # BUT also check first 3 rows of participant section for event data in columns 2-3
-                event_df = df.iloc[:participant_start_row]
+        Sheets are extracted with the cells as found; the dates of all events
+        of the file then go through DateParser.parse_date_column in one call
+        (each format tried on the whole column) and the durations through
+        parse_duration_column.
+        """
+        events = [item['event'] for item in (result['events'] if 'events' in result else [result])]
+
+        cells = [(event, field) for event in events for field in ('data', 'data_inicio', 'data_fim')
+                 if event[field] is not None]
+        dates = date_parser.parse_date_column([event[field] for event, field in cells])
+        for (event, field), value in zip(cells, dates):
+            event[field] = value
+
+        durations = date_parser.parse_duration_column([event['duracao'] for event in events])
+        for event, value in zip(events, durations):
+            event['duracao'] = value
+
+        return result
+
+    def _copy_parse_result(self, result: dict) -> dict:
+        """Copy of a (cached) parse result that callers may modify freely"""
+        def copy_event(item):
+            return {'event': dict(item['event']), 'participants': [dict(p) for p in item['participants']]}
+
+        if 'events' in result:
+            return {'events': [copy_event(item) for item in result['events']]}
+        return copy_event(result)
+
+    def _parse_workbook(self, workbook, file_path: str) -> dict:
+        """Parse a read-only workbook in a single pass over each sheet"""
+        worksheets = workbook.worksheets
+        print(f"DEBUG - Found {len(worksheets)} sheet(s): {workbook.sheetnames}")
+
+        first_scan = self._scan_rows(self._iter_sheet_rows(worksheets[0]))
+
+        if len(worksheets) >= 2:
+            if first_scan[1] is not None:
+                # Multi-event format: each sheet is one complete event.
+                # Other sheets go to the pool while the first one is parsed here
+                futures = self._submit_sheets(file_path, range(1, len(worksheets)))
+                events = [self._parse_event_sheet(first_scan, multi_event=True)]
+
+                others = self._collect_sheets(futures) if futures else None
+                if others is None:
+                    others = [
+                        self._parse_event_sheet(self._scan_rows(self._iter_sheet_rows(worksheet)), multi_event=True)
+                        for worksheet in worksheets[1:]
+                    ]
+                return {'events': events + others}
+
+            # Two sheet format (old): sheet 1 = event, sheet 2 = participants
+            head, _, _, rest = first_scan
+            return {
+                'event': self._extract_event_rows(chain(head, rest)),
+                'participants': list(self._iter_participant_table(self._iter_sheet_rows(worksheets[1])))
+            }
 
-                # For format where event info is in columns 2-3 of first rows
-                # Include first 3 rows to extract event data from right columns
-                event_df_extended = df.iloc[:min(participant_start_row + 3, len(df))]
+        # Single sheet format
+        return self._parse_event_sheet(first_scan, multi_event=False)
 
-                # Participant data starts after
-                participants_df = df.iloc[participant_start_row:]
-            else:
+    def _parse_event_sheet(self, scan, multi_event: bool) -> dict:
+        """
+        Build event and participants from a scanned sheet
+
+        Args:
+            scan: Result of _scan_rows
+            multi_event: True for sheets of a multi-event workbook, False for a single sheet
+        """
+        head, header, after, rest = scan
+
+        if header is None:
+            if multi_event:
                 # No participants found, all data is event info
-                event_df_extended = df
-                participants_df = pd.DataFrame()
+                return {'event': self._extract_event_rows(chain(head, rest)), 'participants': []}
+            # Assume all is participant data if no event section found
+            return {
+                'event': self._extract_event_rows([]),
+                'participants': list(self._iter_participant_table(chain(head, rest)))
+            }
 
-            event_data = self._extract_event_data(event_df_extended)
-            participants_data = self._extract_participants_data(participants_df)
+        top = head + [header] + after
+        if multi_event:
+            # Event data is above the participant section, but also check the
+            # first rows of the section for event data in columns 2-3
+            event_rows = top[:len(head) + 3]
+        elif len(head) <= 1 and self._is_hybrid_layout(top[:3]):
+            # Hybrid format: event in columns 2-3, participants in columns 0-1
+            event_rows = top[:5]
+        else:
+            event_rows = head
 
-            events.append({
-                'event': event_data,
-                'participants': participants_data
-            })
+        return {
+            'event': self._extract_event_rows(event_rows),
+            'participants': list(self._iter_participant_table(chain([header], after, rest)))
+        }
+
+    def _scan_rows(self, rows):
+        """
+        Read a sheet's rows up to its participant header
+
+        Returns:
+            (head, header, after, rest): rows before the header, the header row
+            (None if not found within HEADER_SCAN_ROWS), up to 4 rows after it
+            and the iterator over the remaining rows
+        """
+        head = []
+
+        for row in rows:
+            if self._is_participant_header(row):
+                return head, row, list(islice(rows, 4)), rows
+            head.append(row)
+            if len(head) >= self.HEADER_SCAN_ROWS:
+                break
+
+        return head, None, [], rows
+
+    def _iter_sheet_rows(self, worksheet):
+        """Yield row value tuples, with empty strings normalized to None"""
+        # Without a stored dimension read-only sheets cannot be sized up front
+        if worksheet.max_column is None:
+            worksheet.reset_dimensions()
+        for row in worksheet.iter_rows(values_only=True):
+            if '' in row:
+                row = tuple(None if value == '' else value for value in row)
+            yield row
+
+    def _iter_csv_rows(self, file_path: str):
+        """
+        Yield rows of a CSV/TSV file as tuples, with empty strings normalized to None
+
+        Encoding and delimiter are detected from the first CSV_SNIFF_BYTES; the
+        rest of the file is decoded and split in buffered chunks as it is read.
+        """
+        with open(file_path, 'rb') as raw:
+            sample = raw.read(self.CSV_SNIFF_BYTES)
+            raw.seek(0)
+
+            encoding = self._detect_encoding(sample)
+            text_sample = sample.decode(encoding, errors='ignore')
+            delimiter = self._detect_delimiter(text_sample, file_path)
+            print(f"DEBUG - CSV encoding: {encoding}, delimiter: {delimiter!r}")
+
+            with io.TextIOWrapper(raw, encoding=encoding, errors='replace', newline='') as text:
+                for row in csv.reader(text, delimiter=delimiter):
+                    yield tuple(value.strip() or None for value in row)
+
+    def _detect_encoding(self, sample: bytes) -> str:
+        """Guess the text encoding of a CSV file from its first bytes"""
+        if sample.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        if sample.startswith((b'\xff\xfe', b'\xfe\xff')):
+            return 'utf-16'
+
+        try:
+            # The sample may end in the middle of a multi-byte character
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=len(sample) < self.CSV_SNIFF_BYTES)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+
+        try:
+            from charset_normalizer import from_bytes
+            # Only western code pages: short samples of Portuguese text are
+            # otherwise easily mistaken for central European ones
+            match = from_bytes(sample, cp_isolation=self.CSV_FALLBACK_ENCODINGS).best()
+            if match is not None:
+                return match.encoding
+        except ImportError:
+            pass
+
+        # Spreadsheet exports on Portuguese Windows machines
+        return 'cp1252'
+
+    def _detect_delimiter(self, text_sample: str, file_path: str) -> str:
+        """Guess the CSV delimiter (',', ';', tab or '|')"""
+        if file_path.lower().endswith('.tsv'):
+            return '\t'
+
+        # Sniff on complete lines only
+        lines = text_sample.splitlines()[:50]
+        try:
+            return csv.Sniffer().sniff('\n'.join(lines), delimiters=self.CSV_DELIMITERS).delimiter
+        except csv.Error:
+            first_line = next((line for line in lines if line.strip()), '')
+            counts = {delimiter: first_line.count(delimiter) for delimiter in self.CSV_DELIMITERS}
+            best = max(counts, key=counts.get)
+            return best if counts[best] else ','
+
+    def _is_hybrid_layout(self, rows) -> bool:
+        """Check if the first rows carry event data in columns 2-3"""
+        for row in rows:
+            key2 = self._cell(row, 2)
+            key2 = str(key2).strip().lower() if pd.notna(key2) else ''
+            if len(row) >= 4 and any(keyword in key2 for keyword in self.EVENT_KEYWORDS):
+                return True
+        return False
+
+    def _iter_participant_table(self, rows):
+        """
+        Lazily extract participants from a row stream (header + data rows)
+
+        Same rules as _extract_participants_data: empty rows are skipped, the
+        header is the first row with at least 2 filled cells and rows without
+        a name are ignored.
+        """
+        pending = []
+        positions = None
+
+        for row in rows:
+            # value == value is False only for NaN (cheaper than pd.notna per cell)
+            filled = sum(1 for value in row if value is not None and value == value)
+            if not filled:
+                continue
+
+            if positions is None:
+                if filled < 2 and len(pending) < self.HEADER_SCAN_ROWS:
+                    pending.append(row)
+                    continue
+                if filled < 2:
+                    # No proper header in sight: first row is the header
+                    positions = self._map_participant_columns(pending[0])
+                    for data_row in chain(pending[1:], [row]):
+                        participant = self._participant_from_row(data_row, positions)
+                        if participant:
+                            yield participant
+                else:
+                    positions = self._map_participant_columns(row)
+                pending = []
+                continue
+
+            participant = self._participant_from_row(row, positions)
+            if participant:
+                yield participant
+
+        if positions is None and pending:
+            positions = self._map_participant_columns(pending[0])
+            for data_row in pending[1:]:
+                participant = self._participant_from_row(data_row, positions)
+                if participant:
+                    yield participant
+
+    def _participant_from_row(self, row, positions: dict) -> dict:
+        """Build a participant record from one data row (None if it has no name)"""
+        if 'nome' in positions:
+            nome = self._cell_text(row, positions['nome'])
+        else:
+            # Try first non-empty column as name
+            nome = next((text for text in (self._cell_text(row, pos) for pos in range(len(row))) if text), None)
+
+        if not nome:
+            return None
+
+        participant = {'nome': nome}
+        for field, pos in positions.items():
+            if field == 'nome':
+                continue
+            value = self._cell_text(row, pos)
+            if value is not None:
+                participant[field] = value
+
+        return participant
+
+    def _cell(self, row, pos):
+        """Cell value by position, None past the end of a short row"""
+        return row[pos] if pos < len(row) else None
+
+    def _cell_text(self, row, pos):
+        """Stripped text of a cell, None if the cell is empty"""
+        if pos >= len(row):
+            return None
+        value = row[pos]
+        if value is None or value != value:  # Empty or NaN
+            return None
+        return value.strip() if isinstance(value, str) else str(value).strip()
+
+    def _parse_excel_with_pandas(self, file_path: str) -> dict:
+        """Parse formats openpyxl cannot stream (.xls) with pandas"""
+        # Read all sheets
+        excel_file = pd.ExcelFile(file_path)
+        sheets = excel_file.sheet_names
+        print(f"DEBUG - Found {len(sheets)} sheet(s): {sheets}")
+
+        first_sheet = pd.read_excel(excel_file, sheet_name=0, header=None)
+
+        # Check if this is a multi-event file (each sheet is one complete event)
+        # or the old format (separate sheets for info and participants)
+        if len(sheets) >= 2:
+            # If first sheet has participant data (look for "Nome" + "Email" in same row)
+            # then it's multi-event format (each sheet = one event)
+            has_participant_section = self._find_participant_section(first_sheet) is not None
+
+            if has_participant_section:
+                # Multi-event format: each sheet is one complete event
+                return self._parse_multi_event_format(excel_file, first_sheet)
+            else:
+                # Two sheet format (old): sheet 1 = event, sheet 2 = participants
+                return self._parse_two_sheet_format(excel_file, first_sheet)
+        else:
+            # Single sheet format
+            return self._parse_single_sheet_format(first_sheet)
+
+    def _parse_multi_event_format(self, excel_file: pd.ExcelFile, first_sheet: pd.DataFrame) -> dict:
+        """Parse Excel with multiple events - each sheet is one complete event"""
+        sheet_count = len(excel_file.sheet_names)
+        futures = None
+        if isinstance(excel_file.io, str):
+            futures = self._submit_sheets(excel_file.io, range(1, sheet_count))
+
+        events = [self._parse_event_frame(first_sheet)]
+
+        others = self._collect_sheets(futures) if futures else None
+        if others is None:
+            others = [
+                self._parse_event_frame(pd.read_excel(excel_file, sheet_name=index, header=None))
+                for index in range(1, sheet_count)
+            ]
 
         # Return all events
-        return {'events': events}
+        return {'events': events + others}
+
+    def _parse_event_frame(self, df: pd.DataFrame) -> dict:
+        """Event and participants of one sheet of a multi-event workbook"""
+        # Find where participant list starts
+        participant_start_row = self._find_participant_section(df)
+
+        if participant_start_row is not None:
+            # Event data is above participant section
+            # BUT also check first 3 rows of participant section for event data in columns 2-3
+            # (for format where event info is in columns 2-3 of first rows)
+            event_df_extended = df.iloc[:min(participant_start_row + 3, len(df))]
+
+            # Participant data starts after
+            participants_df = df.iloc[participant_start_row:]
+        else:
+            # No participants found, all data is event info
+            event_df_extended = df
+            participants_df = pd.DataFrame()
+
+        return {
+            'event': self._extract_event_data(event_df_extended),
+            'participants': self._extract_participants_data(participants_df)
+        }
+
+    def _submit_sheets(self, file_path: str, indexes) -> list:
+        """
+        Hand sheets of a multi-event workbook to the process pool
+
+        Returns:
+            list of futures in sheet order, or None when the sheets should be
+            parsed in this process (few sheets, single worker, or inside a
+            daemonic worker such as Celery's prefork pool)
+        """
+        indexes = list(indexes)
+        workers = ImportConfig.SHEET_PARSE_WORKERS
+        if len(indexes) < ImportConfig.PARALLEL_SHEETS_MIN or workers < 2 \
+                or multiprocessing.current_process().daemon:
+            return None
+
+        # One run of consecutive sheets per worker: each task opens the
+        # workbook (and reads its shared strings) once
+        size = -(-len(indexes) // workers)
+        try:
+            pool = _get_sheet_pool()
+            return [pool.submit(_parse_sheets, file_path, indexes[start:start + size])
+                    for start in range(0, len(indexes), size)]
+        except Exception as e:
+            print(f"DEBUG - Parallel sheet parsing unavailable ({e}), parsing sheets sequentially")
+            _reset_sheet_pool()
+            return None
+
+    def _collect_sheets(self, futures) -> list:
+        """Events parsed by _submit_sheets in sheet order (None if a worker failed)"""
+        events = []
+        formats = []
+        try:
+            for future in futures:
+                chunk_events, chunk_formats = future.result()
+                events.extend(chunk_events)
+                formats.append(chunk_formats)
+        except Exception as e:
+            print(f"DEBUG - Parallel sheet parsing failed ({e}), parsing sheets sequentially")
+            _reset_sheet_pool()
+            return None
 
-    def _parse_two_sheet_format(self, excel_file: pd.ExcelFile) -> dict:
+        for chunk_formats in formats:
+            date_parser.merge_stats(chunk_formats)
+        return events
+
+    def _parse_sheet_indexes(self, file_path: str, indexes) -> list:
+        """Parse the given sheets of a multi-event workbook (run in pool workers)"""
+        if file_path.lower().endswith(self.STREAMING_EXTENSIONS):
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                return [
+                    self._parse_event_sheet(self._scan_rows(self._iter_sheet_rows(workbook.worksheets[index])),
+                                            multi_event=True)
+                    for index in indexes
+                ]
+            finally:
+                workbook.close()
+
+        excel_file = pd.ExcelFile(file_path)
+        return [self._parse_event_frame(pd.read_excel(excel_file, sheet_name=index, header=None))
+                for index in indexes]
+
+    def _parse_two_sheet_format(self, excel_file: pd.ExcelFile, event_df: pd.DataFrame) -> dict:
         """Parse Excel with separate sheets for event and participants"""
-        # Read first sheet for event info (no header, it's key-value pairs)
-        event_df = pd.read_excel(excel_file, sheet_name=0, header=None)
+        # First sheet holds event info (no header, it's key-value pairs)
 
-        # Read second sheet for participants
-        participants_df = pd.read_excel(excel_file, sheet_name=1)
+        # Read second sheet for participants (the header row is found while extracting)
+        participants_df = pd.read_excel(excel_file, sheet_name=1, header=None)
 
         # Extract event data (assume first row or key-value pairs)
         event_data = self._extract_event_data(event_df)
@@ -123,10 +577,8 @@ class ExcelImportService:
             'participants': participants_data
         }
 
-    def _parse_single_sheet_format(self, excel_file: pd.ExcelFile) -> dict:
+    def _parse_single_sheet_format(self, df: pd.DataFrame) -> dict:
         """Parse Excel with event info at top and participants below"""
-        df = pd.read_excel(excel_file, sheet_name=0, header=None)
-
         # Try to find where participant list starts
         participant_start_row = self._find_participant_section(df)
 
@@ -136,17 +588,9 @@ class ExcelImportService:
             # Check if there's event data in columns 2-3 of first few rows
             if len(df.columns) >= 4:
                 # Look at first 3 rows for event data in columns 2-3
-                event_df_extended = df.iloc[:min(3, len(df))]
-                has_event_data_in_right_cols = False
-
-                for _, row in event_df_extended.iterrows():
-                    key2 = str(row.iloc[2]).strip().lower() if pd.notna(row.iloc[2]) else ''
-                    keywords = ['nome', 'data', 'duração', 'duracao', 'local', 'formador']
-                    if any(keyword in key2 for keyword in keywords):
-                        has_event_data_in_right_cols = True
-                        break
+                first_rows = df.iloc[:min(3, len(df))].itertuples(index=False, name=None)
 
-                if has_event_data_in_right_cols:
+                if self._is_hybrid_layout(first_rows):
                     # Hybrid format: extract event from columns 2-3, participants from columns 0-1
                     event_df = df.iloc[:min(5, len(df))]  # Take first 5 rows for event data extraction
                     participants_df = df.iloc[participant_start_row:]
@@ -180,24 +624,36 @@ class ExcelImportService:
         # Look for rows with multiple common column headers in the same row
         # This indicates a table header, not just a single "Nome" field
 
-        for idx, row in df.iterrows():
-            # Count how many participant-related headers are in this row
-            row_lower = [str(cell).lower().strip() for cell in row if pd.notna(cell)]
+        for idx, row in enumerate(df.itertuples(index=False, name=None)):
+            if self._is_participant_header(row):
+                return df.index[idx]
 
-            # Check if this looks like a header row (has multiple expected columns)
-            has_nome = any('nome' in cell or 'name' in cell for cell in row_lower)
-            has_email = any('email' in cell or 'e-mail' in cell or 'mail' in cell for cell in row_lower)
-            has_telefone = any('telefone' in cell or 'phone' in cell or 'tel' in cell for cell in row_lower)
+        return None
 
-            # If we have at least 2 of these common headers in same row, it's probably the participant section
-            header_count = sum([has_nome, has_email, has_telefone])
-            if header_count >= 2:
-                return idx
+    def _is_participant_header(self, row) -> bool:
+        """Check if a row looks like the participant table header"""
+        # Count how many participant-related headers are in this row
+        row_lower = [str(cell).lower().strip() for cell in row if pd.notna(cell)]
 
-        return None
+        # Check if this looks like a header row (has multiple expected columns)
+        has_nome = any('nome' in cell or 'name' in cell for cell in row_lower)
+        has_email = any('email' in cell or 'e-mail' in cell or 'mail' in cell for cell in row_lower)
+        has_telefone = any('telefone' in cell or 'phone' in cell or 'tel' in cell for cell in row_lower)
+
+        # If we have at least 2 of these common headers in same row, it's probably the participant section
+        header_count = sum([has_nome, has_email, has_telefone])
+        return header_count >= 2
 
     def _extract_event_data(self, df: pd.DataFrame) -> dict:
         """Extract event data from dataframe"""
+        return self._extract_event_rows(df.itertuples(index=False, name=None))
+
+    def _extract_event_rows(self, rows) -> dict:
+        """
+        Extract event data from key-value rows (tuples of cell values)
+
+        Dates and duration are left as the raw cell values (see _parse_event_dates)
+        """
         event_data = {
             'nome': '',
             'data': None,
@@ -209,55 +665,54 @@ class ExcelImportService:
             'local': ''
         }
 
-        if df.empty:
-            return event_data
-
         # Try key-value format in columns 0-1 OR 2-3
-        if len(df.columns) >= 2:
-            for _, row in df.iterrows():
-                # Try standard format (columns 0-1)
-                key = str(row.iloc[0]).strip().lower() if pd.notna(row.iloc[0]) else ''
-                value = row.iloc[1] if pd.notna(row.iloc[1]) else ''
-
-                # Also try alternative format (columns 2-3) for formats where event data is in right columns
-                if len(df.columns) >= 4:
-                    key2 = str(row.iloc[2]).strip().lower() if pd.notna(row.iloc[2]) else ''
-                    value2 = row.iloc[3] if pd.notna(row.iloc[3]) else ''
-
-                    # Use columns 2-3 if they have event-related keys
-                    if any(keyword in key2 for keyword in ['nome', 'data', 'duração', 'duracao', 'local', 'formador']):
-                        key = key2
-                        value = value2
-
-                if 'nome' in key or 'event' in key or 'título' in key:
-                    if not event_data['nome'] and value:  # Only set if not already set
-                        event_data['nome'] = str(value).strip()
-                elif 'data' in key and 'fim' not in key and 'inicio' not in key:
-                    if not event_data['data'] and value:
-                        event_data['data'] = self._parse_date(value)
-                elif 'data' in key and 'inicio' in key:
-                    if not event_data['data_inicio'] and value:
-                        event_data['data_inicio'] = self._parse_date(value)
-                elif 'data' in key and 'fim' in key:
-                    if not event_data['data_fim'] and value:
-                        event_data['data_fim'] = self._parse_date(value)
-                elif 'duração' in key or 'duracao' in key or 'duration' in key:
-                    if event_data['duracao'] == 60 and value:  # Only set if still default
-                        event_data['duracao'] = self._parse_duration(value)
-                elif 'descrição' in key or 'descricao' in key or 'description' in key:
-                    if not event_data['descricao'] and value:
-                        event_data['descricao'] = str(value).strip()
-                elif 'formador' in key or 'facilitador' in key or 'trainer' in key:
-                    if not event_data['formadora'] and value:
-                        event_data['formadora'] = str(value).strip()
-                elif 'local' in key or 'location' in key:
-                    if not event_data['local'] and value:
-                        event_data['local'] = str(value).strip()
+        for row in rows:
+            if len(row) < 2:
+                continue
+
+            # Try standard format (columns 0-1)
+            key = str(row[0]).strip().lower() if pd.notna(row[0]) else ''
+            value = row[1] if pd.notna(row[1]) else ''
+
+            # Also try alternative format (columns 2-3) for formats where event data is in right columns
+            if len(row) >= 4:
+                key2 = str(row[2]).strip().lower() if pd.notna(row[2]) else ''
+                value2 = row[3] if pd.notna(row[3]) else ''
+
+                # Use columns 2-3 if they have event-related keys
+                if any(keyword in key2 for keyword in self.EVENT_KEYWORDS):
+                    key = key2
+                    value = value2
+
+            if 'nome' in key or 'event' in key or 'título' in key:
+                if not event_data['nome'] and value:  # Only set if not already set
+                    event_data['nome'] = str(value).strip()
+            elif 'data' in key and 'fim' not in key and 'inicio' not in key:
+                if not event_data['data'] and value:
+                    event_data['data'] = value
+            elif 'data' in key and 'inicio' in key:
+                if not event_data['data_inicio'] and value:
+                    event_data['data_inicio'] = value
+            elif 'data' in key and 'fim' in key:
+                if not event_data['data_fim'] and value:
+                    event_data['data_fim'] = value
+            elif 'duração' in key or 'duracao' in key or 'duration' in key:
+                if event_data['duracao'] == 60 and value:  # Only set if still default
+                    event_data['duracao'] = value
+            elif 'descrição' in key or 'descricao' in key or 'description' in key:
+                if not event_data['descricao'] and value:
+                    event_data['descricao'] = str(value).strip()
+            elif 'formador' in key or 'facilitador' in key or 'trainer' in key:
+                if not event_data['formadora'] and value:
+                    event_data['formadora'] = str(value).strip()
+            elif 'local' in key or 'location' in key:
+                if not event_data['local'] and value:
+                    event_data['local'] = str(value).strip()
 
         return event_data
 
     def _extract_participants_data(self, df: pd.DataFrame) -> list:
-        """Extract participants data from dataframe"""
+        """Extract participants data from dataframe (column-wise)"""
         participants = []
 
         if df.empty:
@@ -272,17 +727,9 @@ class ExcelImportService:
         # Reset index after cleaning
         df = df.reset_index(drop=True)
 
-        # Detect header row (first row with multiple non-empty values)
-        header_row = 0
-        for idx, row in df.iterrows():
-            non_empty = row.notna().sum()
-            if non_empty >= 2:  # At least 2 columns with data
-                header_row = idx
-                break
-
-        # Check if we have enough rows for header + data
-        if header_row >= len(df):
-            return participants
+        # Detect header row (first row with at least 2 columns with data)
+        filled = df.notna().sum(axis=1).to_numpy() >= 2
+        header_row = int(filled.argmax()) if filled.any() else 0
 
         # Use detected header row
         df.columns = df.iloc[header_row].values
@@ -292,217 +739,313 @@ class ExcelImportService:
         if df.empty:
             return participants
 
-        # Map common column names
-        column_mapping = {
-            'nome': ['nome', 'name', 'participante', 'participant'],
-            'email': ['email', 'e-mail', 'mail'],
-            'telefone': ['telefone', 'phone', 'telemóvel', 'telemovel', 'contacto'],
-            'empresa': ['empresa', 'company', 'organization', 'organização'],
-            'observacoes': ['observações', 'observacoes', 'notes', 'notas', 'comments']
-        }
+        # Map headers once, then clean only the columns we need
+        positions = self._map_participant_columns(df.columns)
+        cleaned = {pos: self._clean_text_column(df.iloc[:, pos]) for pos in set(positions.values())}
 
-        # Find actual column names
-        actual_columns = {}
-        for target_col, possible_names in column_mapping.items():
-            for col in df.columns:
-                col_str = str(col).lower().strip()
-                if any(name in col_str for name in possible_names):
-                    actual_columns[target_col] = col
-                    break
+        if 'nome' in positions:
+            names = cleaned[positions['nome']]
+        else:
+            # No name column: use first non-empty cell of each row
+            first_filled = np.full(len(df), None, dtype=object)
+            for pos in reversed(range(df.shape[1])):
+                column = self._clean_text_column(df.iloc[:, pos])
+                filled = (column.notna() & (column != '')).to_numpy()
+                first_filled = np.where(filled, column.to_numpy(), first_filled)
+            names = pd.Series(first_filled, index=df.index, dtype=object)
+
+        # Skip rows with no name
+        keep = (names.notna() & (names != '')).to_numpy()
+
+        # Emit records from the filtered column arrays
+        name_values = names[keep].tolist()
+        field_values = [
+            (field, cleaned[pos][keep].tolist())
+            for field, pos in positions.items() if field != 'nome'
+        ]
+
+        for i, nome in enumerate(name_values):
+            participant = {'nome': nome}
+            for field, values in field_values:
+                if values[i] is not None:
+                    participant[field] = values[i]
+            participants.append(participant)
 
-        # Extract participants
-        for _, row in df.iterrows():
-            participant = {}
+        return participants
 
-            # Skip rows with no name
-            if 'nome' in actual_columns:
-                nome = row.get(actual_columns['nome'], '')
-                if pd.isna(nome) or str(nome).strip() == '':
-                    continue
-                participant['nome'] = str(nome).strip()
-            else:
-                # Try first non-empty column as name
-                for val in row:
-                    if pd.notna(val) and str(val).strip():
-                        participant['nome'] = str(val).strip()
-                        break
-                if 'nome' not in participant:
-                    continue
+    def _map_participant_columns(self, labels) -> dict:
+        """Map participant fields to column positions using header aliases"""
+        normalized = [str(label).lower().strip() for label in labels]
 
-            # Extract other fields
-            for field, col in actual_columns.items():
-                if field == 'nome':
-                    continue
-                value = row.get(col, '')
-                if pd.notna(value):
-                    participant[field] = str(value).strip()
+        positions = {}
+        for field, aliases in self.PARTICIPANT_COLUMN_ALIASES.items():
+            for pos, label in enumerate(normalized):
+                if any(alias in label for alias in aliases):
+                    positions[field] = pos
+                    break
 
-            participants.append(participant)
+        return positions
 
-        return participants
+    def _clean_text_column(self, column: pd.Series) -> pd.Series:
+        """Stripped text for filled cells, None for empty ones (vectorized)"""
+        text = np.full(len(column), None, dtype=object)
+        present = column.notna().to_numpy()
+        if present.any():
+            # Cast to object first so dates render like str() of each cell
+            text[present] = column[present].astype(object).astype(str).str.strip().to_numpy()
+        return pd.Series(text, index=column.index, dtype=object)
 
-    def _parse_date(self, value) -> datetime:
+    def extract_participants_only(self, file_path: str) -> list:
         """
-        Parse date from various formats.
-        Returns None if date cannot be parsed (never raises exception).
+        Extract only participants from Excel file, ignoring event data.
+        Useful for importing participants to an existing event.
+
+        Returns:
+            list: List of participant dictionaries with fields: nome, email, telefone, empresa, observacoes
         """
         try:
-            if pd.isna(value):
-                return None
-
-            if isinstance(value, datetime):
-                return value
-
-            value_str = str(value).strip()
+            all_participants = list(self.iter_participants_only(file_path))
+            print(f"DEBUG - Total participants extracted: {len(all_participants)}")
+            return all_participants
 
-            if not value_str or value_str.lower() in ['nan', 'none', '']:
-                return None
+        except Exception as e:
+            print(f"ERROR - Failed to extract participants: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            raise Exception(f"Erro ao extrair participantes: {str(e)}")
 
-            # Try Portuguese format first: "29 de dezembro de 2025"
-            portuguese_months = {
-                'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
-                'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
-                'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
-            }
+    def iter_participants_only(self, file_path: str):
+        """
+        Lazily yield participants from every sheet of an Excel file
 
-            # Check if it's Portuguese format
-            if ' de ' in value_str.lower():
-                try:
-                    # Handle format: "12, 14, 19 e 21 de janeiro" or "12, 14, 19 e 21 de janeiro de 2026"
-                    # Extract first day and month, add year if missing
-                    parts = value_str.lower().split(' de ')
-
-                    if len(parts) >= 2:
-                        # Get first day from list (e.g., "12, 14, 19 e 21" -> "12")
-                        day_part = parts[0].strip()
-                        # If there are commas or 'e', extract first number
-                        if ',' in day_part or ' e ' in day_part:
-                            day = int(day_part.split(',')[0].strip())
-                        else:
-                            day = int(day_part)
-
-                        month_name = parts[1].strip()
-
-                        # Check if year is provided
-                        if len(parts) == 3:
-                            year = int(parts[2].strip())
-                        else:
-                            # No year provided, use current year
-                            # (don't auto-advance to next year as this causes confusion)
-                            from datetime import datetime as dt
-                            year = dt.now().year
-
-                        if month_name in portuguese_months:
-                            month = portuguese_months[month_name]
-                            return datetime(year, month, day)
-                except Exception as e:
-                    print(f"DEBUG - Error parsing Portuguese date '{value_str}': {e}")
-                    pass
+        .xlsx and CSV/TSV files are streamed row by row, so memory stays flat
+        regardless of the number of rows. Other formats are read with pandas.
+        """
+        print(f"DEBUG - Extracting participants from: {file_path}")
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Ficheiro não encontrado: {file_path}")
+
+        # Re-uploads of the same file skip parsing
+        cache_key = (self._content_hash(file_path), 'participantes')
+        cached = parse_cache.get(cache_key)
+        if cached is not None:
+            print(f"DEBUG - Parse cache hit for {file_path}")
+            for participant in cached:
+                yield dict(participant)
+            return
+
+        # Keep a copy for the cache only while it fits
+        collected = []
+        for participant in self._iter_participants_uncached(file_path):
+            if collected is not None:
+                collected.append(participant)
+                if len(collected) > parse_cache.max_rows:
+                    collected = None
+            yield dict(participant)
+
+        if collected is not None:
+            parse_cache.set(cache_key, collected, rows=len(collected))
+
+    def _iter_participants_uncached(self, file_path: str):
+        """Stream participants from a file according to its extension"""
+        if file_path.lower().endswith(self.CSV_EXTENSIONS):
+            yield from self._iter_participants_from_rows(self._iter_csv_rows(file_path))
+            return
+
+        if not file_path.lower().endswith(self.STREAMING_EXTENSIONS):
+            yield from self._iter_participants_with_pandas(file_path)
+            return
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for worksheet in workbook.worksheets:
+                print(f"DEBUG - Checking sheet: {worksheet.title}")
+                yield from self._iter_participants_from_rows(self._iter_sheet_rows(worksheet))
+        finally:
+            workbook.close()
+
+    def _iter_participants_from_rows(self, rows):
+        """Participants of one sheet's rows, starting at the participant header if any"""
+        head, header, after, rest = self._scan_rows(rows)
+
+        if header is not None:
+            rows = chain([header], after, rest)
+        else:
+            # Try to treat entire sheet as participant data
+            print("DEBUG - No participant section found, trying entire sheet")
+            rows = chain(head, rest)
 
-            # Try common date formats (try 2-digit year first, then 4-digit)
-            date_formats = [
-                '%d/%m/%y',      # DD/MM/YY (e.g., 15/01/26)
-                '%d-%m-%y',      # DD-MM-YY
-                '%d/%m/%Y',      # DD/MM/YYYY
-                '%d-%m-%Y',      # DD-MM-YYYY
-                '%Y-%m-%d',      # YYYY-MM-DD
-                '%d/%m/%Y %H:%M',
-                '%d-%m-%Y %H:%M',
-                '%d/%m/%y %H:%M',
-                '%d-%m-%y %H:%M'
-            ]
+        yield from self._iter_participant_table(rows)
 
-            for fmt in date_formats:
-                try:
-                    return datetime.strptime(value_str, fmt)
-                except ValueError:
-                    continue
+    def _iter_participants_with_pandas(self, file_path: str):
+        """Yield participants from each sheet of a non-streamable workbook"""
+        # Read all sheets to find participants
+        excel_file = pd.ExcelFile(file_path)
 
-            # If all fail, return None
-            print(f"DEBUG - Could not parse date: '{value_str}' - ignoring")
-            return None
+        # Try each sheet
+        for sheet_name in excel_file.sheet_names:
+            print(f"DEBUG - Checking sheet: {sheet_name}")
+            df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
 
-        except Exception as e:
-            # Catch any unexpected errors and return None
-            print(f"DEBUG - Unexpected error parsing date '{value}': {e}")
-            return None
+            # Find participant section
+            participant_start_row = self._find_participant_section(df)
 
-    def _parse_duration(self, value) -> int:
-        """Parse duration in minutes"""
-        if pd.isna(value):
-            return 60
+            if participant_start_row is not None:
+                print(f"DEBUG - Found participants starting at row {participant_start_row}")
+                participants = self._extract_participants_data(df.iloc[participant_start_row:])
+            else:
+                # Try to treat entire sheet as participant data
+                print("DEBUG - No participant section found, trying entire sheet")
+                participants = self._extract_participants_data(df)
 
-        try:
-            value_str = str(value).strip().lower()
+            print(f"DEBUG - Extracted {len(participants)} participants from sheet {sheet_name}")
+            yield from participants
 
-            # Check for format like "1h40" or "2h30"
-            if 'h' in value_str:
-                parts = value_str.split('h')
-                hours = int(parts[0]) if parts[0].isdigit() else 0
-                minutes = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-                return hours * 60 + minutes
+    def create_events(self, data: dict, organizacao_id: int, commit: bool = True) -> dict:
+        """
+        Create events and their participants from parse_excel_file output
 
-            # Try to extract number
-            numeric = ''.join(c for c in value_str if c.isdigit() or c == '.')
-            return int(float(numeric)) if numeric else 60
-        except:
-            return 60
+        All events are written with one INSERT ... RETURNING and all their
+        participants with one executemany INSERT, in a single transaction.
 
-    def extract_participants_only(self, file_path: str) -> list:
-        """
-        Extract only participants from Excel file, ignoring event data.
-        Useful for importing participants to an existing event.
+        Args:
+            data: Result of parse_excel_file (single or multi-event format)
+            organizacao_id: Organization that owns the new events
+            commit: Commit the transaction at the end (False lets the caller commit)
 
         Returns:
-            list: List of participant dictionaries with fields: nome, email, telefone, empresa, observacoes
+            dict with 'eventos' (new event IDs), 'participantes' (count),
+            'ignorados' (repeated emails), 'erros' (rows without name or email)
+            and 'avisos' (warnings)
         """
-        try:
-            print(f"DEBUG - Extracting participants from: {file_path}")
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Ficheiro não encontrado: {file_path}")
+        multi_event = 'events' in data
+        events_list = data['events'] if multi_event else [data]
+
+        event_rows = []
+        participants_lists = []
+        avisos = []
+
+        for event_item in events_list:
+            event_data = event_item['event']
+
+            # Validate required fields
+            nome = event_data.get('nome', '').strip()
+            if not nome:
+                if not multi_event:
+                    raise ValueError('Nome do evento é obrigatório')
+                avisos.append('⚠️ Nome do evento é obrigatório. Evento ignorado.')
+                continue
+
+            # Convert dates (optional - if not found, use None)
+            data_inicio = event_data.get('data') or event_data.get('data_inicio')
+            if data_inicio and hasattr(data_inicio, 'date'):
+                data_inicio = data_inicio.date()
+
+            # Data is now optional - if not found, event will be created without date
+            if not data_inicio:
+                print(f"DEBUG - No date found for event '{nome}', proceeding without date")
+
+            data_fim = event_data.get('data_fim')
+            if data_fim and hasattr(data_fim, 'date'):
+                data_fim = data_fim.date()
+
+            event_rows.append({
+                'nome': nome,
+                'data_inicio': data_inicio,
+                'data_fim': data_fim,
+                'duracao_minutos': event_data.get('duracao', 60),  # Duration in minutes
+                'descricao': event_data.get('descricao', ''),
+                'formadora': event_data.get('formadora', '') or 'Ana Rita Vieira',
+                'local': event_data.get('local', ''),
+                'organizacao_id': organizacao_id
+            })
+            participants_lists.append(event_item['participants'])
 
-            # Read all sheets to find participants
-            excel_file = pd.ExcelFile(file_path)
-            all_participants = []
+        if not event_rows:
+            return {'eventos': [], 'participantes': 0, 'ignorados': 0, 'erros': 0, 'avisos': avisos}
 
-            # Try each sheet
-            for sheet_name in excel_file.sheet_names:
-                print(f"DEBUG - Checking sheet: {sheet_name}")
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+        try:
+            # IDs come back in the order of event_rows
+            created_events = db.session.scalars(
+                sa.insert(Event).returning(Event.id, sort_by_parameter_order=True), event_rows
+            ).all()
 
-                # Find participant section
-                participant_start_row = self._find_participant_section(df)
+            stats = ParticipantUpsertService().insert_new_events(
+                zip(created_events, participants_lists), commit=commit
+            )
 
-                if participant_start_row is not None:
-                    print(f"DEBUG - Found participants starting at row {participant_start_row}")
-                    participants_df = df.iloc[participant_start_row:]
-                    participants = self._extract_participants_data(participants_df)
-                    all_participants.extend(participants)
-                    print(f"DEBUG - Extracted {len(participants)} participants from sheet {sheet_name}")
-                else:
-                    # Try to treat entire sheet as participant data
-                    print(f"DEBUG - No participant section found, trying entire sheet")
-                    participants = self._extract_participants_data(df)
-                    if participants:
-                        all_participants.extend(participants)
-                        print(f"DEBUG - Extracted {len(participants)} participants from entire sheet")
+        except Exception:
+            db.session.rollback()
+            raise
 
-            print(f"DEBUG - Total participants extracted: {len(all_participants)}")
-            return all_participants
+        without_email = stats['errors']
+        if without_email > 0:
+            avisos.append(f'⚠️ {without_email} participantes sem nome ou email foram ignorados')
+        if stats['duplicates'] > 0:
+            avisos.append(f"⚠️ {stats['duplicates']} participantes com email repetido no mesmo evento foram ignorados")
 
-        except Exception as e:
-            print(f"ERROR - Failed to extract participants: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            raise Exception(f"Erro ao extrair participantes: {str(e)}")
+        return {'eventos': created_events, 'participantes': stats['imported'], 'ignorados': stats['skipped'],
+                'erros': stats['errors'], 'avisos': avisos}
 
     def save_uploaded_file(self, file: FileStorage, upload_folder: str) -> str:
-        """Save uploaded file temporarily"""
+        """
+        Save an uploaded file under its content hash
+
+        The stream is hashed while it is written, so the same workbook uploaded
+        again maps to the same file (and parse cache entry) instead of a new copy.
+        Uploads older than ImportConfig.UPLOAD_RETENTION_SECONDS are removed,
+        unless an import job that is not done yet still reads them.
+        """
         os.makedirs(upload_folder, exist_ok=True)
+        self._prune_uploads(upload_folder)
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"upload_{timestamp}_{file.filename}"
-        filepath = os.path.join(upload_folder, filename)
+        extension = os.path.splitext(file.filename)[1].lower()
+        digest = hashlib.sha256()
+
+        with tempfile.NamedTemporaryFile(dir=upload_folder, prefix='.upload_', delete=False) as tmp:
+            while True:
+                chunk = file.stream.read(ImportConfig.UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                tmp.write(chunk)
+
+        filepath = os.path.join(upload_folder, f"upload_{digest.hexdigest()}{extension}")
+        if os.path.exists(filepath):
+            # Same content already stored: keep it, refresh its retention
+            os.remove(tmp.name)
+            os.utime(filepath)
+        else:
+            os.replace(tmp.name, filepath)
 
-        file.save(filepath)
         return filepath
+
+    def _content_hash(self, file_path: str) -> str:
+        """SHA-256 of a file (taken from the name for stored uploads)"""
+        match = self.UPLOAD_NAME_PATTERN.match(os.path.basename(file_path))
+        if match:
+            return match.group(1)
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(ImportConfig.UPLOAD_CHUNK_BYTES), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _prune_uploads(self, upload_folder: str):
+        """Remove stored uploads past the retention period that no pending or previewed job uses"""
+        cutoff = time.time() - ImportConfig.UPLOAD_RETENTION_SECONDS
+        in_use = {
+            os.path.abspath(source) for source, in db.session.query(ImportJob.source).filter(
+                ImportJob.status.notin_(ImportJob.DONE_STATUSES)
+            )
+        }
+        for entry in os.scandir(upload_folder):
+            if entry.name.startswith(('upload_', '.upload_')) and entry.is_file():
+                if os.path.abspath(entry.path) in in_use:
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
@@ -0,0 +1,169 @@
+"""
+Form Catalog Cache - Google Forms of each account kept in memory and searched locally
+"""
+
+import logging
+import re
+import threading
+import time
+import unicodedata
+from app.constants import GoogleConfig
+
+logger = logging.getLogger(__name__)
+
+
+class FormCatalog:
+    """Forms of one account (most recently modified first) with a word-prefix index"""
+
+    def __init__(self, forms):
+        self.forms = forms
+        self.loaded_at = time.monotonic()
+        self._names = [self.normalize(form.get('name') or '') for form in forms]
+        self._prefixes = {}  # word prefix -> positions in self.forms, ascending
+        for position, name in enumerate(self._names):
+            for word in set(name.split()):
+                for size in range(1, min(len(word), GoogleConfig.FORM_CATALOG_PREFIX_LENGTH) + 1):
+                    self._prefixes.setdefault(word[:size], []).append(position)
+
+    @staticmethod
+    def normalize(text):
+        """Lowercase, without accents, punctuation turned into spaces"""
+        text = unicodedata.normalize('NFKD', text.lower())
+        text = ''.join(char for char in text if not unicodedata.combining(char))
+        return re.sub(r'[\W_]+', ' ', text).strip()
+
+    def search(self, term, limit=20):
+        """
+        Forms whose name has words starting with every word of the term;
+        if there are none, forms whose name contains the term anywhere
+        """
+        query = self.normalize(term)
+        if not query:
+            return []
+
+        positions = None
+        for word in query.split():
+            prefix = word[:GoogleConfig.FORM_CATALOG_PREFIX_LENGTH]
+            matches = set(self._prefixes.get(prefix, ()))
+            positions = matches if positions is None else positions & matches
+            if not positions:
+                break
+
+        if positions:
+            # Words longer than the indexed prefix still have to match in full
+            words = query.split()
+            found = [position for position in sorted(positions)
+                     if all(any(name_word.startswith(word) for name_word in self._names[position].split())
+                            for word in words)]
+        else:
+            found = []
+
+        if not found:
+            found = [position for position, name in enumerate(self._names) if query in name]
+
+        return [self.forms[position] for position in found[:limit]]
+
+
+class FormCatalogCache:
+    """
+    Catalogs per Google account with a time-to-live and background refresh
+
+    A catalog older than the TTL is still served while one background thread
+    reloads it; only catalogs missing or older than the maximum staleness are
+    loaded while the caller waits. Concurrent loads of the same account share
+    a single Drive listing.
+    """
+
+    def __init__(self, ttl_seconds=GoogleConfig.FORM_CATALOG_TTL_SECONDS,
+                 max_stale_seconds=GoogleConfig.FORM_CATALOG_MAX_STALE_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self._catalogs = {}     # account -> FormCatalog
+        self._load_locks = {}   # account -> Lock held while loading
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, account, loader):
+        """
+        Catalog of an account
+
+        Args:
+            account: Account identity (see GoogleClientCache.identity)
+            loader: Callable returning the account's forms, newest first
+        """
+        with self._lock:
+            catalog = self._catalogs.get(account)
+
+        if catalog is None or self._age(catalog) > self.max_stale_seconds:
+            return self._load(account, loader, catalog)
+
+        if self._age(catalog) > self.ttl_seconds:
+            self._refresh_in_background(account, loader)
+
+        with self._lock:
+            self.hits += 1
+        return catalog
+
+    def invalidate(self, account=None):
+        """Drop the catalog of an account (or of every account)"""
+        with self._lock:
+            if account is None:
+                self._catalogs.clear()
+            else:
+                self._catalogs.pop(account, None)
+
+    def info(self):
+        with self._lock:
+            return {
+                'accounts': len(self._catalogs),
+                'forms': sum(len(catalog.forms) for catalog in self._catalogs.values()),
+                'hits': self.hits,
+                'loads': self.loads,
+                'refreshing': len(self._refreshing),
+            }
+
+    def _age(self, catalog):
+        return time.monotonic() - catalog.loaded_at
+
+    def _load(self, account, loader, previous=None):
+        """Load the catalog once even when many requests ask at the same time"""
+        with self._lock:
+            load_lock = self._load_locks.setdefault(account, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                current = self._catalogs.get(account)
+            # Another thread may have loaded it while this one waited
+            if current is not None and current is not previous and self._age(current) <= self.ttl_seconds:
+                return current
+
+            catalog = FormCatalog(loader())
+            with self._lock:
+                self._catalogs[account] = catalog
+                self.loads += 1
+            return catalog
+
+    def _refresh_in_background(self, account, loader):
+        with self._lock:
+            if account in self._refreshing:
+                return
+            self._refreshing.add(account)
+            previous = self._catalogs.get(account)
+
+        def refresh():
+            try:
+                self._load(account, loader, previous)
+            except Exception as e:
+                # Keep serving the stale catalog; the next request tries again
+                logger.warning(f"Falha ao atualizar a lista de formulários: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(account)
+
+        threading.Thread(target=refresh, name='form-catalog-refresh', daemon=True).start()
+
+
+# Shared by every GoogleFormsService in the process
+form_catalog = FormCatalogCache()
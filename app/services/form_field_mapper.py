@@ -0,0 +1,163 @@
+"""
+Form Field Mapper - Compiled question-to-participant-field maps for Google Forms
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from app.constants import GoogleConfig
+
+
+class FormFieldMapper:
+    """
+    Participant field of each question of one form revision
+
+    Question titles are matched against FIELD_KEYWORDS once, when the mapper
+    is built; parsing a response is then a dict lookup per answer. Overrides
+    (question ID or title -> field, or None to ignore the question) take
+    precedence over the title matching.
+    """
+
+    # Participant fields filled from form answers
+    FIELDS = ('nome', 'email', 'telefone', 'empresa', 'observacoes')
+
+    # Title keywords per field, checked in this order (first match wins)
+    FIELD_KEYWORDS = (
+        ('nome', ('nome',)),
+        ('email', ('email', 'e-mail')),
+        ('telefone', ('telefone', 'telemóvel')),
+        ('empresa', ('empresa',)),
+        ('observacoes', ('observa',)),
+    )
+
+    def __init__(self, form, overrides=None):
+        self.revision_id = form.get('revisionId')
+        self.questions = []  # (question_id, title, field) in form order
+        self.fields = {}     # question_id -> field
+
+        overrides = overrides or {}
+        by_title = {str(key).strip().lower(): field for key, field in overrides.items()}
+
+        for item in form.get('items', []):
+            if 'questionItem' not in item:
+                continue
+            question_id = item['questionItem']['question']['questionId']
+            title = item.get('title', '')
+
+            if question_id in overrides:
+                field = overrides[question_id]
+            elif title.strip().lower() in by_title:
+                field = by_title[title.strip().lower()]
+            else:
+                field = self.field_for_title(title)
+
+            self.questions.append((question_id, title, field))
+            if field:
+                self.fields[question_id] = field
+
+    @classmethod
+    def field_for_title(cls, title):
+        """Participant field a question title refers to, or None"""
+        title = title.lower()
+        for field, keywords in cls.FIELD_KEYWORDS:
+            if any(keyword in title for keyword in keywords):
+                return field
+        return None
+
+    @classmethod
+    def validate_overrides(cls, overrides):
+        """
+        Check a mapping overrides dict
+
+        Raises:
+            ValueError: If it is not a dict of question -> known field (or None)
+        """
+        if not isinstance(overrides, dict):
+            raise ValueError('O mapeamento deve ser um objeto {pergunta: campo}')
+        for question, field in overrides.items():
+            if field is not None and field not in cls.FIELDS:
+                raise ValueError(
+                    f'Campo "{field}" inválido para "{question}" (válidos: {", ".join(cls.FIELDS)})'
+                )
+        return overrides
+
+    def parse(self, response):
+        """Participant data of a single form response"""
+        participant_data = {
+            'response_id': response.get('responseId'),
+            'timestamp': response.get('createTime'),
+            'last_submitted_time': response.get('lastSubmittedTime'),
+            'nome': '',
+            'email': '',
+            'telefone': '',
+            'empresa': '',
+            'observacoes': ''
+        }
+
+        fields = self.fields
+        for question_id, answer in response.get('answers', {}).items():
+            field = fields.get(question_id)
+            if field is not None:
+                participant_data[field] = answer.get('textAnswers', {}).get('answers', [{}])[0].get('value', '')
+
+        return participant_data
+
+    def describe(self):
+        """Questions of the form with the field each one fills"""
+        return [
+            {'question_id': question_id, 'title': title, 'field': field}
+            for question_id, title, field in self.questions
+        ]
+
+
+class FormMapperCache:
+    """Thread-safe LRU of compiled mappers keyed by form, revision and overrides"""
+
+    def __init__(self, max_entries=GoogleConfig.FORM_MAPPER_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, form_id, revision_id, overrides=None):
+        """Cached mapper for this form revision or None"""
+        key = self._key(form_id, revision_id, overrides)
+        with self._lock:
+            mapper = self._entries.get(key)
+            if mapper is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return mapper
+
+    def build(self, form_id, form, overrides=None):
+        """Compile a mapper for a full form resource and cache it under its revision"""
+        mapper = FormFieldMapper(form, overrides)
+        if mapper.revision_id is None:
+            # Nothing to tell revisions apart: use it once, do not cache it
+            return mapper
+
+        key = self._key(form_id, mapper.revision_id, overrides)
+        with self._lock:
+            self._entries[key] = mapper
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return mapper
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def info(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def _key(self, form_id, revision_id, overrides):
+        return form_id, revision_id, json.dumps(overrides or {}, sort_keys=True)
+
+
+# Shared by every GoogleFormsService in the process
+form_mappers = FormMapperCache()
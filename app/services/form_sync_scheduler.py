@@ -0,0 +1,239 @@
+"""
+Form Sync Scheduler - Periodic background sync of every event linked to a Google Form
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from app import db
+from app.constants import GoogleConfig
+from app.models import Event
+
+try:
+    import fcntl
+except ImportError:  # Windows: no leader election, every process syncs
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class FormSyncScheduler:
+    """
+    Sync the form responses of all events in the background
+
+    A daemon thread wakes up every few seconds, lists the non-deleted events
+    with a google_form_id and hands the ones that are due to a bounded thread
+    pool. After a successful sync an event is due again after the interval;
+    after a failure the wait doubles up to a maximum. A random jitter spreads
+    events over time so they do not all hit the API together.
+
+    Only one process per machine runs the syncs: the one holding an exclusive
+    lock on GoogleConfig.FORM_SYNC_LOCK_FILE (other workers keep retrying it,
+    so one of them takes over if the leader exits).
+    """
+
+    def __init__(self):
+        self._app = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._executor = None
+        self._lock_file = None
+        self._events = {}    # event_id -> status dict
+        self._running = set()
+        self._last_tick = {}
+        self.interval = GoogleConfig.FORM_SYNC_INTERVAL_SECONDS
+
+    def start(self, app):
+        """Start the scheduler thread (no-op if already running or disabled)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.interval = app.config.get('FORM_SYNC_INTERVAL_SECONDS', self.interval)
+            if self.interval <= 0:
+                return
+
+            self._app = app
+            self._stop.clear()
+            self._executor = ThreadPoolExecutor(max_workers=GoogleConfig.FORM_SYNC_WORKERS,
+                                                thread_name_prefix='form-sync')
+            self._thread = threading.Thread(target=self._loop, name='form-sync-scheduler', daemon=True)
+            self._thread.start()
+        logger.info(f"Sincronização automática de formulários a cada {self.interval}s")
+
+    def stop(self, wait=True):
+        """Stop scheduling new syncs (running ones finish)"""
+        with self._lock:
+            thread, executor = self._thread, self._executor
+            self._thread = self._executor = None
+        if thread is None:
+            return
+
+        self._stop.set()
+        if wait:
+            thread.join()
+        executor.shutdown(wait=wait)
+        self._release_leadership()
+
+    def status(self):
+        """Scheduler state and the last sync of each event"""
+        now = time.monotonic()
+        with self._lock:
+            events = {}
+            for event_id, state in self._events.items():
+                events[event_id] = {key: value for key, value in state.items() if not key.startswith('_')}
+                events[event_id]['next_run_in_seconds'] = max(0, round(state['_next_run'] - now))
+
+            return {
+                'enabled': self._thread is not None,
+                'leader': self._lock_file is not None,
+                'interval_seconds': self.interval,
+                'workers': GoogleConfig.FORM_SYNC_WORKERS,
+                'last_tick': dict(self._last_tick),
+                'events': events,
+            }
+
+    def tick(self):
+        """Submit every event that is due; returns how many were submitted"""
+        started = time.monotonic()
+        submitted = 0
+
+        if not self._acquire_leadership():
+            return 0
+
+        from .google_auth_service import GoogleAuthService
+        if not GoogleAuthService().is_authenticated():
+            self._record_tick(started, submitted, 'sem_autenticacao')
+            return 0
+
+        event_ids = db.session.scalars(
+            db.select(Event.id).where(Event.deleted_at.is_(None), Event.google_form_id.isnot(None))
+        ).all()
+        db.session.remove()
+
+        now = time.monotonic()
+        with self._lock:
+            # Unlinked or deleted events leave the status list
+            for event_id in set(self._events) - set(event_ids):
+                del self._events[event_id]
+
+            for event_id in event_ids:
+                state = self._events.setdefault(event_id, self._new_state(now))
+                if event_id in self._running or state['_next_run'] > now:
+                    continue
+                self._running.add(event_id)
+                state['status'] = 'a_sincronizar'
+                self._executor.submit(self._sync_event, event_id)
+                submitted += 1
+
+        self._record_tick(started, submitted, 'ok')
+        return submitted
+
+    def _loop(self):
+        # First tick after a short random delay, so restarts do not hammer the API
+        self._stop.wait(random.uniform(0, GoogleConfig.FORM_SYNC_TICK_SECONDS))
+        while not self._stop.is_set():
+            try:
+                with self._app.app_context():
+                    self.tick()
+            except Exception:
+                logger.exception("Erro no agendador de sincronização de formulários")
+            self._stop.wait(GoogleConfig.FORM_SYNC_TICK_SECONDS)
+
+    def _sync_event(self, event_id):
+        """Worker: sync one event and schedule its next run"""
+        from .form_sync_service import FormSyncService
+
+        started = time.monotonic()
+        started_at = datetime.utcnow()
+        error = None
+        result = None
+
+        try:
+            with self._app.app_context():
+                try:
+                    evento = db.session.get(Event, event_id)
+                    if evento is not None and evento.google_form_id and not evento.deleted_at:
+                        stats = FormSyncService().sync_event(evento)
+                        result = {key: stats[key] for key in ('responses', 'imported', 'updated', 'errors')}
+                except Exception as e:
+                    db.session.rollback()
+                    error = str(e)
+                    logger.warning(f"Sincronização do evento {event_id} falhou: {e}")
+                finally:
+                    db.session.remove()
+        finally:
+            self._record_sync(event_id, started, started_at, result, error)
+
+    def _record_sync(self, event_id, started, started_at, result, error):
+        duration = time.monotonic() - started
+        with self._lock:
+            self._running.discard(event_id)
+            state = self._events.setdefault(event_id, self._new_state(time.monotonic()))
+            state['last_run_at'] = started_at.isoformat()
+            state['last_duration_seconds'] = round(duration, 3)
+
+            if error is None:
+                state['status'] = 'ok'
+                state['failures'] = 0
+                state['last_result'] = result
+                state['last_error'] = None
+                delay = self.interval
+            else:
+                state['status'] = 'erro'
+                state['failures'] += 1
+                state['last_error'] = error
+                delay = min(self.interval * 2 ** state['failures'], GoogleConfig.FORM_SYNC_MAX_BACKOFF_SECONDS)
+
+            delay *= 1 + random.uniform(0, GoogleConfig.FORM_SYNC_JITTER)
+            state['_next_run'] = time.monotonic() + delay
+
+    def _record_tick(self, started, submitted, status):
+        with self._lock:
+            self._last_tick = {
+                'at': datetime.utcnow().isoformat(),
+                'status': status,
+                'submitted': submitted,
+                'duration_seconds': round(time.monotonic() - started, 3),
+            }
+
+    def _new_state(self, now):
+        return {
+            'status': 'agendado',
+            'failures': 0,
+            'last_run_at': None,
+            'last_duration_seconds': None,
+            'last_result': None,
+            'last_error': None,
+            # Spread the first syncs of a batch of events over one tick
+            '_next_run': now + random.uniform(0, GoogleConfig.FORM_SYNC_TICK_SECONDS),
+        }
+
+    def _acquire_leadership(self):
+        """Hold the leader lock file; True if this process should run syncs"""
+        if fcntl is None or self._lock_file is not None:
+            return True
+
+        lock_file = open(GoogleConfig.FORM_SYNC_LOCK_FILE, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        self._lock_file = lock_file
+        logger.info(f"Processo {os.getpid()} é o responsável pela sincronização de formulários")
+        return True
+
+    def _release_leadership(self):
+        if self._lock_file is not None:
+            self._lock_file.close()  # closing releases the flock
+            self._lock_file = None
+
+
+# One scheduler per process, started by create_app
+form_sync_scheduler = FormSyncScheduler()
@@ -0,0 +1,69 @@
+"""
+Form Sync Service - Incremental import of Google Form responses into an event
+"""
+
+import logging
+from app import db
+from .google_forms_service import GoogleFormsService
+from .participant_upsert_service import ParticipantUpsertService
+
+logger = logging.getLogger(__name__)
+
+
+class FormSyncService:
+    """
+    Sync the responses of an event's Google Form into its participants
+
+    Each event remembers the submission time of the newest response it has
+    seen. Later syncs only ask the API for responses submitted or edited after
+    it, so a form with no new answers costs a single small request; the ones
+    that did change are written with one bulk upsert.
+    """
+
+    def __init__(self):
+        self.forms_service = GoogleFormsService()
+        self.upsert_service = ParticipantUpsertService()
+
+    def sync_event(self, evento, full=False):
+        """
+        Import new and edited responses of the event's form
+
+        Args:
+            evento: Event model instance with google_form_id set
+            full: If True, ignore the stored timestamp and read every response
+
+        Returns:
+            dict with the upsert statistics (see ParticipantUpsertService.upsert)
+            plus 'responses' (responses fetched) and 'last_response_at'
+        """
+        since = None if full else evento.google_last_response_at
+        responses = self.forms_service.get_form_responses(
+            evento.google_form_id, since=since, overrides=evento.google_form_mapping
+        )
+
+        # New emails are added, existing ones get the latest answers
+        stats = self.upsert_service.upsert(
+            evento.id, responses,
+            on_existing=ParticipantUpsertService.ON_EXISTING_UPDATE,
+            reactivate=False,
+            commit=False
+        )
+
+        latest = max(
+            (ts for ts in (GoogleFormsService.parse_timestamp(r.get('last_submitted_time')) for r in responses) if ts),
+            default=None
+        )
+        if latest is not None and (evento.google_last_response_at is None or latest > evento.google_last_response_at):
+            evento.google_last_response_at = latest
+
+        # Participants and timestamp move together: a failed write is retried next time
+        db.session.commit()
+
+        logger.info(
+            f"Evento {evento.id}: {len(responses)} respostas desde {since or 'o início'}, "
+            f"{stats['imported']} novos, {stats['updated']} atualizados"
+        )
+
+        stats['responses'] = len(responses)
+        stats['last_response_at'] = evento.google_last_response_at.isoformat() if evento.google_last_response_at else None
+        return stats
@@ -4,11 +4,11 @@ Google OAuth Service - Manage Google authentication and API access
 
 import os
 import json
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
 from flask import session, url_for
+from app.constants import GoogleConfig
+from .google_client_cache import google_clients
+from .google_credential_store import credential_store
 
 # Allow OAuth over HTTP for local development
 # WARNING: Only use this for local development, never in production!
@@ -18,31 +18,22 @@ os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
 class GoogleAuthService:
     """Service to manage Google OAuth authentication"""
 
-    # Required scopes for Forms and Sheets API
+    # Required scopes for Forms, Sheets and Drive (GoogleService uses the same token)
     SCOPES = [
         'https://www.googleapis.com/auth/forms.body',
         'https://www.googleapis.com/auth/forms.responses.readonly',
         'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive.file'
+        'https://www.googleapis.com/auth/drive'
     ]
 
     def __init__(self, credentials_file='credentials.json'):
         self.credentials_file = credentials_file
-        self.token_file = 'token.json'
+        self.token_file = GoogleConfig.TOKEN_FILE
 
     def get_credentials(self):
-        """Get stored credentials or None"""
-        creds = None
-
-        if os.path.exists(self.token_file):
-            creds = Credentials.from_authorized_user_file(self.token_file, self.SCOPES)
-
-        # If credentials are expired or invalid, refresh them
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-            self._save_credentials(creds)
-
-        return creds
+        """Get stored credentials or None (refreshed shortly before they expire)"""
+        # Scopes come from the token: a refresh only asks for what was granted
+        return credential_store.get(self.token_file)
 
     def is_authenticated(self):
         """Check if user is authenticated with Google"""
@@ -117,8 +108,7 @@ class GoogleAuthService:
             print(f"DEBUG - Attempting to save token to: {token_path}")
             print(f"DEBUG - Current working directory: {os.getcwd()}")
 
-            with open(self.token_file, 'w') as token:
-                token.write(creds.to_json())
+            credential_store.save(self.token_file, creds)
 
             print(f"DEBUG - Token file saved successfully!")
             print(f"DEBUG - File exists after save: {os.path.exists(self.token_file)}")
@@ -135,26 +125,26 @@ class GoogleAuthService:
 
     def revoke_authentication(self):
         """Revoke authentication and delete token file"""
-        if os.path.exists(self.token_file):
-            os.remove(self.token_file)
+        credential_store.forget(self.token_file)
+        google_clients.clear()
 
     def get_forms_service(self):
         """Get Google Forms API service"""
         creds = self.get_credentials()
         if not creds:
             return None
-        return build('forms', 'v1', credentials=creds)
+        return google_clients.get('forms', 'v1', creds)
 
     def get_sheets_service(self):
         """Get Google Sheets API service"""
         creds = self.get_credentials()
         if not creds:
             return None
-        return build('sheets', 'v4', credentials=creds)
+        return google_clients.get('sheets', 'v4', creds)
 
     def get_drive_service(self):
         """Get Google Drive API service"""
         creds = self.get_credentials()
         if not creds:
             return None
-        return build('drive', 'v3', credentials=creds)
+        return google_clients.get('drive', 'v3', creds)
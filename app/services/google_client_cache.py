@@ -0,0 +1,127 @@
+"""
+Google Client Cache - Reuse googleapiclient resources instead of build() per call
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+import google_auth_httplib2
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.http import build_http
+
+logger = logging.getLogger(__name__)
+
+
+class GoogleClientCache:
+    """
+    Built API resources keyed by (api, version, credential identity)
+
+    Discovery documents are parsed once per process and shared. Resources are
+    kept per thread, because the httplib2 connection inside each one is not
+    thread-safe; a thread asking again for the same API and account gets its
+    resource back, with the credentials swapped in if the caller passes a
+    newer Credentials object for the same account.
+    """
+
+    # Resources kept per thread (one per API and account in practice)
+    MAX_CLIENTS_PER_THREAD = 16
+
+    def __init__(self, http_factory=build_http):
+        # Transport of new resources; swapped for a local fake in benchmarks
+        self.http_factory = http_factory
+        self._documents = {}
+        self._documents_lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {'hits': 0, 'builds': 0}
+        self._stats_lock = threading.Lock()
+
+    def get(self, api, version, credentials):
+        """
+        Get a resource for an API
+
+        Args:
+            api: API name ('forms', 'sheets', 'drive')
+            version: API version ('v1', 'v4', 'v3')
+            credentials: google.auth credentials
+
+        Returns:
+            googleapiclient Resource
+        """
+        clients = self._thread_clients()
+        key = (api, version, self.identity(credentials))
+
+        entry = clients.get(key)
+        if entry is not None:
+            clients.move_to_end(key)
+            if entry['http'].credentials is not credentials:
+                # Same account, newer token object (e.g. reloaded or refreshed)
+                entry['http'].credentials = credentials
+            self._count('hits')
+            return entry['resource']
+
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=self.http_factory())
+        resource = build_from_document(self._document(api, version), http=http)
+        clients[key] = {'http': http, 'resource': resource}
+        while len(clients) > self.MAX_CLIENTS_PER_THREAD:
+            clients.popitem(last=False)
+
+        self._count('builds')
+        return resource
+
+    def identity(self, credentials):
+        """Stable ID of the account behind the credentials (not of the access token)"""
+        parts = [
+            type(credentials).__name__,
+            getattr(credentials, 'client_id', None) or '',
+            getattr(credentials, 'service_account_email', None) or '',
+            # The refresh token identifies the user grant; fall back to the token
+            getattr(credentials, 'refresh_token', None) or getattr(credentials, 'token', None) or '',
+        ]
+        return hashlib.sha256('|'.join(parts).encode()).hexdigest()[:16]
+
+    def clear(self):
+        """Forget all resources (e.g. after revoking authentication)"""
+        # Other threads drop theirs on their next call
+        self._local = threading.local()
+
+    def info(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        with self._documents_lock:
+            stats['documents'] = sorted(f'{api}/{version}' for api, version in self._documents)
+        return stats
+
+    def _thread_clients(self):
+        local = self._local
+        clients = getattr(local, 'clients', None)
+        if clients is None:
+            clients = local.clients = OrderedDict()
+        return clients
+
+    def _document(self, api, version):
+        """Parsed discovery document, loaded once per process"""
+        key = (api, version)
+        with self._documents_lock:
+            document = self._documents.get(key)
+            if document is None:
+                content = discovery_cache.get_static_doc(api, version)
+                if content is not None:
+                    document = json.loads(content)
+                else:
+                    # Not shipped with the library: fetch it once over the network
+                    logger.info(f"Discovery document {api}/{version} not bundled, fetching it")
+                    document = build(api, version, http=build_http(), cache_discovery=False,
+                                     static_discovery=False)._rootDesc
+                self._documents[key] = document
+            return document
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+
+# Shared by every Google service in the process
+google_clients = GoogleClientCache()
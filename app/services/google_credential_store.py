@@ -0,0 +1,152 @@
+"""
+Google Credential Store - Process-wide OAuth tokens with single-flight refresh
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from app.constants import GoogleConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CredentialStore:
+    """
+    OAuth credentials of each token file, kept in memory
+
+    The file is parsed again only when its mtime changes (another process
+    refreshed or re-authorized). Tokens are refreshed a few minutes before
+    they expire, so callers always get a usable access token, and only one
+    thread per token file refreshes at a time: the others wait for it and
+    reuse the result instead of refreshing and rewriting the file themselves.
+    """
+
+    def __init__(self):
+        self._entries = {}  # absolute path -> {'mtime': ns, 'creds': Credentials}
+        self._refresh_locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, token_file, scopes=None):
+        """
+        Credentials stored in token_file, refreshed if they are about to expire
+
+        Returns:
+            Credentials or None if the file does not exist
+
+        Raises:
+            google.auth.exceptions.RefreshError: If the refresh token was revoked
+        """
+        path = os.path.abspath(token_file)
+        creds = self._load(path, scopes)
+        if creds is not None and self._needs_refresh(creds):
+            creds = self._refresh(path, creds, scopes)
+        return creds
+
+    def save(self, token_file, creds):
+        """Write credentials atomically and keep them as the current ones"""
+        path = os.path.abspath(token_file)
+        directory = os.path.dirname(path)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.token_', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as tmp:
+                tmp.write(creds.to_json())
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._entries[path] = {'mtime': os.stat(path).st_mtime_ns, 'creds': creds}
+
+    def forget(self, token_file):
+        """Delete the token file and its cached credentials"""
+        path = os.path.abspath(token_file)
+        with self._lock:
+            self._entries.pop(path, None)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def migrate_file(self, old_file, token_file):
+        """
+        Move a JSON token file of an older version to token_file
+
+        Does nothing if token_file already exists or there is no old file.
+        """
+        if os.path.exists(token_file) or not os.path.exists(old_file):
+            return
+
+        os.replace(old_file, token_file)
+        logger.info(f"Token {old_file} movido para {token_file}")
+
+    def migrate_pickle(self, pickle_file, token_file):
+        """
+        Convert a legacy pickled token into a JSON token file
+
+        Does nothing if the JSON file already exists or there is no pickle.
+        The pickle is left in place so older deployments can still read it.
+        """
+        if os.path.exists(token_file) or not os.path.exists(pickle_file):
+            return
+
+        with open(pickle_file, 'rb') as token:
+            creds = pickle.load(token)
+        self.save(token_file, creds)
+        logger.info(f"Token {pickle_file} convertido para {token_file}")
+
+    def _load(self, path, scopes):
+        """Cached credentials, re-read when the file changed on disk"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry['mtime'] == mtime:
+                return entry['creds']
+
+        creds = Credentials.from_authorized_user_file(path, scopes)
+        with self._lock:
+            self._entries[path] = {'mtime': mtime, 'creds': creds}
+        return creds
+
+    def _needs_refresh(self, creds):
+        """No token yet, or it expires within the refresh margin"""
+        if not creds.refresh_token:
+            return False
+        if not creds.token:
+            return True
+        if creds.expiry is None:
+            return False
+        margin = timedelta(seconds=GoogleConfig.TOKEN_REFRESH_MARGIN_SECONDS)
+        # google-auth keeps expiry as naive UTC
+        return creds.expiry - datetime.utcnow() < margin
+
+    def _refresh(self, path, creds, scopes):
+        """Refresh once per token file even when many threads ask at the same time"""
+        with self._lock:
+            refresh_lock = self._refresh_locks.setdefault(path, threading.Lock())
+
+        with refresh_lock:
+            # Another thread (or process) may have refreshed while this one waited
+            current = self._load(path, scopes) or creds
+            if not self._needs_refresh(current):
+                return current
+
+            current.refresh(Request())
+            self.save(path, current)
+            logger.info(f"Token Google renovado ({os.path.basename(path)})")
+            return current
+
+
+# Shared by every Google service in the process
+credential_store = CredentialStore()
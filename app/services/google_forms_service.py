@@ -2,7 +2,18 @@
 Google Forms Service - Create and manage Google Forms for events
 """
 
+import hashlib
+import json
+import re
+from datetime import datetime
+from app import db
+from app.constants import GoogleConfig
+from app.models import FormTemplate
 from app.services.google_auth_service import GoogleAuthService
+from app.services.form_field_mapper import form_mappers
+from app.services.form_catalog_cache import form_catalog
+from app.services.google_client_cache import google_clients
+from app.services.google_request_executor import google_requests
 
 
 class GoogleFormsService:
@@ -21,6 +32,38 @@ class GoogleFormsService:
         Returns:
             dict with form_id, form_url, sheet_id, sheet_url
         """
+        result = self.create_event_forms([evento])[0]
+        if 'error' in result:
+            raise Exception(result['error'])
+        return result
+
+    def create_event_forms(self, eventos):
+        """
+        Create the registration forms of several events
+
+        Each form is a Drive copy of the template form of the event's
+        organization and type (see FormTemplate), which already has every
+        question; only its title and description are then set. Events whose
+        template is missing or cannot be copied get a form built from scratch.
+        Copies, creations and updates each go in one batch request, so the
+        number of round trips does not grow with the number of events.
+
+        Args:
+            eventos: Event model instances
+
+        Returns:
+            List aligned with eventos: the dict of create_event_form, or
+            {'error': message} for events whose form could not be created
+        """
+        if any(evento.data_inicio is None for evento in eventos):
+            # Titles and descriptions show the event dates: undated events fail
+            # on their own and the others still go in the batch
+            dated = iter(self.create_event_forms([evento for evento in eventos if evento.data_inicio is not None]))
+            return [
+                next(dated) if evento.data_inicio is not None else {'error': 'O evento não tem data de início'}
+                for evento in eventos
+            ]
+
         forms_service = self.auth_service.get_forms_service()
         sheets_service = self.auth_service.get_sheets_service()
         drive_service = self.auth_service.get_drive_service()
@@ -28,7 +71,75 @@ class GoogleFormsService:
         if not forms_service or not sheets_service:
             raise Exception("Google authentication required")
 
-        # Create the form with event date in title
+        form_ids = {}
+        created = {}
+
+        # Copy the template of each event (one Drive batch)
+        templates = self._get_templates(forms_service, eventos) if drive_service else {}
+        copied = self._execute_batch(drive_service, {
+            index: drive_service.files().copy(
+                fileId=template.form_id,
+                body={'name': self._build_form(eventos[index])['info']['documentTitle']},
+                fields='id'
+            )
+            for index, template in templates.items()
+        }) if templates else {}
+
+        dropped = set()
+        for index, response in copied.items():
+            if not isinstance(response, Exception):
+                form_ids[index] = response['id']
+            elif templates[index].id not in dropped:
+                dropped.add(templates[index].id)
+                self._drop_template(templates[index], response)
+
+        # Full construction for events without a usable template
+        missing = [index for index in range(len(eventos)) if index not in form_ids]
+        if missing:
+            created = self._execute_batch(forms_service, {
+                index: forms_service.forms().create(body=self._build_form(eventos[index]))
+                for index in missing
+            })
+            form_ids.update({index: response['formId'] for index, response in created.items()
+                             if not isinstance(response, Exception)})
+
+        # One batchUpdate per form: title and description, plus the questions
+        # on forms that were not copied from a template
+        updated = self._execute_batch(forms_service, {
+            index: forms_service.forms().batchUpdate(
+                formId=form_id,
+                body=self._build_form_updates(eventos[index], questions=index in created)
+            )
+            for index, form_id in form_ids.items()
+        })
+
+        # New forms must show up in the form list
+        if form_ids:
+            self.invalidate_forms_cache()
+
+        results = []
+        for index in range(len(eventos)):
+            error = created.get(index) if isinstance(created.get(index), Exception) else updated.get(index)
+            if isinstance(error, Exception):
+                results.append({'error': str(error)})
+                continue
+
+            form_id = form_ids[index]
+            # Get form responses spreadsheet ID (if created)
+            # Note: Google Forms automatically creates a spreadsheet when you link it
+            # For now, we'll return None for sheet_id and implement proper linking later
+            results.append({
+                'form_id': form_id,
+                'form_url': f"https://docs.google.com/forms/d/{form_id}/edit",
+                'response_url': f"https://docs.google.com/forms/d/{form_id}/responses",
+                'sheet_id': None,  # Will be set after manual linking or via advanced setup
+                'sheet_url': None
+            })
+
+        return results
+
+    def _build_form(self, evento):
+        """Form resource for forms().create(): title with the event dates"""
         data_str = evento.data_inicio.strftime('%d/%m/%Y')
         if evento.data_fim and evento.data_fim != evento.data_inicio:
             data_str = f"{evento.data_inicio.strftime('%d/%m/%Y')} a {evento.data_fim.strftime('%d/%m/%Y')}"
@@ -36,68 +147,98 @@ class GoogleFormsService:
         form_title = f"Inscrição: {evento.nome} ({data_str})"
         form_doc_title = f"Inscrição_{evento.nome.replace(' ', '_')}_{evento.data_inicio.strftime('%Y%m%d')}"
 
-        form = {
+        return {
             "info": {
                 "title": form_title,
                 "documentTitle": form_doc_title,
             }
         }
 
-        result = forms_service.forms().create(body=form).execute()
-        form_id = result['formId']
-
-        # Add form description
-        update = {
-            "requests": [
-                {
-                    "updateFormInfo": {
-                        "info": {
-                            "description": self._build_form_description(evento)
-                        },
-                        "updateMask": "description"
-                    }
+    def _build_form_updates(self, evento, questions=True):
+        """batchUpdate body setting the title and description and, optionally, adding the questions"""
+        info = self._build_form(evento)['info']
+        requests = [
+            {
+                "updateFormInfo": {
+                    "info": {
+                        "title": info['title'],
+                        "description": self._build_form_description(evento)
+                    },
+                    "updateMask": "title,description"
                 }
-            ]
-        }
-        forms_service.forms().batchUpdate(formId=form_id, body=update).execute()
-
-        # Add form questions
-        questions = self._build_form_questions(evento)
-        forms_service.forms().batchUpdate(formId=form_id, body=questions).execute()
+            }
+        ]
+        if questions:
+            requests += self._build_form_questions(evento)["requests"]
+        return {"requests": requests}
 
-        # Create response spreadsheet
-        sheet_data = {
-            "requests": [
-                {
-                    "createSheet": {
-                        "properties": {
-                            "title": "Respostas",
-                            "gridProperties": {
-                                "rowCount": 1000,
-                                "columnCount": 20
-                            }
-                        }
-                    }
-                }
-            ]
-        }
+    def _get_templates(self, forms_service, eventos):
+        """
+        Template of each event's organization and type, built if missing
 
-        # Link form to spreadsheet (via Drive API)
-        form_url = f"https://docs.google.com/forms/d/{form_id}/edit"
-        response_url = f"https://docs.google.com/forms/d/{form_id}/responses"
+        Returns:
+            Dict event index -> FormTemplate (events without a template are left out)
+        """
+        layout = hashlib.sha256(
+            json.dumps(self._build_form_questions(None), sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+        by_key = {}
+        for key in {(evento.organizacao_id, evento.tipo_evento) for evento in eventos}:
+            organizacao_id, tipo_evento = key
+            template = FormTemplate.query.filter_by(
+                organizacao_id=organizacao_id, tipo_evento=tipo_evento
+            ).order_by(FormTemplate.id.desc()).first()
+
+            if template is None or template.layout != layout:
+                try:
+                    template = self._build_template(forms_service, organizacao_id, tipo_evento, layout, template)
+                except Exception as e:
+                    print(f"Error building form template for {tipo_evento}: {e}")
+                    template = None
 
-        # Get form responses spreadsheet ID (if created)
-        # Note: Google Forms automatically creates a spreadsheet when you link it
-        # For now, we'll return None for sheet_id and implement proper linking later
+            by_key[key] = template
 
         return {
-            'form_id': form_id,
-            'form_url': form_url,
-            'response_url': response_url,
-            'sheet_id': None,  # Will be set after manual linking or via advanced setup
-            'sheet_url': None
+            index: by_key[(evento.organizacao_id, evento.tipo_evento)]
+            for index, evento in enumerate(eventos)
+            if by_key[(evento.organizacao_id, evento.tipo_evento)] is not None
         }
 
+    def _build_template(self, forms_service, organizacao_id, tipo_evento, layout, outdated=None):
+        """Create a template form with every question and store its ID"""
+        result = google_requests.execute(forms_service.forms().create(body={
+            "info": {
+                "title": f"Modelo de inscrição ({tipo_evento})",
+                "documentTitle": f"Modelo_Inscricao_{tipo_evento}_{organizacao_id or 'geral'}",
+            }
+        }))
+        google_requests.execute(forms_service.forms().batchUpdate(
+            formId=result['formId'], body=self._build_form_questions(None)
+        ))
+
+        if outdated is not None:
+            db.session.delete(outdated)
+        template = FormTemplate(organizacao_id=organizacao_id, tipo_evento=tipo_evento,
+                                form_id=result['formId'], layout=layout)
+        db.session.add(template)
+        db.session.commit()
+        # The cached form list may have been loaded before this template existed
+        self.invalidate_forms_cache()
+        return template
+
+    def _drop_template(self, template, error):
+        """Forget a template that is gone or no longer accessible (rebuilt next time)"""
+        print(f"Error copying form template {template.form_id}: {error}")
+        status = getattr(getattr(error, 'resp', None), 'status', None)
+        if status in (403, 404):
+            db.session.delete(template)
+            db.session.commit()
+
+    def _execute_batch(self, service, requests):
+        """Run independent requests of one API as batch requests (see GoogleRequestExecutor.execute_batch)"""
+        return google_requests.execute_batch(service, requests)
+
     def _build_form_description(self, evento):
         """Build form description from event data"""
         description = f"""
@@ -108,7 +249,7 @@ Formulário de inscrição para o evento:
         if evento.data_fim:
             description += f" a {evento.data_fim.strftime('%d/%m/%Y')}"
 
-        description += f"\n⏱️ **Duração**: {evento.duracao_horas} horas\n"
+        description += f"\n⏱️ **Duração**: {evento.duracao_minutos} minutos\n"
 
         if evento.formadora:
             description += f"👩‍🏫 **Formadora**: {evento.formadora}\n"
@@ -216,163 +357,99 @@ Formulário de inscrição para o evento:
             ]
         }
 
-    def get_form_responses(self, form_id):
+    def get_form_responses(self, form_id, since=None, overrides=None):
         """
-        Get all responses from a Google Form
+        Get the responses of a Google Form, following every page
 
         Args:
             form_id: Google Form ID
+            since: Naive UTC datetime; only responses submitted or edited after it
+                   are returned (filtered by the API, so older ones are not downloaded)
+            overrides: Question ID or title -> participant field, applied on top
+                       of the title matching (see FormFieldMapper)
 
         Returns:
-            List of response dictionaries
+            List of response dictionaries, oldest submission first
         """
         forms_service = self.auth_service.get_forms_service()
 
         if not forms_service:
             raise Exception("Google authentication required")
 
-        form = forms_service.forms().get(formId=form_id).execute()
-        responses = forms_service.forms().responses().list(formId=form_id).execute()
-
-        if 'responses' not in responses:
+        responses = list(self._list_responses(forms_service, form_id, since))
+        if not responses:
+            # Nothing new: the form itself is only needed to map answers
             return []
 
-        # Parse responses
-        parsed_responses = []
-        for response in responses.get('responses', []):
-            parsed = self._parse_form_response(response, form)
-            parsed_responses.append(parsed)
-
-        return parsed_responses
-
-    def _parse_form_response(self, response, form):
-        """Parse a single form response"""
-        answers = response.get('answers', {})
-
-        # Map question IDs to titles
-        question_map = {}
-        for item in form.get('items', []):
-            if 'questionItem' in item:
-                question_id = item['questionItem']['question']['questionId']
-                question_map[question_id] = item['title']
-
-        # Extract participant data
-        participant_data = {
-            'response_id': response.get('responseId'),
-            'timestamp': response.get('createTime'),
-            'nome': '',
-            'email': '',
-            'telefone': '',
-            'empresa': '',
-            'observacoes': ''
-        }
+        responses.sort(key=lambda response: response.get('lastSubmittedTime', ''))
+        mapper = self.get_field_mapper(form_id, overrides, forms_service)
+
+        return [mapper.parse(response) for response in responses]
 
-        for question_id, answer in answers.items():
-            question_title = question_map.get(question_id, '')
-            text_answer = answer.get('textAnswers', {}).get('answers', [{}])[0].get('value', '')
-
-            # Map to participant fields
-            if 'nome' in question_title.lower():
-                participant_data['nome'] = text_answer
-            elif 'email' in question_title.lower() or 'e-mail' in question_title.lower():
-                participant_data['email'] = text_answer
-            elif 'telefone' in question_title.lower() or 'telemóvel' in question_title.lower():
-                participant_data['telefone'] = text_answer
-            elif 'empresa' in question_title.lower():
-                participant_data['empresa'] = text_answer
-            elif 'observa' in question_title.lower():
-                participant_data['observacoes'] = text_answer
-
-        return participant_data
-
-    def list_recent_forms(self, limit=100):
+    def get_field_mapper(self, form_id, overrides=None, forms_service=None):
+        """
+        Compiled question -> field mapper for the current revision of a form
+
+        Only the revision ID is requested when the mapper is already cached;
+        the full form (with every item) is downloaded when the form changed.
+        """
+        forms_service = forms_service or self.auth_service.get_forms_service()
+        if not forms_service:
+            raise Exception("Google authentication required")
+
+        revision = google_requests.execute(forms_service.forms().get(formId=form_id, fields='revisionId'))
+        mapper = form_mappers.get(form_id, revision.get('revisionId'), overrides)
+        if mapper is None:
+            form = google_requests.execute(forms_service.forms().get(formId=form_id))
+            mapper = form_mappers.build(form_id, form, overrides)
+        return mapper
+
+    def _list_responses(self, forms_service, form_id, since=None):
+        """Yield raw responses from every page of responses().list()"""
+        params = {'formId': form_id, 'pageSize': GoogleConfig.FORM_RESPONSES_PAGE_SIZE}
+        if since is not None:
+            params['filter'] = f"timestamp > {since.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}"
+
+        while True:
+            page = google_requests.execute(forms_service.forms().responses().list(**params))
+            yield from page.get('responses', [])
+
+            page_token = page.get('nextPageToken')
+            if not page_token:
+                break
+            params['pageToken'] = page_token
+
+    @staticmethod
+    def parse_timestamp(value):
+        """RFC3339 timestamp from the Forms API as a naive UTC datetime (None if empty)"""
+        if not value:
+            return None
+        # The API may send nanoseconds; datetime keeps microseconds
+        match = re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?', value)
+        if not match:
+            return None
+        parsed = datetime.strptime(match.group(1), '%Y-%m-%dT%H:%M:%S')
+        fraction = match.group(2)
+        if fraction:
+            parsed = parsed.replace(microsecond=int(fraction[:6].ljust(6, '0')))
+        return parsed
+
+    def list_recent_forms(self, limit=100, refresh=False):
         """
         List recent Google Forms from Drive
 
+        Served from the in-memory catalog of the account (see FormCatalogCache),
+        reloaded in the background once it is older than the TTL.
+
         Args:
             limit: Maximum number of forms to return (default 100)
+            refresh: Drop the cached catalog and list the forms again
 
         Returns:
             List of dictionaries with form info (id, name, created_time, modified_time, url)
         """
-        drive_service = self.auth_service.get_drive_service()
-
-        if not drive_service:
-            raise Exception("Google authentication required")
-
         try:
-            # Query for Google Forms files
-            # mimeType for Google Forms is 'application/vnd.google-apps.form'
-            query = "mimeType='application/vnd.google-apps.form' and trashed=false"
-
-            all_forms = []
-            page_token = None
-
-            # Paginate through all results up to limit
-            while len(all_forms) < limit:
-                # Try 'user' first (user's drive), then 'allDrives' if needed
-                try:
-                    results = drive_service.files().list(
-                        q=query,
-                        pageSize=min(100, limit - len(all_forms)),
-                        orderBy='modifiedTime desc',
-                        fields='nextPageToken, files(id, name, createdTime, modifiedTime, webViewLink, owners)',
-                        supportsAllDrives=False,
-                        includeItemsFromAllDrives=False,
-                        pageToken=page_token,
-                        corpora='user'  # Search only in user's drive
-                    ).execute()
-                except Exception as e:
-                    print(f"Error with 'user' corpora, trying 'allDrives': {e}")
-                    # Fallback to allDrives if user doesn't work
-                    results = drive_service.files().list(
-                        q=query,
-                        pageSize=min(100, limit - len(all_forms)),
-                        orderBy='modifiedTime desc',
-                        fields='nextPageToken, files(id, name, createdTime, modifiedTime, webViewLink, owners)',
-                        supportsAllDrives=True,
-                        includeItemsFromAllDrives=True,
-                        pageToken=page_token,
-                        corpora='allDrives'
-                    ).execute()
-
-                forms = results.get('files', [])
-                if not forms:
-                    break
-
-                all_forms.extend(forms)
-
-                # Check if there are more pages
-                page_token = results.get('nextPageToken')
-                if not page_token:
-                    break
-
-            # Format the results
-            formatted_forms = []
-            for form in all_forms:
-                # Get owner name if available
-                owner_name = 'Unknown'
-                owners = form.get('owners', [])
-                if owners:
-                    owner_name = owners[0].get('displayName', owners[0].get('emailAddress', 'Unknown'))
-
-                form_name = form.get('name', '')
-
-                # Try to extract date from form name (format: dd/mm/yyyy or yyyy-mm-dd or yyyymmdd)
-                event_date = self._extract_date_from_name(form_name)
-
-                formatted_forms.append({
-                    'id': form.get('id'),
-                    'name': form_name,
-                    'created_time': form.get('createdTime'),
-                    'modified_time': form.get('modifiedTime'),
-                    'url': form.get('webViewLink', f"https://docs.google.com/forms/d/{form.get('id')}/edit"),
-                    'owner': owner_name,
-                    'event_date': event_date  # Extracted date if found
-                })
-
-            print(f"DEBUG - Found {len(formatted_forms)} forms total")
-            return formatted_forms
+            return self._form_catalog(refresh).forms[:limit]
 
         except Exception as e:
             print(f"Error listing forms: {e}")
@@ -384,6 +461,10 @@ Formulário de inscrição para o evento:
         """
         Search Google Forms by name
 
+        Matches words of the form names starting with the words of the search
+        term (accents and case ignored), falling back to a substring match.
+        Searches run against the cached catalog, without calling Drive.
+
         Args:
             search_term: Text to search in form names
             limit: Maximum number of results (default 20)
@@ -391,44 +472,123 @@ Formulário de inscrição para o evento:
         Returns:
             List of dictionaries with form info
         """
+        try:
+            return self._form_catalog().search(search_term, limit)
+
+        except Exception as e:
+            print(f"Error searching forms: {e}")
+            import traceback
+            traceback.print_exc()
+            return []
+
+    def invalidate_forms_cache(self):
+        """Forget the cached form list of the current account"""
+        creds = self.auth_service.get_credentials()
+        if creds:
+            form_catalog.invalidate(google_clients.identity(creds))
+
+    def _form_catalog(self, refresh=False):
+        """Cached FormCatalog of the authenticated account"""
+        creds = self.auth_service.get_credentials()
+        if not creds:
+            raise Exception("Google authentication required")
+
+        account = google_clients.identity(creds)
+        if refresh:
+            form_catalog.invalidate(account)
+        # Read here: background refreshes run without an app context
+        template_ids = {form_id for form_id, in db.session.query(FormTemplate.form_id)}
+        return form_catalog.get(account, lambda: self._fetch_forms(exclude=template_ids))
+
+    def _fetch_forms(self, exclude=()):
+        """
+        All forms of the account in Drive (up to FORM_CATALOG_MAX_FORMS), newest first
+
+        Args:
+            exclude: Form IDs left out (the templates new event forms are copied from)
+        """
         drive_service = self.auth_service.get_drive_service()
 
         if not drive_service:
             raise Exception("Google authentication required")
 
-        try:
-            # Query for Google Forms with name containing search term
-            query = f"mimeType='application/vnd.google-apps.form' and trashed=false and name contains '{search_term}'"
-
-            results = drive_service.files().list(
-                q=query,
-                pageSize=limit,
-                orderBy='modifiedTime desc',
-                fields='files(id, name, createdTime, modifiedTime, webViewLink)',
-                supportsAllDrives=True,
-                includeItemsFromAllDrives=True
-            ).execute()
+        limit = GoogleConfig.FORM_CATALOG_MAX_FORMS
 
-            forms = results.get('files', [])
+        # Query for Google Forms files
+        # mimeType for Google Forms is 'application/vnd.google-apps.form'
+        query = "mimeType='application/vnd.google-apps.form' and trashed=false"
 
-            # Format the results
-            formatted_forms = []
-            for form in forms:
-                formatted_forms.append({
-                    'id': form.get('id'),
-                    'name': form.get('name'),
-                    'created_time': form.get('createdTime'),
-                    'modified_time': form.get('modifiedTime'),
-                    'url': form.get('webViewLink', f"https://docs.google.com/forms/d/{form.get('id')}/edit")
-                })
+        all_forms = []
+        page_token = None
 
-            return formatted_forms
+        # Paginate through all results up to limit
+        while len(all_forms) < limit:
+            # Try 'user' first (user's drive), then 'allDrives' if needed
+            try:
+                results = google_requests.execute(drive_service.files().list(
+                    q=query,
+                    pageSize=min(GoogleConfig.DRIVE_PAGE_SIZE, limit - len(all_forms)),
+                    orderBy='modifiedTime desc',
+                    fields='nextPageToken, files(id, name, createdTime, modifiedTime, webViewLink, owners)',
+                    supportsAllDrives=False,
+                    includeItemsFromAllDrives=False,
+                    pageToken=page_token,
+                    corpora='user'  # Search only in user's drive
+                ))
+            except Exception as e:
+                print(f"Error with 'user' corpora, trying 'allDrives': {e}")
+                # Fallback to allDrives if user doesn't work
+                results = google_requests.execute(drive_service.files().list(
+                    q=query,
+                    pageSize=min(GoogleConfig.DRIVE_PAGE_SIZE, limit - len(all_forms)),
+                    orderBy='modifiedTime desc',
+                    fields='nextPageToken, files(id, name, createdTime, modifiedTime, webViewLink, owners)',
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                    pageToken=page_token,
+                    corpora='allDrives'
+                ))
 
-        except Exception as e:
-            print(f"Error searching forms: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            forms = results.get('files', [])
+            if not forms:
+                break
+
+            all_forms.extend(forms)
+
+            # Check if there are more pages
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        # Format the results
+        formatted_forms = []
+        for form in all_forms:
+            if form.get('id') in exclude:
+                continue
+
+            # Get owner name if available
+            owner_name = 'Unknown'
+            owners = form.get('owners', [])
+            if owners:
+                owner_name = owners[0].get('displayName', owners[0].get('emailAddress', 'Unknown'))
+
+            form_name = form.get('name', '')
+
+            # Try to extract date from form name (format: dd/mm/yyyy or yyyy-mm-dd or yyyymmdd)
+            event_date = self._extract_date_from_name(form_name)
+
+            formatted_forms.append({
+                'id': form.get('id'),
+                'name': form_name,
+                'created_time': form.get('createdTime'),
+                'modified_time': form.get('modifiedTime'),
+                'url': form.get('webViewLink', f"https://docs.google.com/forms/d/{form.get('id')}/edit"),
+                'owner': owner_name,
+                'event_date': event_date  # Extracted date if found
+            })
+
+        print(f"DEBUG - Found {len(formatted_forms)} forms total")
+        return formatted_forms
 
     def get_form_info(self, form_id):
         """
@@ -440,6 +600,21 @@ Formulário de inscrição para o evento:
         Returns:
             Dictionary with form information
         """
+        return self.get_forms_info([form_id]).get(form_id)
+
+    def get_forms_info(self, form_ids):
+        """
+        Get information about several forms
+
+        The Forms and Drive lookups of all forms go in one batch request per
+        API, so this costs two round trips whatever the number of forms.
+
+        Args:
+            form_ids: Google Form IDs
+
+        Returns:
+            Dict form_id -> form information (None for forms that could not be read)
+        """
         forms_service = self.auth_service.get_forms_service()
         drive_service = self.auth_service.get_drive_service()
 
@@ -447,16 +622,36 @@ Formulário de inscrição para o evento:
             raise Exception("Google authentication required")
 
         try:
-            # Get form metadata from Forms API
-            form = forms_service.forms().get(formId=form_id).execute()
+            # Get form metadata from Forms API (item IDs are enough to count questions)
+            forms = self._execute_batch(forms_service, {
+                form_id: forms_service.forms().get(formId=form_id, fields='info,items(itemId)')
+                for form_id in form_ids
+            })
 
             # Get file metadata from Drive API
-            file_metadata = drive_service.files().get(
-                fileId=form_id,
-                fields='id, name, createdTime, modifiedTime, webViewLink'
-            ).execute()
+            files = self._execute_batch(drive_service, {
+                form_id: drive_service.files().get(
+                    fileId=form_id,
+                    fields='id, name, createdTime, modifiedTime, webViewLink'
+                )
+                for form_id in form_ids
+            })
+
+        except Exception as e:
+            print(f"Error getting form info: {e}")
+            import traceback
+            traceback.print_exc()
+            return {form_id: None for form_id in form_ids}
 
-            return {
+        info = {}
+        for form_id in form_ids:
+            form, file_metadata = forms.get(form_id), files.get(form_id)
+            if isinstance(form, Exception) or isinstance(file_metadata, Exception):
+                print(f"Error getting form info: {form if isinstance(form, Exception) else file_metadata}")
+                info[form_id] = None
+                continue
+
+            info[form_id] = {
                 'id': form_id,
                 'title': form.get('info', {}).get('title', ''),
                 'description': form.get('info', {}).get('description', ''),
@@ -467,11 +662,7 @@ Formulário de inscrição para o evento:
                 'question_count': len(form.get('items', []))
             }
 
-        except Exception as e:
-            print(f"Error getting form info: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        return info
 
     def _extract_date_from_name(self, name):
         """
@@ -541,7 +732,8 @@ Formulário de inscrição para o evento:
             raise Exception("Google authentication required")
 
         try:
-            drive_service.files().delete(fileId=form_id).execute()
+            google_requests.execute(drive_service.files().delete(fileId=form_id))
+            self.invalidate_forms_cache()
             return True
         except Exception as e:
             print(f"Error deleting form: {e}")
@@ -0,0 +1,291 @@
+"""
+Google Request Executor - Rate limiting, retries and metrics for Google API requests
+"""
+
+import json
+import logging
+import random
+import socket
+import threading
+import time
+from googleapiclient.errors import HttpError
+from app.constants import GoogleConfig
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Blocking token bucket refilled continuously at rate tokens per second"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Take tokens, sleeping until they are available; returns the seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                # Requests bigger than the bucket (large batches) wait for a full bucket
+                needed = min(tokens, self.capacity)
+                if self._tokens >= needed:
+                    self._tokens -= needed
+                    return waited
+                delay = (needed - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+class GoogleRequestExecutor:
+    """
+    Run googleapiclient requests within the API quotas, retrying transient errors
+
+    Every request first takes a token from the bucket of its API and kind
+    (read or write), sized from GoogleConfig.API_QUOTAS_PER_MINUTE, so bulk
+    operations slow down instead of tripping per-minute quotas. 429, 5xx and
+    rate-limit 403 responses and network errors are retried with exponential
+    backoff and full jitter, waiting at least the Retry-After the API sent.
+    Calls, errors, retries and latency are counted per API method.
+
+    Requests that are not idempotent (POSTs such as forms.create, files.copy
+    or values.append) are only retried when the API rejected them for quota
+    (429 or a rate-limit 403): after a timeout or a 5xx the server may already
+    have applied them, and a retry would create a duplicate.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+
+    # POST methods that overwrite by ID or range, so sending them twice is harmless
+    IDEMPOTENT_METHODS = (
+        'sheets.spreadsheets.values.update',
+        'sheets.spreadsheets.values.batchUpdate',
+        'sheets.spreadsheets.values.clear',
+        'sheets.spreadsheets.values.batchClear',
+        'sheets.spreadsheets.values.batchGet',
+    )
+
+    def __init__(self):
+        self._buckets = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def execute(self, request, idempotent=None):
+        """
+        Execute an HttpRequest (e.g. forms().get(...)) with throttling and retries
+
+        Args:
+            request: googleapiclient HttpRequest
+            idempotent: Whether the request may be sent twice (default: GET,
+                        PUT, DELETE and IDEMPOTENT_METHODS are)
+
+        Raises:
+            HttpError: Non-retryable error, or the last error once retries run out
+        """
+        endpoint = self._endpoint(request)
+        if idempotent is None:
+            idempotent = self._is_idempotent(request)
+        attempt = 0
+
+        while True:
+            self._bucket(request).acquire()
+            started = time.monotonic()
+            try:
+                response = request.execute()
+            except (HttpError, socket.timeout, ConnectionError) as e:
+                self._record(endpoint, started, error=True)
+                delay = self._retry_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+                self._record_retry(endpoint)
+                logger.warning(f"{endpoint} falhou ({e}); nova tentativa em {delay:.1f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self._record(endpoint, started)
+            return response
+
+    def execute_batch(self, service, requests, idempotent=None):
+        """
+        Run independent requests of one API through BatchHttpRequest
+
+        Items failing with a retryable error are sent again in a new batch after
+        the backoff; the others keep their exception. A batch holding requests
+        that are not idempotent is only retried as a whole on quota errors.
+
+        Args:
+            service: Resource whose batch endpoint is used (requests must be of the same API)
+            requests: Dict key -> HttpRequest
+            idempotent: Whether the requests may be sent twice (default: per request, see execute)
+
+        Returns:
+            Dict key -> response, or the exception raised for that request
+        """
+        responses = {}
+        pending = dict(requests)
+        safe = {key: self._is_idempotent(request) if idempotent is None else idempotent
+                for key, request in requests.items()}
+        attempt = 0
+
+        while pending:
+            failed = {}
+            items = list(pending.items())
+
+            for start in range(0, len(items), GoogleConfig.BATCH_MAX_REQUESTS):
+                chunk = items[start:start + GoogleConfig.BATCH_MAX_REQUESTS]
+                keys = {str(position): key for position, (key, _) in enumerate(chunk)}
+
+                def callback(request_id, response, exception, keys=keys):
+                    key = keys[request_id]
+                    responses[key] = exception if exception is not None else response
+                    self._record(self._endpoint(pending[key]), started, error=exception is not None)
+                    if exception is not None and self._retry_delay(exception, attempt, safe[key]) is not None:
+                        failed[key] = exception
+
+                batch = service.new_batch_http_request(callback=callback)
+                for position, (key, request) in enumerate(chunk):
+                    self._bucket(request).acquire()
+                    batch.add(request, request_id=str(position))
+
+                # The batch call itself is retried like a request holding all of its items
+                started = time.monotonic()
+                self._execute_with_retries(batch, 'batch', all(safe[key] for key, _ in chunk))
+
+            if not failed:
+                break
+
+            delay = max(self._retry_delay(error, attempt, safe[key]) for key, error in failed.items())
+            for key in failed:
+                self._record_retry(self._endpoint(pending[key]))
+            logger.warning(f"{len(failed)} pedidos do lote falharam; nova tentativa em {delay:.1f}s")
+            time.sleep(delay)
+            pending = {key: pending[key] for key in failed}
+            attempt += 1
+
+        return responses
+
+    def info(self):
+        """Counters per API method (calls, errors, retries, latency)"""
+        with self._lock:
+            return {
+                endpoint: dict(
+                    stats,
+                    avg_ms=round(stats['total_ms'] / stats['calls'], 1) if stats['calls'] else None,
+                )
+                for endpoint, stats in sorted(self._stats.items())
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def _execute_with_retries(self, batch, endpoint, idempotent):
+        attempt = 0
+        while True:
+            try:
+                return batch.execute()
+            except (HttpError, socket.timeout, ConnectionError) as e:
+                delay = self._retry_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+                self._record_retry(endpoint)
+                time.sleep(delay)
+                attempt += 1
+
+    def _retry_delay(self, error, attempt, idempotent=True):
+        """Seconds to wait before retrying, or None if the error is final"""
+        if attempt >= GoogleConfig.API_MAX_RETRIES:
+            return None
+
+        retry_after = 0.0
+        if not isinstance(error, HttpError):
+            # Timeouts and dropped connections: the request may have been applied
+            if not idempotent:
+                return None
+        else:
+            if not self._is_retryable(error):
+                return None
+            if not idempotent and not self._is_rate_limited(error):
+                return None
+            try:
+                retry_after = float(error.resp.get('retry-after', 0))
+            except (TypeError, ValueError):
+                # HTTP-date form: fall back to the backoff
+                retry_after = 0.0
+
+        backoff = min(GoogleConfig.API_BACKOFF_MAX_SECONDS, GoogleConfig.API_BACKOFF_BASE_SECONDS * 2 ** attempt)
+        return max(retry_after, random.uniform(0, backoff))
+
+    def _is_retryable(self, error):
+        status = error.resp.status
+        if status in self.RETRY_STATUSES:
+            return True
+        return self._is_rate_limited(error)
+
+    def _is_rate_limited(self, error):
+        """429, or a 403 whose reason is a rate limit: the request was not applied"""
+        status = error.resp.status
+        if status == 429:
+            return True
+        if status != 403:
+            return False
+
+        # 403 is only transient when it is a rate limit
+        try:
+            details = json.loads(error.content.decode('utf-8')).get('error', {})
+        except (ValueError, AttributeError):
+            return False
+        reasons = [item.get('reason') for item in details.get('errors', [])]
+        reasons += [item.get('reason') for item in details.get('details', []) if isinstance(item, dict)]
+        return any(reason in self.RATE_LIMIT_REASONS for reason in reasons)
+
+    def _is_idempotent(self, request):
+        method = getattr(request, 'method', 'GET')
+        return method in ('GET', 'HEAD', 'PUT', 'DELETE') or self._endpoint(request) in self.IDEMPOTENT_METHODS
+
+    def _endpoint(self, request):
+        return getattr(request, 'methodId', None) or 'desconhecido'
+
+    def _bucket(self, request):
+        """Bucket of the request's API and kind (GET requests read, the others write)"""
+        api = self._endpoint(request).split('.')[0]
+        kind = 'read' if getattr(request, 'method', 'GET') == 'GET' else 'write'
+        key = (api, kind)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                quotas = GoogleConfig.API_QUOTAS_PER_MINUTE.get(api, GoogleConfig.API_DEFAULT_QUOTA_PER_MINUTE)
+                per_minute = quotas[kind] if isinstance(quotas, dict) else quotas
+                # Bursts of up to 10 seconds of quota, then the steady rate
+                bucket = self._buckets[key] = TokenBucket(per_minute / 60, max(1, per_minute // 6))
+            return bucket
+
+    def _record(self, endpoint, started, error=False):
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {'calls': 0, 'errors': 0, 'retries': 0,
+                                                      'total_ms': 0.0, 'max_ms': 0.0})
+            stats['calls'] += 1
+            stats['errors'] += error
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+
+    def _record_retry(self, endpoint):
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {'calls': 0, 'errors': 0, 'retries': 0,
+                                                      'total_ms': 0.0, 'max_ms': 0.0})
+            stats['retries'] += 1
+
+
+# Shared by every Google service in the process
+google_requests = GoogleRequestExecutor()
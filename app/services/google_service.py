@@ -1,23 +1,25 @@
 import os
-import pickle
-from google.auth.transport.requests import Request
+import re
 from google_auth_oauthlib.flow import InstalledAppFlow
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 import logging
+from app.constants import GoogleConfig
+from .google_auth_service import GoogleAuthService
+from .google_client_cache import google_clients
+from .google_credential_store import credential_store
+from .google_request_executor import google_requests
 
 logger = logging.getLogger(__name__)
 
-# Scopes required for the application
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',  # Read and write spreadsheets
-    'https://www.googleapis.com/auth/drive',  # Access to Drive files
-    'https://www.googleapis.com/auth/forms.body',  # Create and edit forms
-    'https://www.googleapis.com/auth/forms.responses.readonly'  # Read form responses
-]
+# Same token and scopes as the web authorization (GoogleAuthService)
+SCOPES = GoogleAuthService.SCOPES
 
 class GoogleService:
-    def __init__(self, credentials_path='credentials.json', token_path='token.pickle'):
+    # Tokens written by older versions, moved to token_path on first use:
+    # this service's own token file, then the pickled one
+    LEGACY_TOKEN_FILE = 'token_service.json'
+    LEGACY_TOKEN_PATH = 'token.pickle'
+
+    def __init__(self, credentials_path='credentials.json', token_path=GoogleConfig.TOKEN_FILE):
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.creds = None
@@ -27,37 +29,32 @@ class GoogleService:
     def authenticate(self):
         """Authenticate with Google APIs"""
         self.creds = None
-        
-        # Load existing credentials
-        if os.path.exists(self.token_path):
-            with open(self.token_path, 'rb') as token:
-                self.creds = pickle.load(token)
+        credential_store.migrate_file(self.LEGACY_TOKEN_FILE, self.token_path)
+        credential_store.migrate_pickle(self.LEGACY_TOKEN_PATH, self.token_path)
+
+        # Load existing credentials (shared in memory, refreshed before they expire)
+        try:
+            self.creds = credential_store.get(self.token_path)
+        except Exception as e:
+            logger.error(f"Error refreshing token: {e}")
+            self.creds = None
 
-        # Refresh or login if needed
+        # Login if needed
         if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                try:
-                    self.creds.refresh(Request())
-                except Exception as e:
-                    logger.error(f"Error refreshing token: {e}")
-                    self.creds = None
-
-            if not self.creds:
-                if not os.path.exists(self.credentials_path):
-                    raise FileNotFoundError(f"Credentials file not found at {self.credentials_path}")
-                
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_path, SCOPES)
-                self.creds = flow.run_local_server(port=0)
+            if not os.path.exists(self.credentials_path):
+                raise FileNotFoundError(f"Credentials file not found at {self.credentials_path}")
+
+            flow = InstalledAppFlow.from_client_secrets_file(
+                self.credentials_path, SCOPES)
+            self.creds = flow.run_local_server(port=0)
 
             # Save credentials
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(self.creds, token)
+            credential_store.save(self.token_path, self.creds)
 
-        # Build services
-        self.sheets_service = build('sheets', 'v4', credentials=self.creds)
-        self.drive_service = build('drive', 'v3', credentials=self.creds)
-        self.forms_service = build('forms', 'v1', credentials=self.creds)
+        # Reuse the clients already built for this account
+        self.sheets_service = google_clients.get('sheets', 'v4', self.creds)
+        self.drive_service = google_clients.get('drive', 'v3', self.creds)
+        self.forms_service = google_clients.get('forms', 'v1', self.creds)
         
         return True
 
@@ -66,32 +63,159 @@ class GoogleService:
         if not self.drive_service:
             self.authenticate()
 
-        results = self.drive_service.files().list(
+        results = google_requests.execute(self.drive_service.files().list(
             q="mimeType='application/vnd.google-apps.spreadsheet'",
             pageSize=limit,
             fields="nextPageToken, files(id, name, modifiedTime)"
-        ).execute()
+        ))
         
         return results.get('files', [])
 
-    def get_spreadsheet_data(self, spreadsheet_id, range_name='A1:Z1000'):
-        """Read data from a spreadsheet"""
+    def get_spreadsheet_data(self, spreadsheet_id, range_name=None):
+        """Read data from a spreadsheet (the whole first sheet when no range is given)"""
+        if range_name is not None and not self._A1_RANGE.match(range_name):
+            # Named ranges and other forms the chunked reader does not parse
+            if not self.sheets_service:
+                self.authenticate()
+            result = google_requests.execute(self.sheets_service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id, range=range_name))
+            return result.get('values', [])
+
+        first_row = int(self._A1_RANGE.match(range_name or 'A1').group('row1') or 1)
+        rows = []
+        for row_number, row in self.iter_spreadsheet_rows(spreadsheet_id, range_name):
+            # Keep positions: empty rows the reader skips come back as empty lists
+            rows.extend([] for _ in range(row_number - first_row - len(rows)))
+            rows.append(row)
+        return rows
+
+    # A1 range, optionally with a sheet name: 'A2:E', "'Folha 1'!B3:F500", 'A:Z'
+    _A1_RANGE = re.compile(
+        r"^(?:(?P<sheet>'[^']+'|[^!]+)!)?(?P<col1>[A-Za-z]+)(?P<row1>\d+)?"
+        r"(?::(?P<col2>[A-Za-z]+)(?P<row2>\d+)?)?$"
+    )
+
+    def iter_spreadsheet_rows(self, spreadsheet_id, range_name=None, last_column=None,
+                              chunk_rows=GoogleConfig.SHEET_CHUNK_ROWS, sheet=None):
+        """
+        Read a sheet in chunks of rows, yielding rows as each chunk arrives
+
+        The range is clipped to the sheet's real size (gridProperties), so
+        sheets with more than 1000 rows are read in full and small sheets do
+        not request thousands of empty cells. Several chunks go in each
+        values.batchGet call.
+
+        Args:
+            spreadsheet_id: Google Sheets ID
+            range_name: A1 range (e.g. 'A2:E'); default is the whole first sheet
+            last_column: 0-based index of the last column to read when the range
+                         does not end in a column (e.g. from a column mapping)
+            chunk_rows: Rows per chunk
+            sheet: Sheet properties already fetched (see get_sheet_properties);
+                   replaces the sheet named in the range
+
+        Yields:
+            (row_number, row) with 1-based sheet row numbers; rows the API
+            leaves out (empty) are skipped
+        """
+        if not self.sheets_service:
+            self.authenticate()
+
+        match = self._A1_RANGE.match(range_name or 'A1')
+        if not match:
+            raise ValueError(f"Intervalo inválido: {range_name}")
+
+        if sheet is None:
+            sheet = self._sheet_properties(spreadsheet_id, match.group('sheet'))
+        grid = sheet.get('gridProperties', {})
+        title = "'" + sheet['title'].replace("'", "''") + "'"
+
+        first_row = int(match.group('row1') or 1)
+        last_row = min(int(match.group('row2') or grid.get('rowCount', 0)), grid.get('rowCount', 0))
+        first_col = self._column_index(match.group('col1'))
+        if match.group('col2'):
+            last_col = self._column_index(match.group('col2'))
+        elif last_column is not None:
+            last_col = first_col + last_column
+        else:
+            last_col = grid.get('columnCount', 1) - 1
+        last_col = min(last_col, grid.get('columnCount', 1) - 1)
+
+        starts = list(range(first_row, last_row + 1, chunk_rows))
+        per_request = GoogleConfig.SHEET_CHUNKS_PER_REQUEST
+
+        for index in range(0, len(starts), per_request):
+            group = starts[index:index + per_request]
+            ranges = [
+                f"{title}!{self._column_letters(first_col)}{start}:"
+                f"{self._column_letters(last_col)}{min(start + chunk_rows - 1, last_row)}"
+                for start in group
+            ]
+            result = google_requests.execute(self.sheets_service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id, ranges=ranges, majorDimension='ROWS'
+            ))
+
+            for start, value_range in zip(group, result.get('valueRanges', [])):
+                for offset, row in enumerate(value_range.get('values', [])):
+                    if row:
+                        yield start + offset, row
+
+    def get_sheet_properties(self, spreadsheet_id, sheet_id=None):
+        """Properties (sheetId, title, gridProperties) of a sheet by numeric ID, or of the first one"""
         if not self.sheets_service:
             self.authenticate()
+        return self._sheet_properties(spreadsheet_id, sheet_id=sheet_id)
+
+    def _sheet_properties(self, spreadsheet_id, sheet_name=None, sheet_id=None):
+        """Properties (sheetId, title, gridProperties) of the named sheet or of the first one"""
+        metadata = google_requests.execute(self.sheets_service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets(properties(sheetId,title,index,gridProperties(rowCount,columnCount)))'
+        ))
+        sheets = [item['properties'] for item in metadata.get('sheets', [])]
+        if not sheets:
+            raise ValueError("A folha de cálculo não tem folhas")
+
+        if sheet_id is not None:
+            for properties in sheets:
+                if properties.get('sheetId', 0) == sheet_id:
+                    return properties
+            raise ValueError(f"Folha {sheet_id} não encontrada")
+
+        if sheet_name:
+            name = sheet_name[1:-1].replace("''", "'") if sheet_name.startswith("'") else sheet_name
+            for properties in sheets:
+                if properties['title'] == name:
+                    return properties
+            raise ValueError(f"Folha '{name}' não encontrada")
+
+        return min(sheets, key=lambda properties: properties.get('index', 0))
+
+    @staticmethod
+    def _column_index(letters):
+        """'A' -> 0, 'Z' -> 25, 'AA' -> 26"""
+        index = 0
+        for letter in letters.upper():
+            index = index * 26 + ord(letter) - ord('A') + 1
+        return index - 1
 
-        sheet = self.sheets_service.spreadsheets()
-        result = sheet.values().get(spreadsheetId=spreadsheet_id,
-                                  range=range_name).execute()
-        values = result.get('values', [])
-        return values
+    @staticmethod
+    def _column_letters(index):
+        """0 -> 'A', 26 -> 'AA'"""
+        letters = ''
+        index += 1
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            letters = chr(ord('A') + remainder) + letters
+        return letters
 
     def get_spreadsheet_metadata(self, spreadsheet_id):
         """Get spreadsheet metadata (sheet names, etc)"""
         if not self.sheets_service:
             self.authenticate()
             
-        spreadsheet = self.sheets_service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id).execute()
+        spreadsheet = google_requests.execute(self.sheets_service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id))
         return spreadsheet
 
     def create_spreadsheet(self, title, headers=None):
@@ -105,10 +229,10 @@ class GoogleService:
             }
         }
         
-        spreadsheet = self.sheets_service.spreadsheets().create(
+        spreadsheet = google_requests.execute(self.sheets_service.spreadsheets().create(
             body=spreadsheet,
             fields='spreadsheetId'
-        ).execute()
+        ))
         
         spreadsheet_id = spreadsheet.get('spreadsheetId')
         
@@ -127,15 +251,55 @@ class GoogleService:
             'values': values
         }
         
-        result = self.sheets_service.spreadsheets().values().append(
+        result = google_requests.execute(self.sheets_service.spreadsheets().values().append(
             spreadsheetId=spreadsheet_id,
             range=range_name,
             valueInputOption='RAW',
             body=body
-        ).execute()
+        ))
         
         return result
 
+    def update_rows(self, spreadsheet_id, sheet_id, runs, add_rows=0, add_columns=0):
+        """
+        Write runs of rows in one spreadsheets.batchUpdate, growing the grid first if needed
+
+        Values are written as plain text (like valueInputOption RAW); empty
+        strings clear the cell.
+
+        Args:
+            spreadsheet_id: Google Sheets ID
+            sheet_id: ID of the sheet (tab)
+            runs: List of (first row, 1-based; rows of cell values) written from column A
+            add_rows / add_columns: Empty rows/columns appended to the grid before writing
+
+        Returns:
+            Number of cells written
+        """
+        if not runs:
+            return 0
+        if not self.sheets_service:
+            self.authenticate()
+
+        requests = [
+            {'appendDimension': {'sheetId': sheet_id, 'dimension': dimension, 'length': length}}
+            for dimension, length in (('ROWS', add_rows), ('COLUMNS', add_columns)) if length > 0
+        ]
+        growing = bool(requests)
+        for first_row, rows in runs:
+            requests.append({'updateCells': {
+                'start': {'sheetId': sheet_id, 'rowIndex': first_row - 1, 'columnIndex': 0},
+                'rows': [{'values': [{'userEnteredValue': {'stringValue': value}} if value else {}
+                                     for value in row]} for row in rows],
+                'fields': 'userEnteredValue',
+            }})
+
+        # Writing cells twice is harmless; appending rows twice is not
+        google_requests.execute(self.sheets_service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body={'requests': requests}
+        ), idempotent=not growing)
+        return sum(len(row) for _, rows in runs for row in rows)
+
     def create_event_form(self, evento_nome, evento_data, evento_duracao):
         """Create a Google Form for event registration"""
         if not self.forms_service:
@@ -149,7 +313,7 @@ class GoogleService:
             }
         }
         
-        result = self.forms_service.forms().create(body=form).execute()
+        result = google_requests.execute(self.forms_service.forms().create(body=form))
         form_id = result['formId']
         
         # Add description
@@ -204,10 +368,10 @@ class GoogleService:
             ]
         }
         
-        self.forms_service.forms().batchUpdate(
+        google_requests.execute(self.forms_service.forms().batchUpdate(
             formId=form_id,
             body=update
-        ).execute()
+        ))
         
         return form_id
 
@@ -216,7 +380,7 @@ class GoogleService:
         if not self.forms_service:
             self.authenticate()
         
-        result = self.forms_service.forms().responses().list(formId=form_id).execute()
+        result = google_requests.execute(self.forms_service.forms().responses().list(formId=form_id))
         return result.get('responses', [])
 
     def link_form_to_sheet(self, form_id):
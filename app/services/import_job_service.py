@@ -0,0 +1,314 @@
+"""
+Import Job Service - Run spreadsheet imports in the background
+"""
+
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import sqlalchemy as sa
+from flask import current_app
+from app import db
+from app.constants import ImportConfig
+from app.models import ImportJob
+from .excel_import_service import ExcelImportService
+from .participant_upsert_service import ParticipantUpsertService
+
+logger = logging.getLogger(__name__)
+
+# In-process fallback worker, created on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=ImportConfig.WORKER_THREADS,
+                                           thread_name_prefix='import-job')
+        return _executor
+
+
+def _run_in_app_context(app, job_id):
+    """Entry point of the in-process worker threads"""
+    with app.app_context():
+        ImportJobService().run(job_id)
+
+
+class ImportJobService:
+    """
+    Queue and run background imports
+
+    Jobs go to Celery when a broker is configured (CELERY_BROKER_URL), otherwise
+    to a small thread pool inside the web process. Either way the job row in
+    import_jobs holds the progress counters polled by /api/imports/<job_id>.
+
+    Participant imports can run as a dry run: the job stops in
+    'pre_visualizacao' with the diff against the event stored in job.plan,
+    and confirm() queues it again to apply that diff without re-reading the source.
+    """
+
+    TIPO_EXCEL_EVENTO = 'excel_evento'
+    TIPO_EXCEL_PARTICIPANTES = 'excel_participantes'
+    TIPO_SHEET_PARTICIPANTES = 'sheet_participantes'
+
+    def enqueue(self, tipo, source, evento_id=None, organizacao_id=None, params=None, dry_run=False):
+        """
+        Create an import job and hand it to a worker
+
+        Args:
+            tipo: Job type (TIPO_* constant)
+            source: Stored upload path or spreadsheet ID
+            evento_id: Target event (participant imports)
+            organizacao_id: Organization for new events (event imports)
+            params: Extra options for the runner (JSON-serializable)
+            dry_run: Only compute the diff (participant imports); apply it with confirm()
+
+        Returns:
+            ImportJob
+        """
+        job = ImportJob(
+            id=uuid.uuid4().hex,
+            tipo=tipo,
+            source=source,
+            evento_id=evento_id,
+            organizacao_id=organizacao_id,
+            params=dict(params or {}, dry_run=True) if dry_run else (params or {})
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        self._dispatch(job)
+        logger.info(f"Importação {job.id} ({tipo}) em fila")
+        return job
+
+    def confirm(self, job_id):
+        """
+        Apply the diff of a dry run
+
+        Returns:
+            ImportJob (None if it does not exist)
+
+        Raises:
+            ValueError: If the job is not waiting for confirmation or the preview expired
+        """
+        job = db.session.get(ImportJob, job_id)
+        if job is None:
+            return None
+
+        if job.status != 'pre_visualizacao':
+            raise ValueError('Esta importação não está a aguardar confirmação')
+
+        if job.finished_at < datetime.utcnow() - timedelta(seconds=ImportConfig.PREVIEW_TTL_SECONDS):
+            raise ValueError('A pré-visualização expirou. Importe o ficheiro novamente.')
+
+        # Conditional update: a double click must not apply the diff twice
+        claimed = db.session.execute(
+            sa.update(ImportJob)
+            .where(ImportJob.id == job_id, ImportJob.status == 'pre_visualizacao')
+            .values(status='pendente', started_at=None, finished_at=None)
+        ).rowcount
+        db.session.commit()
+        if not claimed:
+            raise ValueError('Esta importação não está a aguardar confirmação')
+
+        db.session.refresh(job)
+        self._dispatch(job)
+        logger.info(f"Importação {job.id} confirmada")
+        return job
+
+    def cancel(self, job_id):
+        """
+        Discard the diff of a dry run
+
+        Returns:
+            ImportJob (None if it does not exist)
+
+        Raises:
+            ValueError: If the job is not waiting for confirmation
+        """
+        job = db.session.get(ImportJob, job_id)
+        if job is None:
+            return None
+
+        if job.status != 'pre_visualizacao':
+            raise ValueError('Esta importação não está a aguardar confirmação')
+
+        job.status = 'cancelado'
+        job.plan = None
+        db.session.commit()
+        return job
+
+    def get(self, job_id):
+        """Get a job by ID (None if it does not exist)"""
+        return db.session.get(ImportJob, job_id)
+
+    def _dispatch(self, job):
+        """Hand a pending job to Celery or the in-process pool"""
+        app = current_app._get_current_object()
+        celery_app = app.extensions.get('celery')
+        if celery_app is not None:
+            from app.tasks import run_import_job
+            run_import_job.delay(job.id)
+        else:
+            _get_executor().submit(_run_in_app_context, app, job.id)
+
+    def run(self, job_id):
+        """Run a queued job (called by the worker inside an app context)"""
+        job = db.session.get(ImportJob, job_id)
+        if job is None or job.status != 'pendente':
+            return
+
+        job.status = 'a_processar'
+        job.started_at = datetime.utcnow()
+        db.session.commit()
+
+        runners = {
+            self.TIPO_EXCEL_EVENTO: self._run_excel_evento,
+            self.TIPO_EXCEL_PARTICIPANTES: self._run_excel_participantes,
+            self.TIPO_SHEET_PARTICIPANTES: self._run_sheet_participantes,
+        }
+
+        # A confirmed dry run applies its stored diff
+        runner = self._run_confirmed if job.plan is not None else runners[job.tipo]
+
+        try:
+            job.result = runner(job)
+            job.status = 'pre_visualizacao' if job.plan is not None else 'concluido'
+        except Exception as e:
+            logger.error(f"Importação {job_id} falhou: {e}")
+            db.session.rollback()
+            job = db.session.get(ImportJob, job_id)
+            job.status = 'erro'
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.utcnow()
+            db.session.commit()
+
+    def _save_progress(self, job, **counters):
+        """Store progress counters (rows_parsed=..., rows_inserted=...)"""
+        for name, value in counters.items():
+            setattr(job, name, value)
+        db.session.commit()
+
+    def _apply_stats(self, job, stats):
+        """Copy upsert statistics into the job counters (committed with the import)"""
+        job.rows_inserted = stats['imported'] + stats['reactivated']
+        job.rows_updated = stats['updated']
+        job.rows_skipped = stats['skipped']
+        job.rows_errored = stats['errors']
+
+    def _run_excel_evento(self, job):
+        """Create events and participants from an uploaded Excel file"""
+        excel_service = ExcelImportService()
+        data = excel_service.parse_excel_file(job.source)
+
+        events = data['events'] if 'events' in data else [data]
+        self._save_progress(job, rows_parsed=sum(len(item['participants']) for item in events))
+
+        created = excel_service.create_events(data, job.organizacao_id or 1, commit=False)
+
+        job.rows_inserted = created['participantes']
+        job.rows_skipped = created['ignorados']
+        job.rows_errored = created['erros']
+        if len(created['eventos']) == 1:
+            job.evento_id = created['eventos'][0]
+
+        if 'events' in data:
+            message = f"{len(created['eventos'])} eventos criados com sucesso! {created['participantes']} participantes importados."
+        else:
+            message = f"Evento criado com sucesso! {created['participantes']} participantes importados."
+
+        return {'message': message, 'avisos': created['avisos'], **created}
+
+    def _run_excel_participantes(self, job):
+        """Import participants from an uploaded Excel file into an existing event"""
+        participants = ExcelImportService().iter_participants_only(job.source)
+        plan = ParticipantUpsertService().plan(job.evento_id, self._track_progress(job, participants))
+
+        job.rows_parsed = plan['total_rows']
+        # Rows without a name never reach the plan, so invalid ones are those without email
+        if len(plan['invalid']) == plan['total_rows']:
+            raise ValueError('Nenhum participante com email encontrado no ficheiro')
+
+        return self._preview_or_apply(job, plan)
+
+    def _run_sheet_participantes(self, job):
+        """Import participants from a Google Sheet into an existing event"""
+        from .participant_import_service import ParticipantImportService
+
+        params = job.params or {}
+        plan = ParticipantImportService().import_from_sheet(
+            job.source, job.evento_id,
+            sheet_range=params.get('range'),
+            # JSON keys are strings
+            column_mapping={int(k): v for k, v in params['column_mapping'].items()},
+            skip_duplicates=params.get('skip_duplicates', True),
+            dry_run=True
+        )
+
+        job.rows_parsed = plan['total_rows']
+        return self._preview_or_apply(job, plan)
+
+    def _run_confirmed(self, job):
+        """Apply the diff stored by a dry run"""
+        stats = ParticipantUpsertService().apply(job.evento_id, job.plan, commit=False)
+        job.plan = None
+        self._apply_stats(job, stats)
+        return self._participants_result(stats)
+
+    def _track_progress(self, job, records):
+        """Pass records through, saving the parsed-row counter every few hundred rows"""
+        for parsed, record in enumerate(records, start=1):
+            if parsed % ImportConfig.PROGRESS_EVERY_ROWS == 0:
+                self._save_progress(job, rows_parsed=parsed)
+            yield record
+
+    def _preview_or_apply(self, job, plan):
+        """Store the plan for confirmation (dry run) or write it now"""
+        upsert_service = ParticipantUpsertService()
+
+        if (job.params or {}).get('dry_run'):
+            job.plan = upsert_service.to_json(plan)
+            preview = upsert_service.summarize(plan)
+            counts = [
+                f"{preview['new']['count']} novos",
+                f"{preview['reactivate']['count']} a reativar",
+                f"{preview['update']['count']} a atualizar",
+                f"{preview['unchanged']['count']} sem alterações",
+                f"{preview['duplicates']['count']} duplicados no ficheiro",
+                f"{preview['invalid']['count']} inválidos",
+            ]
+            return {'message': f'Pré-visualização: {", ".join(counts)}', 'preview': preview}
+
+        stats = upsert_service.apply(job.evento_id, plan, commit=False)
+        self._apply_stats(job, stats)
+        return self._participants_result(stats)
+
+    def _participants_result(self, stats):
+        """Result message of a participant import"""
+        message_parts = []
+        if stats['imported'] > 0:
+            message_parts.append(f"{stats['imported']} novos participantes adicionados")
+        if stats['reactivated'] > 0:
+            message_parts.append(f"{stats['reactivated']} participantes reativados")
+        if stats['updated'] > 0:
+            message_parts.append(f"{stats['updated']} participantes atualizados")
+
+        invalid = stats['errors']
+        duplicates = stats.get('duplicates', 0)
+        existing = stats['skipped'] - duplicates
+        if existing > 0:
+            message_parts.append(f"{existing} já existentes (ignorados)")
+        if duplicates > 0:
+            message_parts.append(f"{duplicates} duplicados no ficheiro")
+
+        avisos = []
+        if invalid > 0:
+            avisos.append(f'⚠️ {invalid} participantes sem nome ou email foram ignorados')
+
+        message = f'✓ Importação concluída: {", ".join(message_parts)}' if message_parts \
+            else '✓ Importação concluída: nenhuma alteração'
+        return {'message': message, 'avisos': avisos, 'stats': stats}
@@ -0,0 +1,76 @@
+"""
+Parse Cache - In-memory LRU + TTL cache of parsed uploads keyed by content hash
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from app.constants import ImportConfig
+
+
+class ParseCache:
+    """
+    Thread-safe LRU cache with a time-to-live
+
+    Entries are weighted by their number of rows so one huge workbook cannot
+    hold more than max_rows in memory; least recently used entries go first.
+    """
+
+    def __init__(self, max_entries=ImportConfig.PARSE_CACHE_MAX_ENTRIES,
+                 max_rows=ImportConfig.PARSE_CACHE_MAX_ROWS,
+                 ttl_seconds=ImportConfig.PARSE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, rows, value)
+        self._rows = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Cached value or None (expired entries are dropped)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key, value, rows):
+        """Store a value; values bigger than max_rows are not cached"""
+        if rows > self.max_rows:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, rows, value)
+            self._rows += rows
+
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+
+    def info(self):
+        """Size and hit statistics"""
+        with self._lock:
+            return {'entries': len(self._entries), 'rows': self._rows, 'hits': self.hits, 'misses': self.misses}
+
+    def _remove(self, key):
+        _, rows, _ = self._entries.pop(key)
+        self._rows -= rows
+
+
+# Shared by every ExcelImportService in the process
+parse_cache = ParseCache()
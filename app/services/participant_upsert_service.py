@@ -0,0 +1,344 @@
+"""
+Participant Upsert Service - Set-based import of participants into an event
+"""
+
+import logging
+from datetime import datetime
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+from app import db
+from app.models import Participant
+
+logger = logging.getLogger(__name__)
+
+
+class ParticipantUpsertService:
+    """
+    Bulk insert/update of participants shared by every importer
+
+    Existing participants of the event are loaded with a single query and the
+    incoming rows are normalized and deduplicated in memory. New rows are then
+    written with one executemany INSERT (ON CONFLICT DO NOTHING where the
+    database supports it), and reactivations and updates with one executemany
+    UPDATE each, all inside one transaction.
+    """
+
+    # Optional fields copied from the incoming rows
+    FIELDS = ('telefone', 'empresa', 'observacoes')
+
+    # What to do with rows whose email is already active in the event
+    ON_EXISTING_SKIP = 'skip'
+    ON_EXISTING_UPDATE = 'update'
+
+    def upsert(self, event_id, records, status='pendente', on_existing=ON_EXISTING_SKIP,
+               reactivate=True, stats=None, commit=True):
+        """
+        Import participants into an event in one transaction
+
+        Args:
+            event_id: Event ID to associate participants with
+            records: Iterable of dicts with nome, email and optionally telefone, empresa, observacoes
+            status: Status given to new participants
+            on_existing: 'skip' leaves active participants untouched, 'update' overwrites their data
+            reactivate: If True, soft-deleted participants are restored with the incoming data;
+                        if False they are handled like active ones
+            stats: Stats dict to update in place (e.g. with rows already skipped by the caller)
+            commit: Commit the transaction at the end (False lets the caller commit)
+
+        Returns:
+            dict with import statistics (total_rows, imported, reactivated, updated,
+            skipped, duplicates, errors, error_details)
+        """
+        plan = self.plan(event_id, records, on_existing=on_existing, reactivate=reactivate)
+        return self.apply(event_id, plan, status=status, stats=stats, commit=commit)
+
+    def plan(self, event_id, records, on_existing=ON_EXISTING_SKIP, reactivate=True):
+        """
+        Compare incoming rows with the event's participants without writing
+
+        Returns:
+            dict with lists 'new', 'reactivate', 'update', 'unchanged', 'duplicates'
+            and 'invalid'; 'total_rows' is the number of incoming rows. Entries
+            in 'update' carry 'changes' ({field: [current, incoming]})
+        """
+        plan = {
+            'total_rows': 0,
+            'new': [],
+            'reactivate': [],
+            'update': [],
+            'unchanged': [],
+            'duplicates': [],
+            'invalid': [],
+        }
+
+        incoming = self._collect(records, on_existing, plan)
+
+        if not incoming:
+            return plan
+
+        existing = self._load_existing(event_id)
+
+        for key, data in incoming.items():
+            current = existing.get(key)
+
+            if current is None:
+                plan['new'].append(data)
+                continue
+
+            if current['deleted_at'] is not None and reactivate:
+                plan['reactivate'].append(self._merge(current, data))
+                continue
+
+            if on_existing != self.ON_EXISTING_UPDATE:
+                plan['unchanged'].append(current)
+                continue
+
+            merged = self._merge(current, data)
+            changes = {field: [current[field], merged[field]] for field in ('nome',) + self.FIELDS
+                       if merged[field] != current[field]}
+            if changes:
+                merged['changes'] = changes
+                plan['update'].append(merged)
+            else:
+                plan['unchanged'].append(current)
+
+        return plan
+
+    def insert_new_events(self, records_by_event, status='pendente', commit=True):
+        """
+        Insert the participants of events that were just created
+
+        There is nothing to compare against, so rows are only normalized and
+        deduplicated, and all events are written with a single executemany INSERT.
+
+        Args:
+            records_by_event: Iterable of (event_id, records) pairs
+            status: Status given to the participants
+            commit: Commit the transaction at the end (False lets the caller commit)
+
+        Returns:
+            dict with import statistics (total_rows, imported, skipped, errors,
+            duplicates, error_details)
+        """
+        stats = {'total_rows': 0, 'imported': 0, 'skipped': 0, 'errors': 0, 'duplicates': 0, 'error_details': []}
+        now = datetime.utcnow()
+
+        rows = []
+        for event_id, records in records_by_event:
+            plan = {'total_rows': 0, 'duplicates': [], 'invalid': []}
+            for data in self._collect(records, self.ON_EXISTING_SKIP, plan).values():
+                rows.append(self._insert_values(event_id, data, status, now))
+
+            stats['total_rows'] += plan['total_rows']
+            stats['duplicates'] += len(plan['duplicates'])
+            stats['skipped'] += len(plan['duplicates'])
+            stats['errors'] += len(plan['invalid'])
+            stats['error_details'].extend(dict(item, evento_id=event_id) for item in plan['invalid'])
+
+        try:
+            if rows:
+                db.session.execute(sa.insert(Participant.__table__), rows)
+                stats['imported'] = len(rows)
+
+            if commit:
+                db.session.commit()
+
+        except Exception:
+            db.session.rollback()
+            raise
+
+        return stats
+
+    def apply(self, event_id, plan, status='pendente', stats=None, commit=True):
+        """
+        Write a plan built by plan()
+
+        Returns:
+            dict with import statistics; invalid rows count in 'errors'
+            (see 'error_details'), unchanged and duplicate rows in 'skipped'
+        """
+        if stats is None:
+            stats = {}
+        stats.setdefault('total_rows', plan['total_rows'])
+        for key in ('imported', 'reactivated', 'updated', 'skipped', 'duplicates', 'errors'):
+            stats.setdefault(key, 0)
+        stats.setdefault('error_details', [])
+
+        now = datetime.utcnow()
+
+        try:
+            if plan['new']:
+                rows = [self._insert_values(event_id, data, status, now) for data in plan['new']]
+                result = db.session.execute(self._insert_statement(), rows)
+                inserted = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(rows)
+                stats['imported'] += inserted
+                # Rows another request inserted meanwhile are left alone
+                stats['skipped'] += len(rows) - inserted
+
+            if plan['reactivate']:
+                db.session.execute(sa.update(Participant), [
+                    dict(self._update_values(data, now), deleted_at=None) for data in plan['reactivate']
+                ])
+                stats['reactivated'] += len(plan['reactivate'])
+
+            if plan['update']:
+                db.session.execute(sa.update(Participant), [
+                    self._update_values(data, now) for data in plan['update']
+                ])
+                stats['updated'] += len(plan['update'])
+
+            stats['skipped'] += len(plan['unchanged']) + len(plan['duplicates'])
+            stats['duplicates'] += len(plan['duplicates'])
+            # Rows without name or email are errors, listed in error_details
+            stats['errors'] += len(plan['invalid'])
+            stats['error_details'].extend(plan['invalid'])
+
+            if commit:
+                db.session.commit()
+
+        except Exception:
+            db.session.rollback()
+            raise
+
+        logger.info(
+            f"Importação evento {event_id}: {stats['imported']} novos, {stats['reactivated']} reativados, "
+            f"{stats['updated']} atualizados, {stats['skipped']} ignorados, {stats['errors']} inválidos"
+        )
+        return stats
+
+    def to_json(self, plan):
+        """
+        JSON-serializable copy of a plan, e.g. to store a dry run until it is confirmed
+
+        apply() accepts the copy as is.
+        """
+        def participant(data):
+            return {key: value for key, value in data.items() if key != 'deleted_at'}
+
+        return {
+            'total_rows': plan['total_rows'],
+            'new': plan['new'],
+            'reactivate': [participant(data) for data in plan['reactivate']],
+            'update': [participant(data) for data in plan['update']],
+            'unchanged': [{'id': data['id'], 'nome': data['nome'], 'email': data['email']}
+                          for data in plan['unchanged']],
+            'duplicates': plan['duplicates'],
+            'invalid': [dict(item, data=self._json_row(item.get('data'))) for item in plan['invalid']],
+        }
+
+    def summarize(self, plan, sample=20):
+        """Counts per category and the first rows of each, for a dry-run preview"""
+        summary = {'total_rows': plan['total_rows']}
+        for category in ('new', 'reactivate', 'update', 'unchanged', 'duplicates', 'invalid'):
+            rows = plan[category]
+            summary[category] = {
+                'count': len(rows),
+                'sample': [self._json_row(row) for row in rows[:sample]],
+            }
+        return summary
+
+    def _json_row(self, row):
+        """Row data with values JSON can hold (dates and other objects as text)"""
+        if isinstance(row, dict):
+            return {key: self._json_row(value) for key, value in row.items() if key != 'deleted_at'}
+        if isinstance(row, (list, tuple)):
+            return [self._json_row(value) for value in row]
+        if row is None or isinstance(row, (str, int, float, bool)):
+            return row
+        return str(row)
+
+    def _collect(self, records, on_existing, plan):
+        """
+        Normalize incoming rows and drop invalid and repeated ones
+
+        Counts rows in plan['total_rows'] and appends to plan['invalid'] and
+        plan['duplicates']; returns the remaining rows keyed by lowercased email.
+        """
+        incoming = {}
+        for row_number, record in enumerate(records, start=1):
+            plan['total_rows'] += 1
+            data = self._normalize(record)
+
+            if not data.get('nome') or not data.get('email'):
+                plan['invalid'].append({'row': row_number, 'error': 'Nome ou email em falta', 'data': record})
+                continue
+
+            key = data['email'].lower()
+            if key in incoming:
+                # Same email twice in the file: first row wins, later rows only
+                # fill in fields when existing participants are being updated
+                if on_existing == self.ON_EXISTING_UPDATE:
+                    incoming[key].update({field: value for field, value in data.items() if field != 'email'})
+                plan['duplicates'].append({'row': row_number, 'email': data['email']})
+                continue
+
+            incoming[key] = data
+
+        return incoming
+
+    def _normalize(self, record):
+        """Strip text values and drop empty ones"""
+        data = {}
+        for field in ('nome', 'email') + self.FIELDS:
+            value = record.get(field)
+            if value is None:
+                continue
+            value = str(value).strip()
+            if value:
+                data[field] = value
+        return data
+
+    def _load_existing(self, event_id):
+        """All participants of the event (active or not), keyed by lowercased email"""
+        rows = db.session.execute(
+            sa.select(
+                Participant.id, Participant.email, Participant.nome, Participant.telefone,
+                Participant.empresa, Participant.observacoes, Participant.deleted_at
+            ).where(Participant.evento_id == event_id)
+        ).mappings()
+
+        existing = {}
+        for row in rows:
+            existing.setdefault(row['email'].strip().lower(), dict(row))
+        return existing
+
+    def _merge(self, current, data):
+        """Current participant values overridden by the non-empty incoming ones"""
+        merged = dict(current)
+        merged['nome'] = data['nome']
+        for field in self.FIELDS:
+            if field in data:
+                merged[field] = data[field]
+        return merged
+
+    def _insert_values(self, event_id, data, status, now):
+        """Parameters for the executemany INSERT of a new participant"""
+        return {
+            'evento_id': event_id,
+            'nome': data['nome'],
+            'email': data['email'],
+            'telefone': data.get('telefone'),
+            'empresa': data.get('empresa'),
+            'observacoes': data.get('observacoes'),
+            'status': status,
+            'created_at': now,
+            'updated_at': now,
+        }
+
+    def _update_values(self, merged, now):
+        """Parameters for the executemany UPDATE (primary key + changed columns)"""
+        values = {field: merged[field] for field in ('nome',) + self.FIELDS}
+        values['id'] = merged['id']
+        values['updated_at'] = now
+        return values
+
+    def _insert_statement(self):
+        """INSERT that ignores rows hitting the (email, evento_id) unique constraint"""
+        dialect = db.engine.dialect.name
+        if dialect == 'sqlite':
+            return sqlite.insert(Participant.__table__).on_conflict_do_nothing(
+                index_elements=['email', 'evento_id'])
+        if dialect == 'postgresql':
+            return postgresql.insert(Participant.__table__).on_conflict_do_nothing(
+                index_elements=['email', 'evento_id'])
+        return sa.insert(Participant.__table__)
@@ -0,0 +1,313 @@
+"""
+Search Service - Full-text search over participants and events (SQLite FTS5)
+"""
+
+import logging
+import re
+from app import db
+from app.models import Event, Participant
+
+logger = logging.getLogger(__name__)
+
+# External-content FTS5 tables: the index stores only tokens, rows live in the
+# base tables. Triggers keep both in step on insert/update/delete.
+SEARCH_INDEX_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS participants_fts USING fts5(
+        nome, email, empresa, observacoes,
+        content='participants', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS participants_fts_ai AFTER INSERT ON participants BEGIN
+        INSERT INTO participants_fts(rowid, nome, email, empresa, observacoes)
+        VALUES (new.id, new.nome, new.email, new.empresa, new.observacoes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS participants_fts_ad AFTER DELETE ON participants BEGIN
+        INSERT INTO participants_fts(participants_fts, rowid, nome, email, empresa, observacoes)
+        VALUES ('delete', old.id, old.nome, old.email, old.empresa, old.observacoes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS participants_fts_au
+    AFTER UPDATE OF nome, email, empresa, observacoes ON participants BEGIN
+        INSERT INTO participants_fts(participants_fts, rowid, nome, email, empresa, observacoes)
+        VALUES ('delete', old.id, old.nome, old.email, old.empresa, old.observacoes);
+        INSERT INTO participants_fts(rowid, nome, email, empresa, observacoes)
+        VALUES (new.id, new.nome, new.email, new.empresa, new.observacoes);
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        nome, local, formadora,
+        content='events', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, nome, local, formadora)
+        VALUES (new.id, new.nome, new.local, new.formadora);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, nome, local, formadora)
+        VALUES ('delete', old.id, old.nome, old.local, old.formadora);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF nome, local, formadora ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, nome, local, formadora)
+        VALUES ('delete', old.id, old.nome, old.local, old.formadora);
+        INSERT INTO events_fts(rowid, nome, local, formadora)
+        VALUES (new.id, new.nome, new.local, new.formadora);
+    END
+    """,
+]
+
+# Column weights for bm25(): a hit on the name ranks above a hit in the notes
+PARTICIPANT_WEIGHTS = '10.0, 5.0, 2.0, 1.0'
+EVENT_WEIGHTS = '10.0, 3.0, 3.0'
+
+PARTICIPANT_SEARCH_SQL = f"""
+    SELECT p.id, p.nome, p.email, p.empresa, p.status, p.evento_id,
+           e.nome AS evento_nome, e.data_inicio AS evento_data,
+           bm25(participants_fts, {PARTICIPANT_WEIGHTS}) AS rank
+    FROM participants_fts
+    JOIN participants p ON p.id = participants_fts.rowid
+    JOIN events e ON e.id = p.evento_id
+    WHERE participants_fts MATCH :match
+      AND p.deleted_at IS NULL AND e.deleted_at IS NULL
+      AND e.organizacao_id = :org
+    ORDER BY rank
+    LIMIT :limit OFFSET :offset
+"""
+
+PARTICIPANT_COUNT_SQL = """
+    SELECT count(*)
+    FROM participants_fts
+    JOIN participants p ON p.id = participants_fts.rowid
+    JOIN events e ON e.id = p.evento_id
+    WHERE participants_fts MATCH :match
+      AND p.deleted_at IS NULL AND e.deleted_at IS NULL
+      AND e.organizacao_id = :org
+"""
+
+EVENT_SEARCH_SQL = f"""
+    SELECT e.id, e.nome, e.local, e.formadora, e.data_inicio,
+           bm25(events_fts, {EVENT_WEIGHTS}) AS rank
+    FROM events_fts
+    JOIN events e ON e.id = events_fts.rowid
+    WHERE events_fts MATCH :match AND e.deleted_at IS NULL
+      AND e.organizacao_id = :org
+    ORDER BY rank
+    LIMIT :limit OFFSET :offset
+"""
+
+EVENT_COUNT_SQL = """
+    SELECT count(*)
+    FROM events_fts
+    JOIN events e ON e.id = events_fts.rowid
+    WHERE events_fts MATCH :match AND e.deleted_at IS NULL
+      AND e.organizacao_id = :org
+"""
+
+
+class SearchService:
+    """Service to index and search participants and events"""
+
+    def is_supported(self):
+        """FTS5 is only available on SQLite"""
+        return db.engine.dialect.name == 'sqlite'
+
+    def ensure_index(self):
+        """
+        Create the FTS tables and triggers if missing
+
+        The index is rebuilt from the base tables the first time it is created,
+        so existing databases get searchable without a separate step.
+
+        Returns:
+            True if the index was created now, False if it already existed
+        """
+        if not self.is_supported():
+            return False
+
+        with db.engine.begin() as conn:
+            existing = conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'participants_fts'"
+            ).first()
+
+            for statement in SEARCH_INDEX_DDL:
+                conn.exec_driver_sql(statement)
+
+            if existing is None:
+                conn.exec_driver_sql("INSERT INTO participants_fts(participants_fts) VALUES ('rebuild')")
+                conn.exec_driver_sql("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+                logger.info("Índice de pesquisa criado")
+                return True
+
+        return False
+
+    def rebuild_index(self):
+        """Rebuild both FTS indexes from the base tables"""
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql("INSERT INTO participants_fts(participants_fts) VALUES ('rebuild')")
+            conn.exec_driver_sql("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+
+    def search(self, query, organizacao_id, page=1, per_page=20, scope='all'):
+        """
+        Ranked full-text search
+
+        Args:
+            query: Free text typed by the user (each word is a prefix match)
+            organizacao_id: Organization whose participants and events are searched
+            page: 1-based page number
+            per_page: Hits per page
+            scope: 'participants', 'events' or 'all'
+
+        Returns:
+            dict with 'participants' and/or 'events', each with
+            items, total, page and pages
+        """
+        match = self._build_match(query)
+        page = max(page, 1)
+        per_page = max(min(per_page, 100), 1)
+
+        results = {}
+        if scope in ('all', 'participants'):
+            results['participants'] = self._search_participants(match, organizacao_id, page, per_page)
+        if scope in ('all', 'events'):
+            results['events'] = self._search_events(match, organizacao_id, page, per_page)
+
+        return results
+
+    def _build_match(self, query):
+        """
+        Turn free text into a safe FTS5 MATCH expression
+
+        Punctuation is dropped (so e-mails split into their parts) and every
+        token becomes a quoted prefix term, ANDed together.
+        """
+        tokens = re.findall(r'\w+', query or '', re.UNICODE)
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+    def _search_participants(self, match, organizacao_id, page, per_page):
+        if not match:
+            return self._page([], 0, page, per_page)
+
+        if not self.is_supported():
+            return self._fallback_participants(match, organizacao_id, page, per_page)
+
+        params = {'match': match, 'org': organizacao_id, 'limit': per_page, 'offset': (page - 1) * per_page}
+
+        rows = db.session.execute(
+            db.text(PARTICIPANT_SEARCH_SQL), params
+        ).mappings().all()
+        total = db.session.execute(
+            db.text(PARTICIPANT_COUNT_SQL), params
+        ).scalar()
+
+        items = [{
+            'id': row['id'],
+            'nome': row['nome'],
+            'email': row['email'],
+            'empresa': row['empresa'],
+            'status': row['status'],
+            'evento_id': row['evento_id'],
+            'evento_nome': row['evento_nome'],
+            'evento_data': str(row['evento_data']) if row['evento_data'] else None,
+            'score': round(-row['rank'], 4),
+        } for row in rows]
+
+        return self._page(items, total, page, per_page)
+
+    def _search_events(self, match, organizacao_id, page, per_page):
+        if not match:
+            return self._page([], 0, page, per_page)
+
+        if not self.is_supported():
+            return self._fallback_events(match, organizacao_id, page, per_page)
+
+        params = {'match': match, 'org': organizacao_id, 'limit': per_page, 'offset': (page - 1) * per_page}
+
+        rows = db.session.execute(
+            db.text(EVENT_SEARCH_SQL), params
+        ).mappings().all()
+        total = db.session.execute(
+            db.text(EVENT_COUNT_SQL), params
+        ).scalar()
+
+        items = [{
+            'id': row['id'],
+            'nome': row['nome'],
+            'local': row['local'],
+            'formadora': row['formadora'],
+            'data_inicio': str(row['data_inicio']) if row['data_inicio'] else None,
+            'score': round(-row['rank'], 4),
+        } for row in rows]
+
+        return self._page(items, total, page, per_page)
+
+    def _fallback_terms(self, match):
+        """Plain tokens back out of a MATCH expression"""
+        return [term.strip('"*') for term in match.split()]
+
+    def _fallback_participants(self, match, organizacao_id, page, per_page):
+        """Unranked LIKE search for databases without FTS5"""
+        query = Participant.query.join(Event).filter(
+            Participant.deleted_at.is_(None), Event.deleted_at.is_(None),
+            Event.organizacao_id == organizacao_id
+        )
+        for term in self._fallback_terms(match):
+            pattern = f'%{term}%'
+            query = query.filter(db.or_(
+                Participant.nome.ilike(pattern), Participant.email.ilike(pattern),
+                Participant.empresa.ilike(pattern), Participant.observacoes.ilike(pattern)
+            ))
+
+        result = query.order_by(Participant.nome).paginate(page=page, per_page=per_page, error_out=False)
+        items = [{
+            'id': p.id,
+            'nome': p.nome,
+            'email': p.email,
+            'empresa': p.empresa,
+            'status': p.status,
+            'evento_id': p.evento_id,
+            'evento_nome': p.evento.nome,
+            'evento_data': p.evento.data_inicio.isoformat() if p.evento.data_inicio else None,
+            'score': None,
+        } for p in result.items]
+        return self._page(items, result.total, page, per_page)
+
+    def _fallback_events(self, match, organizacao_id, page, per_page):
+        """Unranked LIKE search for databases without FTS5"""
+        query = Event.query.filter(Event.deleted_at.is_(None), Event.organizacao_id == organizacao_id)
+        for term in self._fallback_terms(match):
+            pattern = f'%{term}%'
+            query = query.filter(db.or_(
+                Event.nome.ilike(pattern), Event.local.ilike(pattern), Event.formadora.ilike(pattern)
+            ))
+
+        result = query.order_by(Event.data_inicio.desc()).paginate(page=page, per_page=per_page, error_out=False)
+        items = [{
+            'id': e.id,
+            'nome': e.nome,
+            'local': e.local,
+            'formadora': e.formadora,
+            'data_inicio': e.data_inicio.isoformat() if e.data_inicio else None,
+            'score': None,
+        } for e in result.items]
+        return self._page(items, result.total, page, per_page)
+
+    def _page(self, items, total, page, per_page):
+        return {
+            'items': items,
+            'total': total,
+            'page': page,
+            'pages': (total + per_page - 1) // per_page if total else 0,
+        }
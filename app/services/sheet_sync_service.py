@@ -0,0 +1,260 @@
+"""
+Sheet Sync Service - Two-way sync of an event's participants with a Google Sheet
+"""
+
+import logging
+from datetime import datetime
+from app import db
+from app.models import Participant, SheetSync
+from .google_service import GoogleService
+
+logger = logging.getLogger(__name__)
+
+
+class SheetSyncService:
+    """
+    Mirror the participants of an event into a Google Sheet, one row each
+
+    The sheet is read once per sync and compared with the snapshot of the
+    last sync: cells organizers changed in the sheet (and that did not change
+    in the database meanwhile) are copied to the participants, then only the
+    rows that differ from the merged result are written back, all in a single
+    spreadsheets.batchUpdate that also grows the grid when rows are added. Rows are matched by the ID column, so sorting or
+    filtering the sheet does not break the sync; columns to the right of the
+    mirrored ones and rows without an ID are left alone.
+    """
+
+    # (participant field, header) in sheet column order; the first is the row key
+    COLUMNS = (
+        ('id', 'ID'),
+        ('nome', 'Nome'),
+        ('email', 'Email'),
+        ('telefone', 'Telefone'),
+        ('empresa', 'Empresa'),
+        ('status', 'Estado'),
+        ('observacoes', 'Observações'),
+    )
+
+    # Fields organizers may edit in the sheet; the database wins on conflicts
+    EDITABLE_FIELDS = ('nome', 'telefone', 'empresa', 'observacoes')
+
+    def __init__(self):
+        self.google_service = GoogleService()
+
+    def link(self, evento, spreadsheet_id=None):
+        """
+        Link the event to a spreadsheet (a new one if no ID is given)
+
+        Linking another spreadsheet drops the snapshot, so the next sync
+        writes every participant without reading changes back.
+
+        Returns:
+            SheetSync (committed only when a new spreadsheet was created)
+        """
+        sheet_sync = evento.sheet_sync
+        created = False
+
+        if spreadsheet_id is None:
+            if sheet_sync is not None:
+                return sheet_sync
+            spreadsheet_id = self.google_service.create_spreadsheet(f'Participantes - {evento.nome}')
+            sheet_id = 0
+            created = True
+        else:
+            sheet_id = self.google_service.get_sheet_properties(spreadsheet_id).get('sheetId', 0)
+
+        if sheet_sync is None:
+            sheet_sync = SheetSync(evento_id=evento.id)
+            db.session.add(sheet_sync)
+        if sheet_sync.spreadsheet_id != spreadsheet_id:
+            sheet_sync.spreadsheet_id = spreadsheet_id
+            sheet_sync.sheet_id = sheet_id
+            sheet_sync.snapshot = None
+            sheet_sync.last_synced_at = None
+
+        evento.sheet_sync = sheet_sync
+        if created:
+            # Kept even if the sync then fails, so the next one reuses the spreadsheet
+            db.session.commit()
+        return sheet_sync
+
+    def sync_event(self, evento, spreadsheet_id=None):
+        """
+        Bring the event's participants and its linked sheet in step
+
+        Args:
+            evento: Event model instance
+            spreadsheet_id: Spreadsheet to link first (default: the linked one,
+                            or a new spreadsheet if there is none)
+
+        Returns:
+            dict with the link (see SheetSync.to_dict) and counters: rows
+            'written', 'added', 'removed', participants 'pulled' from the
+            sheet, 'conflicts' (database kept) and 'cells' written
+
+        Raises:
+            ValueError: If the sheet was never synced and already holds other data
+        """
+        try:
+            sheet_sync = self.link(evento, spreadsheet_id)
+            sheet = self.google_service.get_sheet_properties(sheet_sync.spreadsheet_id, sheet_sync.sheet_id)
+
+            snapshot = sheet_sync.snapshot or {}
+            remote, header, free_rows, last_used = self._read_sheet(sheet_sync, sheet)
+
+            headers = [title for _, title in self.COLUMNS]
+            if sheet_sync.snapshot is None and last_used > 1 and header != headers:
+                raise ValueError(
+                    "A folha já tem dados noutro formato; use uma folha vazia ou exportada por esta sincronização"
+                )
+
+            participants = {
+                str(participant.id): participant
+                for participant in Participant.query.filter(
+                    Participant.evento_id == evento.id,
+                    Participant.deleted_at.is_(None)
+                ).order_by(Participant.id)
+            }
+
+            stats = {'written': 0, 'added': 0, 'removed': 0, 'pulled': 0, 'conflicts': 0, 'cells': 0}
+            writes = {}  # row number -> cells
+            rows = {}    # participant ID -> cells as they are after this sync
+
+            if header != headers:
+                writes[1] = headers
+
+            for key, participant in participants.items():
+                current = self._row(participant)
+                if key not in remote:
+                    rows[key] = current
+                    continue
+
+                row_number, cells = remote[key]
+                merged = self._merge(participant, current, cells, snapshot.get(key), stats)
+                rows[key] = merged
+                if merged != cells:
+                    writes[row_number] = merged
+                    stats['written'] += 1
+
+            # Rows of participants removed from the event are blanked and reused
+            for key, (row_number, _) in remote.items():
+                if key not in participants:
+                    writes[row_number] = [''] * len(self.COLUMNS)
+                    free_rows.append(row_number)
+                    stats['removed'] += 1
+            free_rows.sort()
+
+            new_keys = [key for key in participants if key not in remote]
+            # New participants fill empty rows first, then go below the last one
+            targets = free_rows + list(range(last_used + 1, last_used + 1 + len(new_keys)))
+            for key, row_number in zip(new_keys, targets):
+                writes[row_number] = rows[key]
+                stats['added'] += 1
+
+            if writes:
+                grid = sheet.get('gridProperties', {})
+                stats['cells'] = self.google_service.update_rows(
+                    sheet_sync.spreadsheet_id, sheet_sync.sheet_id, self._runs(writes),
+                    add_rows=max(writes) - grid.get('rowCount', 0),
+                    add_columns=len(self.COLUMNS) - grid.get('columnCount', 0)
+                )
+
+            # Participants edited from the sheet and the new snapshot move together
+            sheet_sync.snapshot = rows
+            sheet_sync.last_synced_at = datetime.utcnow()
+            db.session.commit()
+
+        except Exception:
+            db.session.rollback()
+            raise
+
+        logger.info(
+            f"Evento {evento.id}: folha sincronizada, {stats['written']} linhas alteradas, "
+            f"{stats['added']} novas, {stats['removed']} removidas, {stats['pulled']} vindas da folha"
+        )
+
+        stats.update(sheet_sync.to_dict())
+        return stats
+
+    def _read_sheet(self, sheet_sync, sheet):
+        """
+        Rows of the mirrored columns currently in the sheet
+
+        Returns:
+            (remote, header, free_rows, last_used): remote maps participant
+            ID -> (row number, cells) for rows with an ID; header is the first
+            row; free_rows are the empty rows above last_used, the last
+            non-empty row (1 if there is none below the header)
+        """
+        width = len(self.COLUMNS)
+        remote = {}
+        header = None
+        used = set()
+
+        for row_number, row in self.google_service.iter_spreadsheet_rows(
+            sheet_sync.spreadsheet_id, 'A1', last_column=width - 1, sheet=sheet
+        ):
+            cells = [str(value) for value in row[:width]] + [''] * (width - len(row))
+            if row_number == 1:
+                header = cells
+                continue
+            if not any(cells):
+                continue
+
+            used.add(row_number)
+            key = cells[0].strip()
+            # Only the first row with each ID is synced; copies are left alone
+            if key.isdigit() and key not in remote:
+                remote[key] = (row_number, cells)
+
+        last_used = max(used, default=1)
+        free_rows = [row_number for row_number in range(2, last_used) if row_number not in used]
+        return remote, header, free_rows, last_used
+
+    def _row(self, participant):
+        return ['' if getattr(participant, field) is None else str(getattr(participant, field))
+                for field, _ in self.COLUMNS]
+
+    def _merge(self, participant, current, cells, synced, stats):
+        """
+        Row after applying sheet edits to the participant
+
+        A cell edited in the sheet since the last sync is copied to the
+        participant unless the database value changed too (a conflict, the
+        database wins). Without a snapshot nothing is read back.
+        """
+        merged = list(current)
+        if synced is None:
+            return merged
+
+        pulled = False
+        for index, (field, _) in enumerate(self.COLUMNS):
+            if field not in self.EDITABLE_FIELDS or cells[index] == synced[index]:
+                continue
+            if current[index] != synced[index]:
+                stats['conflicts'] += 1
+                continue
+
+            value = cells[index].strip()
+            if field == 'nome' and not value:
+                # Required: an emptied name stays as it is
+                continue
+            length = Participant.__table__.c[field].type.length
+            value = value[:length] if length else value
+
+            setattr(participant, field, value or None)
+            merged[index] = value
+            pulled = True
+
+        stats['pulled'] += pulled
+        return merged
+
+    def _runs(self, writes):
+        """(first row, rows) for each run of consecutive rows to write"""
+        runs = []
+        for row_number in sorted(writes):
+            if runs and row_number == runs[-1][0] + len(runs[-1][1]):
+                runs[-1][1].append(writes[row_number])
+            else:
+                runs.append((row_number, [writes[row_number]]))
+        return runs
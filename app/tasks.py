@@ -0,0 +1,37 @@
+"""
+Celery integration for background jobs
+
+Only imported when CELERY_BROKER_URL is set. Start a worker with:
+    celery -A celery_worker.celery_app worker
+Workers need access to the same database and upload folder as the web app.
+"""
+
+from celery import Celery, Task, shared_task
+
+
+def init_celery(app):
+    """Create the Celery app bound to the Flask app context"""
+
+    class FlaskTask(Task):
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+
+    celery_app = Celery(app.name, task_cls=FlaskTask)
+    celery_app.conf.update(
+        broker_url=app.config['CELERY_BROKER_URL'],
+        result_backend=app.config.get('CELERY_RESULT_BACKEND'),
+        task_ignore_result=True,
+        task_acks_late=True,
+        worker_prefetch_multiplier=1,
+    )
+    celery_app.set_default()
+    app.extensions['celery'] = celery_app
+    return celery_app
+
+
+@shared_task(ignore_result=True)
+def run_import_job(job_id):
+    """Run a queued import job"""
+    from app.services.import_job_service import ImportJobService
+    ImportJobService().run(job_id)
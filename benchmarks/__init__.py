@@ -0,0 +1,9 @@
+"""
+Benchmarks de importação e das integrações Google (executar a partir da raiz do projeto)
+
+    python -m benchmarks.import_benchmark --help
+    python -m benchmarks.google_benchmark --help
+
+benchmarks.fake_google_apis simula as APIs Forms, Sheets e Drive em memória
+e pode ser usado à parte para testar os serviços Google sem credenciais.
+"""
@@ -0,0 +1,642 @@
+"""
+In-process stand-in for the Google Forms, Sheets and Drive APIs
+
+FakeGoogleAPIs keeps forms, responses, spreadsheets and Drive files in
+memory and answers the googleapiclient requests the services make, as an
+httplib2-compatible transport. Batch requests (BatchHttpRequest) are
+supported, and so are:
+- latency: seconds slept per HTTP round trip (a batch is one round trip)
+- max_page_size: caps pageSize so pagination is exercised with few rows
+- inject_error(): fail matching requests with a status (and Retry-After)
+
+Usage:
+    fake = FakeGoogleAPIs(latency=0.05)
+    form_id = fake.add_form('Inscrição: Workshop', responses=2000)
+    with fake.installed():
+        FormSyncService().sync_event(evento)
+    print(fake.stats())
+"""
+
+import contextlib
+import email.parser
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from unittest import mock
+from urllib.parse import parse_qs, unquote, urlparse
+
+import httplib2
+
+FORM_MIME_TYPE = 'application/vnd.google-apps.form'
+SHEET_MIME_TYPE = 'application/vnd.google-apps.spreadsheet'
+
+DEFAULT_QUESTIONS = ('Nome Completo', 'Email', 'Telefone', 'Empresa', 'Observações')
+
+A1_RANGE = re.compile(
+    r"^(?:(?P<sheet>'(?:[^']|'')+'|[^!]+)!)?(?P<col1>[A-Za-z]+)?(?P<row1>\d+)?"
+    r"(?::(?P<col2>[A-Za-z]+)?(?P<row2>\d+)?)?$"
+)
+
+
+class FakeApiError(Exception):
+    """Error response of a fake endpoint"""
+
+    def __init__(self, status, message, reason=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def _timestamp(moment):
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.%f') + 'Z'
+
+
+def _parse_timestamp(value):
+    match = re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?', value)
+    parsed = datetime.strptime(match.group(1), '%Y-%m-%dT%H:%M:%S')
+    if match.group(2):
+        parsed = parsed.replace(microsecond=int(match.group(2)[:6].ljust(6, '0')))
+    return parsed
+
+
+def _column_index(letters):
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+class FakeGoogleAPIs:
+    """In-memory Forms v1, Sheets v4 and Drive v3 behind an httplib2-style transport"""
+
+    def __init__(self, latency=0.0, max_page_size=None):
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.timeout = None
+        self.redirect_codes = frozenset()
+
+        self.forms = {}         # form_id -> form resource (with 'responses')
+        self.spreadsheets = {}  # spreadsheet_id -> {'title', 'sheets': [{'title', 'rows', 'row_count', 'column_count'}]}
+        self.files = {}         # file_id -> Drive file resource
+
+        self._errors = []
+        self._ids = itertools.count(1)
+        self._clock = datetime(2026, 1, 1, 9, 0, 0)
+        self._lock = threading.RLock()
+        self._round_trips = 0
+        self._calls = Counter()
+
+    # -- Seeding ----------------------------------------------------------
+
+    def add_form(self, title, questions=DEFAULT_QUESTIONS, responses=0):
+        """Create a form with text questions and optionally some responses; returns its ID"""
+        with self._lock:
+            form = self._create_form({'info': {'title': title, 'documentTitle': title}})
+            for title_ in questions:
+                self._create_item(form, {'title': title_, 'questionItem': {'question': {'textQuestion': {}}}})
+            if responses:
+                self.add_responses(form['formId'], responses)
+            return form['formId']
+
+    def add_responses(self, form_id, count, start=0):
+        """Add count responses (respondent start, start+1, ...) submitted one second apart"""
+        with self._lock:
+            form = self.forms[form_id]
+            for number in range(start, start + count):
+                self._clock += timedelta(seconds=1)
+                form['responses'].append({
+                    'responseId': f'resp{next(self._ids)}',
+                    'createTime': _timestamp(self._clock),
+                    'lastSubmittedTime': _timestamp(self._clock),
+                    'answers': self._answers(form, number),
+                })
+
+    def edit_response(self, form_id, index, **values):
+        """Change answers of a response (by question title keyword) and bump its submission time"""
+        with self._lock:
+            form = self.forms[form_id]
+            response = form['responses'][index]
+            for item in form['items']:
+                question_id = item['questionItem']['question']['questionId']
+                for keyword, value in values.items():
+                    if keyword.lower() in item['title'].lower():
+                        response['answers'][question_id] = self._answer(question_id, value)
+            self._clock += timedelta(seconds=1)
+            response['lastSubmittedTime'] = _timestamp(self._clock)
+
+    def add_spreadsheet(self, title, rows, sheet_title='Folha1'):
+        """Create a spreadsheet whose first sheet holds rows (lists of strings); returns its ID"""
+        with self._lock:
+            spreadsheet_id = self._new_id('sheet')
+            self.spreadsheets[spreadsheet_id] = {
+                'title': title,
+                'sheets': [self._new_sheet(sheet_title, rows)],
+            }
+            self._add_file(spreadsheet_id, title, SHEET_MIME_TYPE)
+            return spreadsheet_id
+
+    def sheet_rows(self, spreadsheet_id, sheet_index=0):
+        """Current rows of a sheet, trailing empty cells and rows removed"""
+        with self._lock:
+            rows = [self._trim(row) for row in self.spreadsheets[spreadsheet_id]['sheets'][sheet_index]['rows']]
+            while rows and not rows[-1]:
+                rows.pop()
+            return rows
+
+    # -- Failure injection and statistics ---------------------------------
+
+    def inject_error(self, pattern, status=503, times=1, retry_after=None, reason=None):
+        """
+        Fail the next `times` requests whose 'METHOD path' matches the regex pattern
+
+        Example: inject_error(r'GET /v1/forms/.+/responses', status=429, retry_after=1)
+        """
+        with self._lock:
+            self._errors.append({'pattern': re.compile(pattern), 'status': status, 'times': times,
+                                 'retry_after': retry_after, 'reason': reason})
+
+    def stats(self):
+        """HTTP round trips and API calls (batch items counted one by one) per endpoint"""
+        with self._lock:
+            return {'round_trips': self._round_trips, 'calls': dict(sorted(self._calls.items()))}
+
+    def reset_stats(self):
+        with self._lock:
+            self._round_trips = 0
+            self._calls.clear()
+
+    @contextlib.contextmanager
+    def installed(self):
+        """
+        Make GoogleAuthService, GoogleService and the services built on them use this fake
+
+        Credentials come from memory instead of token files, and new API
+        resources are built on this transport; the in-process caches are
+        cleared on the way in and out.
+        """
+        from google.oauth2.credentials import Credentials
+        from app.services.google_client_cache import google_clients
+        from app.services.google_credential_store import credential_store
+        from app.services.form_catalog_cache import form_catalog
+        from app.services.form_field_mapper import form_mappers
+
+        credentials = Credentials(token='fake-token', client_id='fake-client')
+
+        def clear():
+            google_clients.clear()
+            form_catalog.invalidate()
+            form_mappers.clear()
+
+        clear()
+        with mock.patch.object(credential_store, 'get', lambda *args, **kwargs: credentials), \
+                mock.patch.object(google_clients, 'http_factory', lambda: self):
+            try:
+                yield self
+            finally:
+                clear()
+
+    # -- httplib2 transport ----------------------------------------------
+
+    def request(self, uri, method='GET', body=None, headers=None, *args, **kwargs):
+        """httplib2.Http.request(): one round trip, possibly a batch"""
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            self._round_trips += 1
+            parsed = urlparse(uri)
+            if parsed.path in ('/batch', '/batch/drive/v3'):
+                return self._batch(headers or {}, body)
+
+            status, payload, extra = self._dispatch(method, uri, body)
+            return self._response(status, extra), json.dumps(payload).encode('utf-8')
+
+    def _batch(self, headers, body):
+        content_type = {key.lower(): value for key, value in headers.items()}['content-type']
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        message = email.parser.Parser().parsestr(f'Content-Type: {content_type}\r\n\r\n{body}')
+
+        boundary = uuid.uuid4().hex
+        parts = []
+        for part in message.get_payload():
+            request_line, _, rest = part.get_payload().partition('\n')
+            method, path, _ = request_line.strip().split(' ', 2)
+            inner_body = re.split(r'\r?\n\r?\n', rest, maxsplit=1)[1] if re.search(r'\r?\n\r?\n', rest) else ''
+            status, payload, extra = self._dispatch(method, path, inner_body.strip() or None)
+
+            content_id = part['Content-ID'].strip('<>')
+            header_lines = ''.join(f'{key}: {value}\r\n' for key, value in extra.items())
+            parts.append(
+                f'--{boundary}\r\nContent-Type: application/http\r\n'
+                f'Content-ID: <response-{content_id}>\r\n\r\n'
+                f'HTTP/1.1 {status} {"OK" if status < 400 else "Error"}\r\n'
+                f'Content-Type: application/json; charset=UTF-8\r\n{header_lines}\r\n'
+                f'{json.dumps(payload)}\r\n'
+            )
+
+        content = ''.join(parts) + f'--{boundary}--'
+        response = httplib2.Response({'status': '200', 'content-type': f'multipart/mixed; boundary={boundary}'})
+        return response, content.encode('utf-8')
+
+    def _response(self, status, extra):
+        return httplib2.Response(dict({'status': str(status), 'content-type': 'application/json; charset=UTF-8'},
+                                      **extra))
+
+    def _dispatch(self, method, uri, body):
+        """(status, payload, extra headers) of one API call"""
+        parsed = urlparse(uri)
+        path = unquote(parsed.path)
+        query = parse_qs(parsed.query)
+        data = json.loads(body) if body else {}
+
+        for route_method, pattern, handler in self._routes():
+            match = re.fullmatch(pattern, path)
+            if route_method != method or not match:
+                continue
+
+            self._calls[handler.__name__.lstrip('_')] += 1
+            try:
+                self._check_injected(f'{method} {path}')
+                return 200, handler(*match.groups(), query=query, body=data), {}
+            except FakeApiError as e:
+                error = {'code': e.status, 'message': str(e), 'status': 'ERROR'}
+                if e.reason:
+                    error['errors'] = [{'reason': e.reason, 'message': str(e)}]
+                extra = {'retry-after': str(e.retry_after)} if e.retry_after is not None else {}
+                return e.status, {'error': error}, extra
+
+        return 404, {'error': {'code': 404, 'message': f'No fake for {method} {path}'}}, {}
+
+    def _routes(self):
+        return (
+            ('POST', r'/v1/forms', self._forms_create),
+            ('GET', r'/v1/forms/([^/:]+)', self._forms_get),
+            ('POST', r'/v1/forms/([^/:]+):batchUpdate', self._forms_batch_update),
+            ('GET', r'/v1/forms/([^/:]+)/responses', self._forms_responses_list),
+            ('GET', r'/drive/v3/files', self._drive_files_list),
+            ('GET', r'/drive/v3/files/([^/]+)', self._drive_files_get),
+            ('POST', r'/drive/v3/files/([^/]+)/copy', self._drive_files_copy),
+            ('DELETE', r'/drive/v3/files/([^/]+)', self._drive_files_delete),
+            ('POST', r'/v4/spreadsheets', self._sheets_create),
+            ('GET', r'/v4/spreadsheets/([^/:]+)', self._sheets_get),
+            ('POST', r'/v4/spreadsheets/([^/:]+):batchUpdate', self._sheets_batch_update),
+            ('GET', r'/v4/spreadsheets/([^/:]+)/values:batchGet', self._values_batch_get),
+            ('POST', r'/v4/spreadsheets/([^/:]+)/values:batchUpdate', self._values_batch_update),
+            ('GET', r'/v4/spreadsheets/([^/:]+)/values/(.+)', self._values_get),
+            ('POST', r'/v4/spreadsheets/([^/:]+)/values/(.+):append', self._values_append),
+        )
+
+    def _check_injected(self, request_line):
+        for error in self._errors:
+            if error['times'] > 0 and error['pattern'].search(request_line):
+                error['times'] -= 1
+                raise FakeApiError(error['status'], f'Injected error for {request_line}',
+                                   reason=error['reason'], retry_after=error['retry_after'])
+
+    # -- Forms -----------------------------------------------------------
+
+    def _forms_create(self, query, body):
+        return self._public_form(self._create_form(body))
+
+    def _forms_get(self, form_id, query, body):
+        return self._public_form(self._form(form_id))
+
+    def _forms_batch_update(self, form_id, query, body):
+        form = self._form(form_id)
+        replies = []
+        for request in body.get('requests', []):
+            if 'createItem' in request:
+                item = self._create_item(form, request['createItem']['item'],
+                                         request['createItem'].get('location', {}).get('index'))
+                question_id = item.get('questionItem', {}).get('question', {}).get('questionId')
+                replies.append({'createItem': {'itemId': item['itemId'], 'questionId': [question_id]}})
+            elif 'updateFormInfo' in request:
+                update = request['updateFormInfo']
+                for field in update['updateMask'].split(','):
+                    form['info'][field.strip()] = update['info'].get(field.strip(), '')
+                replies.append({})
+            else:
+                raise FakeApiError(400, f'Unsupported request {list(request)}')
+        form['revisionId'] = f'{int(form["revisionId"]) + 1:08d}'
+        self.files[form_id]['modifiedTime'] = _timestamp(self._tick())
+        return {'replies': replies, 'form': self._public_form(form)}
+
+    def _forms_responses_list(self, form_id, query, body):
+        responses = sorted(self._form(form_id)['responses'], key=lambda r: r['lastSubmittedTime'])
+
+        filter_ = query.get('filter', [None])[0]
+        if filter_:
+            match = re.fullmatch(r'\s*timestamp\s*(>=|>)\s*(\S+)\s*', filter_)
+            if not match:
+                raise FakeApiError(400, f'Invalid filter: {filter_}')
+            since = _parse_timestamp(match.group(2))
+            keep = (lambda ts: ts >= since) if match.group(1) == '>=' else (lambda ts: ts > since)
+            responses = [r for r in responses if keep(_parse_timestamp(r['lastSubmittedTime']))]
+
+        page, token = self._page(responses, query, default_size=5000, max_size=5000)
+        result = {'responses': page} if page else {}
+        if token:
+            result['nextPageToken'] = token
+        return result
+
+    # -- Drive -----------------------------------------------------------
+
+    def _drive_files_list(self, query, body):
+        files = list(self.files.values())
+        q = query.get('q', [''])[0]
+        mime_type = re.search(r"mimeType\s*=\s*'([^']+)'", q)
+        if mime_type:
+            files = [f for f in files if f['mimeType'] == mime_type.group(1)]
+        name = re.search(r"name contains '((?:[^'\\]|\\.)*)'", q)
+        if name:
+            files = [f for f in files if name.group(1).lower() in f['name'].lower()]
+        files.sort(key=lambda f: f['modifiedTime'], reverse=True)
+
+        page, token = self._page(files, query, default_size=100, max_size=1000)
+        result = {'files': page}
+        if token:
+            result['nextPageToken'] = token
+        return result
+
+    def _drive_files_get(self, file_id, query, body):
+        if file_id not in self.files:
+            raise FakeApiError(404, f'File not found: {file_id}')
+        return self.files[file_id]
+
+    def _drive_files_copy(self, file_id, query, body):
+        if file_id not in self.forms:
+            raise FakeApiError(404, f'File not found: {file_id}')
+        source = self.forms[file_id]
+        copy = self._create_form({'info': dict(source['info'], documentTitle=body.get('name', source['info']['title']))})
+        for item in source['items']:
+            self._create_item(copy, json.loads(json.dumps(item)))
+        return {'id': copy['formId'], 'name': self.files[copy['formId']]['name'], 'mimeType': FORM_MIME_TYPE}
+
+    def _drive_files_delete(self, file_id, query, body):
+        if self.files.pop(file_id, None) is None:
+            raise FakeApiError(404, f'File not found: {file_id}')
+        self.forms.pop(file_id, None)
+        self.spreadsheets.pop(file_id, None)
+        return {}
+
+    # -- Sheets ----------------------------------------------------------
+
+    def _sheets_create(self, query, body):
+        spreadsheet_id = self._new_id('sheet')
+        title = body.get('properties', {}).get('title', 'Sem título')
+        self.spreadsheets[spreadsheet_id] = {'title': title, 'sheets': [self._new_sheet('Folha1', [])]}
+        self._add_file(spreadsheet_id, title, SHEET_MIME_TYPE)
+        return self._public_spreadsheet(spreadsheet_id)
+
+    def _sheets_get(self, spreadsheet_id, query, body):
+        return self._public_spreadsheet(spreadsheet_id)
+
+    def _sheets_batch_update(self, spreadsheet_id, query, body):
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        replies = []
+        for request in body.get('requests', []):
+            if 'appendDimension' in request:
+                append = request['appendDimension']
+                sheet = self._sheet_by_id(spreadsheet, append.get('sheetId', 0))
+                if append['dimension'] == 'ROWS':
+                    sheet['row_count'] += append['length']
+                else:
+                    sheet['column_count'] += append['length']
+            elif 'deleteDimension' in request:
+                dimension = request['deleteDimension']['range']
+                sheet = self._sheet_by_id(spreadsheet, dimension.get('sheetId', 0))
+                if dimension['dimension'] != 'ROWS':
+                    raise FakeApiError(400, 'Only ROWS can be deleted in the fake')
+                del sheet['rows'][dimension['startIndex']:dimension['endIndex']]
+                sheet['row_count'] -= dimension['endIndex'] - dimension['startIndex']
+            elif 'updateCells' in request:
+                update = request['updateCells']
+                start = update['start']
+                sheet = self._sheet_by_id(spreadsheet, start.get('sheetId', 0))
+                values = [
+                    [next(iter(cell.get('userEnteredValue', {}).values()), '') for cell in row.get('values', [])]
+                    for row in update.get('rows', [])
+                ]
+                first_row, first_col = start.get('rowIndex', 0), start.get('columnIndex', 0)
+                if (first_row + len(values) > sheet['row_count']
+                        or first_col + max([len(row) for row in values] + [1]) > sheet['column_count']):
+                    raise FakeApiError(400, f'Cells exceed grid limits. Max rows: {sheet["row_count"]}, '
+                                            f'max columns: {sheet["column_count"]}')
+                self._write_cells(sheet, first_row, first_col, values)
+            else:
+                raise FakeApiError(400, f'Unsupported request {list(request)}')
+            replies.append({})
+        return {'spreadsheetId': spreadsheet_id, 'replies': replies}
+
+    def _values_get(self, spreadsheet_id, range_name, query, body):
+        return self._read_range(spreadsheet_id, range_name)
+
+    def _values_batch_get(self, spreadsheet_id, query, body):
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'valueRanges': [self._read_range(spreadsheet_id, range_name) for range_name in query.get('ranges', [])],
+        }
+
+    def _values_batch_update(self, spreadsheet_id, query, body):
+        updated_cells = 0
+        for value_range in body.get('data', []):
+            updated_cells += self._write_range(spreadsheet_id, value_range['range'], value_range.get('values', []))
+        return {'spreadsheetId': spreadsheet_id, 'totalUpdatedCells': updated_cells,
+                'totalUpdatedRanges': len(body.get('data', []))}
+
+    def _values_append(self, spreadsheet_id, range_name, query, body):
+        sheet, _, _, _, _ = self._locate(spreadsheet_id, range_name)
+        values = body.get('values', [])
+        start = len(self._trimmed_rows(sheet))
+        if start + len(values) > sheet['row_count']:
+            # append grows the grid, unlike values.update
+            sheet['row_count'] = start + len(values)
+        cells = self._write_cells(sheet, start, 0, values)
+        return {'spreadsheetId': spreadsheet_id, 'updates': {'updatedRows': len(values), 'updatedCells': cells}}
+
+    # -- Helpers ---------------------------------------------------------
+
+    def _tick(self):
+        self._clock += timedelta(seconds=1)
+        return self._clock
+
+    def _new_id(self, prefix):
+        return f'{prefix}{next(self._ids):06d}'
+
+    def _add_file(self, file_id, name, mime_type):
+        moment = _timestamp(self._tick())
+        self.files[file_id] = {
+            'id': file_id, 'name': name, 'mimeType': mime_type,
+            'createdTime': moment, 'modifiedTime': moment,
+            'webViewLink': f'https://docs.google.com/fake/{file_id}/edit',
+            'owners': [{'displayName': 'Conta de testes', 'emailAddress': 'testes@example.com'}],
+        }
+
+    def _create_form(self, body):
+        form_id = self._new_id('form')
+        info = dict(body.get('info', {}))
+        form = {
+            'formId': form_id,
+            'revisionId': '00000001',
+            'info': info,
+            'items': [],
+            'responderUri': f'https://docs.google.com/forms/d/e/{form_id}/viewform',
+            'responses': [],
+        }
+        self.forms[form_id] = form
+        self._add_file(form_id, info.get('documentTitle') or info.get('title', 'Formulário'), FORM_MIME_TYPE)
+        return form
+
+    def _create_item(self, form, item, index=None):
+        item = dict(item, itemId=self._new_id('item'))
+        if 'questionItem' in item:
+            item['questionItem']['question']['questionId'] = self._new_id('q')
+        form['items'].insert(len(form['items']) if index is None else index, item)
+        return item
+
+    def _answers(self, form, number):
+        answers = {}
+        for item in form['items']:
+            question_id = item['questionItem']['question']['questionId']
+            title = item['title'].lower()
+            if 'nome' in title:
+                value = f'Participante {number}'
+            elif 'mail' in title:
+                value = f'participante{number}@example.com'
+            elif 'telefone' in title:
+                value = f'9{number:08d}'[:9]
+            elif 'empresa' in title:
+                value = f'Empresa {number % 50}'
+            else:
+                continue
+            answers[question_id] = self._answer(question_id, value)
+        return answers
+
+    def _answer(self, question_id, value):
+        return {'questionId': question_id, 'textAnswers': {'answers': [{'value': value}]}}
+
+    def _form(self, form_id):
+        if form_id not in self.forms:
+            raise FakeApiError(404, f'Form not found: {form_id}')
+        return self.forms[form_id]
+
+    def _public_form(self, form):
+        return {key: value for key, value in form.items() if key != 'responses'}
+
+    def _page(self, items, query, default_size, max_size):
+        size = int(query.get('pageSize', [default_size])[0]) or default_size
+        size = min(size, max_size, self.max_page_size or max_size)
+        start = int(query.get('pageToken', ['0'])[0] or 0)
+        end = start + size
+        return items[start:end], (str(end) if end < len(items) else None)
+
+    def _new_sheet(self, title, rows):
+        rows = [list(map(str, row)) for row in rows]
+        return {'sheet_id': 0, 'title': title, 'rows': rows,
+                'row_count': max(1000, len(rows)), 'column_count': max([26] + [len(row) for row in rows])}
+
+    def _spreadsheet(self, spreadsheet_id):
+        if spreadsheet_id not in self.spreadsheets:
+            raise FakeApiError(404, f'Requested entity was not found: {spreadsheet_id}')
+        return self.spreadsheets[spreadsheet_id]
+
+    def _sheet_by_id(self, spreadsheet, sheet_id):
+        for sheet in spreadsheet['sheets']:
+            if sheet['sheet_id'] == sheet_id:
+                return sheet
+        raise FakeApiError(400, f'No sheet with id {sheet_id}')
+
+    def _public_spreadsheet(self, spreadsheet_id):
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'properties': {'title': spreadsheet['title']},
+            'sheets': [
+                {'properties': {
+                    'sheetId': sheet['sheet_id'], 'title': sheet['title'], 'index': index,
+                    'gridProperties': {'rowCount': sheet['row_count'], 'columnCount': sheet['column_count']},
+                }}
+                for index, sheet in enumerate(spreadsheet['sheets'])
+            ],
+            'spreadsheetUrl': f'https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit',
+        }
+
+    def _locate(self, spreadsheet_id, range_name):
+        """(sheet, first_row, first_col, last_row, last_col) of an A1 range, 0-based, ends inclusive"""
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        match = A1_RANGE.match(range_name)
+        if not match:
+            raise FakeApiError(400, f'Unable to parse range: {range_name}')
+
+        sheet = spreadsheet['sheets'][0]
+        if match.group('sheet'):
+            name = match.group('sheet')
+            name = name[1:-1].replace("''", "'") if name.startswith("'") else name
+            sheet = next((s for s in spreadsheet['sheets'] if s['title'] == name), None)
+            if sheet is None:
+                raise FakeApiError(400, f'Unable to parse range: {range_name}')
+
+        first_row = int(match.group('row1') or 1) - 1
+        first_col = _column_index(match.group('col1')) if match.group('col1') else 0
+        if match.group('col2') or match.group('row2'):
+            last_row = int(match.group('row2')) - 1 if match.group('row2') else sheet['row_count'] - 1
+            last_col = _column_index(match.group('col2')) if match.group('col2') else sheet['column_count'] - 1
+        elif match.group('row1') and match.group('col1'):
+            last_row, last_col = first_row, first_col
+        else:
+            last_row, last_col = sheet['row_count'] - 1, sheet['column_count'] - 1
+        return sheet, first_row, first_col, last_row, last_col
+
+    def _read_range(self, spreadsheet_id, range_name):
+        sheet, first_row, first_col, last_row, last_col = self._locate(spreadsheet_id, range_name)
+        if last_row >= sheet['row_count'] or last_col >= sheet['column_count']:
+            raise FakeApiError(400, f'Range ({range_name}) exceeds grid limits')
+
+        values = [self._trim(row[first_col:last_col + 1]) for row in sheet['rows'][first_row:last_row + 1]]
+        while values and not values[-1]:
+            values.pop()
+        result = {'range': range_name, 'majorDimension': 'ROWS'}
+        if values:
+            result['values'] = values
+        return result
+
+    def _write_range(self, spreadsheet_id, range_name, values):
+        sheet, first_row, first_col, last_row, last_col = self._locate(spreadsheet_id, range_name)
+        end_row = first_row + len(values) - 1
+        end_col = first_col + max([len(row) for row in values] + [1]) - 1
+        if end_row >= sheet['row_count'] or end_col >= sheet['column_count']:
+            raise FakeApiError(400, f'Range ({range_name}) exceeds grid limits. '
+                                    f'Max rows: {sheet["row_count"]}, max columns: {sheet["column_count"]}')
+        return self._write_cells(sheet, first_row, first_col, values)
+
+    def _write_cells(self, sheet, first_row, first_col, values):
+        rows = sheet['rows']
+        cells = 0
+        for offset, row_values in enumerate(values):
+            index = first_row + offset
+            rows.extend([] for _ in range(index + 1 - len(rows)))
+            row = rows[index]
+            row.extend('' for _ in range(first_col + len(row_values) - len(row)))
+            for col_offset, value in enumerate(row_values):
+                row[first_col + col_offset] = '' if value is None else str(value)
+                cells += 1
+        return cells
+
+    def _trimmed_rows(self, sheet):
+        rows = [self._trim(row) for row in sheet['rows']]
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def _trim(self, row):
+        row = list(row)
+        while row and row[-1] == '':
+            row.pop()
+        return row
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmark das integrações Google contra APIs simuladas
+
+Usa benchmarks.fake_google_apis (Forms, Sheets e Drive em memória, sem
+credenciais nem rede) com uma latência fixa por pedido HTTP e mede:
+- sync_full: FormSyncService.sync_event de todas as respostas de um formulário
+- sync_incremental: nova sincronização depois de algumas respostas editadas
+- sheet_import: ParticipantImportService.import_from_sheet
+- list_forms / search_forms: lista de formulários do Drive (cache fria e quente)
+
+Para cada fase reporta segundos, linhas/segundo e os pedidos feitos às APIs
+(idas e voltas HTTP e chamadas por endpoint), em JSON. Com --error-rate, uma
+fração dos pedidos de respostas e de valores falha com 503 para medir as
+novas tentativas.
+
+Executar (na raiz do projeto):
+    python -m benchmarks.google_benchmark
+    python -m benchmarks.google_benchmark --rows 1000 10000 --latency 0.1 --output google.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from unittest import mock
+
+from benchmarks.fake_google_apis import FakeGoogleAPIs
+
+DEFAULT_ROWS = [100, 1000, 10000]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark das integrações Google (APIs simuladas)')
+    parser.add_argument('--rows', nargs='+', type=int, default=DEFAULT_ROWS,
+                        help='Respostas do formulário e linhas da folha (default: 100 1000 10000)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Segundos por pedido HTTP simulado (default: 0.05)')
+    parser.add_argument('--page-size', type=int, help='Tamanho máximo das páginas devolvidas pelas APIs')
+    parser.add_argument('--forms', type=int, default=500, help='Formulários no Drive simulado (default: 500)')
+    parser.add_argument('--edits', type=int, default=10,
+                        help='Respostas editadas antes da sincronização incremental (default: 10)')
+    parser.add_argument('--error-rate', type=int, default=0,
+                        help='Falhar com 503 um em cada N pedidos de respostas/valores (default: nunca)')
+    parser.add_argument('--quotas', action='store_true',
+                        help='Respeitar as quotas por minuto das APIs (GoogleConfig.API_QUOTAS_PER_MINUTE)')
+    parser.add_argument('--output', help='Ficheiro JSON de saída (default: stdout)')
+    return parser.parse_args(argv)
+
+
+def run_phase(fake, rows, func):
+    """Run func once, timing it and counting the API requests it made"""
+    fake.reset_stats()
+    # The services print DEBUG lines; keep them out of the timings
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+
+    report = {
+        'rows': rows,
+        'seconds': round(elapsed, 4),
+        'rows_per_sec': round(rows / elapsed, 1) if rows and elapsed > 0 else None,
+    }
+    report.update(fake.stats())
+    return result, report
+
+
+def inject_errors(fake, rows, error_rate, page_size):
+    """Fail about one in error_rate of the requests that read responses or values"""
+    if not error_rate:
+        return
+    pages = rows // (page_size or 5000) + 1
+    fake.inject_error(r'/responses|/values', status=503, times=max(1, pages // error_rate), retry_after=0)
+
+
+def benchmark_rows(rows, args):
+    """All phases for one form / sheet size, each on a fresh fake"""
+    from app import db
+    from app.models import Event
+    from app.services.form_sync_service import FormSyncService
+    from app.services.google_forms_service import GoogleFormsService
+    from app.services.google_request_executor import google_requests
+    from app.services.participant_import_service import ParticipantImportService
+
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+
+    fake = FakeGoogleAPIs(latency=args.latency, max_page_size=args.page_size)
+    form_id = fake.add_form('Inscrição: Benchmark', responses=rows)
+    for number in range(args.forms):
+        fake.add_form(f'Formulário {number} - Workshop de Inovação')
+    header = ['Nome Completo', 'Email', 'Telefone', 'Empresa']
+    spreadsheet_id = fake.add_spreadsheet('Participantes', [header] + [
+        [f'Participante {n}', f'participante{n}@example.com', f'9{n:08d}'[:9], f'Empresa {n % 50}']
+        for n in range(rows)
+    ])
+
+    form_event = Event(nome='Benchmark Formulário', data_inicio=date.today(), duracao_minutos=60,
+                       google_form_id=form_id)
+    sheet_event = Event(nome='Benchmark Folha', data_inicio=date.today(), duracao_minutos=60)
+    db.session.add_all([form_event, sheet_event])
+    db.session.commit()
+
+    phases = {}
+    throttling = contextlib.nullcontext()
+    if not args.quotas:
+        # The executor's token buckets follow the real per-minute quotas
+        throttling = mock.patch.object(google_requests, '_bucket', lambda request: _NoWait())
+
+    with fake.installed(), throttling:
+        inject_errors(fake, rows, args.error_rate, args.page_size)
+        _, phases['sync_full'] = run_phase(fake, rows, lambda: FormSyncService().sync_event(form_event))
+
+        edits = min(args.edits, rows)
+        for index in range(edits):
+            fake.edit_response(form_id, index, empresa='Empresa Editada')
+        _, phases['sync_incremental'] = run_phase(fake, edits, lambda: FormSyncService().sync_event(form_event))
+
+        inject_errors(fake, rows, args.error_rate, args.page_size)
+        _, phases['sheet_import'] = run_phase(
+            fake, rows, lambda: ParticipantImportService().import_from_sheet(spreadsheet_id, sheet_event.id)
+        )
+
+        forms_service = GoogleFormsService()
+        _, phases['list_forms_cold'] = run_phase(
+            fake, args.forms + 1, lambda: forms_service.list_recent_forms(limit=args.forms + 1, refresh=True)
+        )
+        _, phases['list_forms_warm'] = run_phase(
+            fake, args.forms + 1, lambda: forms_service.list_recent_forms(limit=args.forms + 1)
+        )
+        _, phases['search_forms'] = run_phase(
+            fake, None, lambda: forms_service.search_forms_by_name('workshop inov', limit=20)
+        )
+
+    return phases
+
+
+class _NoWait:
+    """Token bucket stand-in that never makes callers wait"""
+
+    def acquire(self, tokens=1):
+        return 0.0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    work_dir = tempfile.mkdtemp(prefix='gestor_google_bench_')
+
+    # Temporary SQLite file with the app's SQLite profile, set before the app is created
+    os.environ.pop('DATABASE_URL', None)
+    os.environ['SQLITE_PATH'] = os.path.join(work_dir, 'bench.db')
+    # No background syncs competing with the benchmark
+    os.environ['FORM_SYNC_INTERVAL_SECONDS'] = '0'
+
+    from app import create_app
+
+    app = create_app()
+    report = {
+        'generated_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'latency_seconds': args.latency,
+        'page_size': args.page_size,
+        'error_rate': args.error_rate,
+        'quotas': args.quotas,
+        'results': [],
+    }
+
+    try:
+        for rows in args.rows:
+            print(f'{rows} respostas/linhas...', file=sys.stderr)
+            with app.app_context():
+                phases = benchmark_rows(rows, args)
+            report['results'].append({'rows': rows, 'phases': phases})
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark da importação de eventos e participantes
+
+Gera ficheiros sintéticos em cada layout suportado (single, two_sheet,
+multi_event, hybrid, csv) com 100 a 100k linhas e mede separadamente:
+- parse: ExcelImportService.parse_excel_file
+- extract: ExcelImportService.extract_participants_only
+- db_write: ExcelImportService.create_events numa base de dados SQLite temporária
+
+Para cada fase reporta segundos, linhas/segundo e o pico de memória
+(tracemalloc, numa execução separada para não afetar os tempos), em JSON.
+
+Executar (na raiz do projeto):
+    python -m benchmarks.import_benchmark
+    python -m benchmarks.import_benchmark --layouts single csv --rows 1000 100000 --output bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.workbooks import LAYOUTS, write_workbook
+
+DEFAULT_ROWS = [100, 1000, 10000, 100000]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark da importação de Excel/CSV')
+    parser.add_argument('--layouts', nargs='+', choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument('--rows', nargs='+', type=int, default=DEFAULT_ROWS,
+                        help='Linhas de participantes por ficheiro (default: 100 1000 10000 100000)')
+    parser.add_argument('--sheets', type=int, default=10, help='Folhas do layout multi_event (default: 10)')
+    parser.add_argument('--repeat', type=int, default=1, help='Repetições por fase; conta a mais rápida')
+    parser.add_argument('--no-memory', action='store_true', help='Não medir o pico de memória')
+    parser.add_argument('--output', help='Ficheiro JSON de saída (default: stdout)')
+    parser.add_argument('--keep', action='store_true', help='Manter a pasta com os ficheiros gerados')
+    return parser.parse_args(argv)
+
+
+def run_phase(func, repeat, measure_memory):
+    """
+    Time func (best of repeat runs), then run it once more under tracemalloc
+
+    Returns:
+        (result of the last timed run, seconds, peak bytes or None)
+    """
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        # The services print DEBUG lines per sheet; keep them out of the timings
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak = None
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result, best, peak
+
+
+def phase_report(rows, seconds, peak):
+    return {
+        'rows': rows,
+        'seconds': round(seconds, 4),
+        'rows_per_sec': round(rows / seconds, 1) if seconds > 0 else None,
+        'peak_memory_bytes': peak,
+    }
+
+
+def benchmark_file(path, repeat, measure_memory):
+    """Measure the three import phases for one generated file"""
+    from app import db
+    from app.services.excel_import_service import ExcelImportService
+    from app.services.parse_cache import parse_cache
+    from app.services.search_service import SearchService
+
+    service = ExcelImportService()
+    search_service = SearchService()
+    phases = {}
+
+    def parse():
+        # Every run must parse the file, not hit the upload cache
+        parse_cache.clear()
+        return service.parse_excel_file(path)
+
+    data, seconds, peak = run_phase(parse, repeat, measure_memory)
+    events = data['events'] if 'events' in data else [data]
+    parsed_rows = sum(len(item['participants']) for item in events)
+    phases['parse'] = phase_report(parsed_rows, seconds, peak)
+
+    def extract():
+        parse_cache.clear()
+        return service.extract_participants_only(path)
+
+    participants, seconds, peak = run_phase(extract, repeat, measure_memory)
+    phases['extract'] = phase_report(len(participants), seconds, peak)
+
+    def db_write():
+        # Same starting point for every run: empty tables
+        db.session.remove()
+        db.drop_all()
+        db.create_all()
+        # Inserts also pay for the full-text search triggers, as in the app
+        if not search_service.ensure_index():
+            search_service.rebuild_index()  # drop entries left by the previous run
+        copy = service._copy_parse_result(data)
+        for item in (copy['events'] if 'events' in copy else [copy]):
+            # CSV files carry no event data
+            item['event']['nome'] = item['event'].get('nome') or 'Benchmark'
+        return service.create_events(copy, organizacao_id=None)
+
+    created, seconds, peak = run_phase(db_write, repeat, measure_memory)
+    phases['db_write'] = phase_report(created['participantes'], seconds, peak)
+    phases['db_write']['events'] = len(created['eventos'])
+
+    return phases
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    work_dir = tempfile.mkdtemp(prefix='gestor_bench_')
+
+    # Temporary SQLite file with the app's SQLite profile (pragmas, read/write
+    # pools); set before the app (and its engines) is created
+    os.environ.pop('DATABASE_URL', None)
+    os.environ['SQLITE_PATH'] = os.path.join(work_dir, 'bench.db')
+
+    from app import create_app
+    import openpyxl
+    import pandas as pd
+
+    app = create_app()
+    report = {
+        'generated_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'openpyxl': openpyxl.__version__,
+        'cpu_count': os.cpu_count(),
+        'repeat': args.repeat,
+        'results': [],
+    }
+
+    try:
+        for layout in args.layouts:
+            for rows in args.rows:
+                path = write_workbook(os.path.join(work_dir, f'{layout}_{rows}'), layout, rows, sheets=args.sheets)
+                print(f'{layout} {rows} linhas...', file=sys.stderr)
+
+                with app.app_context():
+                    phases = benchmark_file(path, args.repeat, not args.no_memory)
+
+                report['results'].append({
+                    'layout': layout,
+                    'rows': rows,
+                    'file_bytes': os.path.getsize(path),
+                    'phases': phases,
+                })
+    finally:
+        if args.keep:
+            print(f'Ficheiros em {work_dir}', file=sys.stderr)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
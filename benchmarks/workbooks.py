@@ -0,0 +1,114 @@
+"""
+Synthetic import files in every layout understood by ExcelImportService
+
+Layouts:
+- single: event key/value rows, blank row, participant table (one sheet)
+- two_sheet: sheet 1 = event key/value rows, sheet 2 = participant table
+- multi_event: several sheets, each one a complete event (rows split evenly)
+- hybrid: participants in columns 0-1, event data in columns 2-3 of the first rows
+- csv: participant table as a semicolon-delimited CSV (Excel PT export)
+"""
+
+import csv
+from openpyxl import Workbook
+
+LAYOUTS = ('single', 'two_sheet', 'multi_event', 'hybrid', 'csv')
+
+PARTICIPANT_HEADER = ['Nome', 'Email', 'Telefone', 'Empresa', 'Observações']
+
+COMPANIES = ['ACME, Lda.', 'Câmara Municipal', 'Escola Básica n.º 1', None, 'Associação Terra']
+
+
+def event_rows(index=0):
+    """Event key/value rows as found in the organizers' workbooks"""
+    return [
+        ['Nome do Evento', f'Workshop de Mindfulness {index + 1}'],
+        ['Data', f'{index % 28 + 1:02d}/03/26'],
+        ['Duração', '1h30'],
+        ['Local', 'Lisboa'],
+        ['Formadora', 'Ana Rita Vieira'],
+    ]
+
+
+def participant_rows(count, offset=0):
+    """Participant rows; about 1 in 50 has no email and 1 in 100 repeats one"""
+    for i in range(offset, offset + count):
+        email = f'participante{i}@exemplo.pt'
+        if i % 50 == 49:
+            email = None
+        elif i % 100 == 99 and i > offset:
+            email = f'participante{i - 1}@exemplo.pt'
+        yield [
+            f'Participante {i} Conceição',
+            email,
+            910000000 + i,
+            COMPANIES[i % len(COMPANIES)],
+            'Vegetariano' if i % 10 == 0 else None,
+        ]
+
+
+def write_workbook(path, layout, rows, sheets=10):
+    """
+    Write a synthetic file and return its path
+
+    Args:
+        path: Destination without extension (.xlsx or .csv is added)
+        layout: One of LAYOUTS
+        rows: Total participant rows
+        sheets: Number of sheets for the multi_event layout
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f'Layout desconhecido: {layout}')
+
+    if layout == 'csv':
+        path = f'{path}.csv'
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(PARTICIPANT_HEADER)
+            writer.writerows(participant_rows(rows))
+        return path
+
+    path = f'{path}.xlsx'
+    workbook = Workbook(write_only=True)
+
+    if layout == 'single':
+        sheet = workbook.create_sheet('Evento')
+        for row in event_rows():
+            sheet.append(row)
+        sheet.append([])
+        sheet.append(PARTICIPANT_HEADER)
+        for row in participant_rows(rows):
+            sheet.append(row)
+
+    elif layout == 'two_sheet':
+        sheet = workbook.create_sheet('Evento')
+        for row in event_rows():
+            sheet.append(row)
+        sheet = workbook.create_sheet('Participantes')
+        sheet.append(PARTICIPANT_HEADER)
+        for row in participant_rows(rows):
+            sheet.append(row)
+
+    elif layout == 'multi_event':
+        sheets = max(2, min(sheets, rows))
+        offset = 0
+        for index in range(sheets):
+            count = rows // sheets + (1 if index < rows % sheets else 0)
+            sheet = workbook.create_sheet(f'Evento {index + 1}')
+            for row in event_rows(index):
+                sheet.append(row)
+            sheet.append([])
+            sheet.append(PARTICIPANT_HEADER)
+            for row in participant_rows(count, offset):
+                sheet.append(row)
+            offset += count
+
+    else:  # hybrid
+        sheet = workbook.create_sheet('Evento')
+        info = event_rows()
+        sheet.append(['Nome', 'Email'] + info[0])
+        for i, row in enumerate(participant_rows(rows), start=1):
+            sheet.append(row[:2] + (info[i] if i < len(info) else []))
+
+    workbook.save(path)
+    return path
@@ -57,9 +57,24 @@ def init_database():
     except Exception as e:
         print(f"Database init warning: {e}")
 
+def init_search_index():
+    """Create the full-text search index if the database does not have it yet."""
+    from app.services.search_service import SearchService
+
+    lock_file = '/tmp/.db_init.lock'
+
+    try:
+        with open(lock_file, 'w') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            if SearchService().ensure_index():
+                print("Search index created!")
+    except Exception as e:
+        print(f"Search index warning: {e}")
+
 # Run initialization once
 with app.app_context():
     init_database()
+    init_search_index()
 
 if __name__ == '__main__':
     # This is used when running locally
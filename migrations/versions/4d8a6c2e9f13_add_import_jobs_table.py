@@ -0,0 +1,52 @@
+"""Add import_jobs table for background imports
+
+Revision ID: 4d8a6c2e9f13
+Revises: 9e4f2b7a1c68
+Create Date: 2026-10-19 14:05:12.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d8a6c2e9f13'
+down_revision = '9e4f2b7a1c68'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('import_jobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('tipo', sa.String(length=30), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('evento_id', sa.Integer(), nullable=True),
+        sa.Column('organizacao_id', sa.Integer(), nullable=True),
+        sa.Column('source', sa.String(length=500), nullable=False),
+        sa.Column('params', sa.JSON(), nullable=True),
+        sa.Column('rows_parsed', sa.Integer(), nullable=False),
+        sa.Column('rows_inserted', sa.Integer(), nullable=False),
+        sa.Column('rows_updated', sa.Integer(), nullable=False),
+        sa.Column('rows_skipped', sa.Integer(), nullable=False),
+        sa.Column('rows_errored', sa.Integer(), nullable=False),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['evento_id'], ['events.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['organizacao_id'], ['organizations.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('import_jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_import_jobs_evento_id'), ['evento_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_import_jobs_status'), ['status'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('import_jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_import_jobs_status'))
+        batch_op.drop_index(batch_op.f('ix_import_jobs_evento_id'))
+
+    op.drop_table('import_jobs')
@@ -0,0 +1,49 @@
+"""Add composite and partial indexes for soft-delete access patterns
+
+Revision ID: 7c3e9a1d5b42
+Revises: af1ac7450652
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e9a1d5b42'
+down_revision = 'af1ac7450652'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Participants: per-event lookups always combine evento_id with deleted_at,
+    # status or the certificate flags
+    with op.batch_alter_table('participants', schema=None) as batch_op:
+        batch_op.create_index('ix_participants_evento_id_deleted_at', ['evento_id', 'deleted_at'], unique=False)
+        batch_op.create_index('ix_participants_evento_id_status', ['evento_id', 'status'], unique=False)
+        batch_op.create_index('ix_participants_evento_id_certificado',
+                              ['evento_id', 'certificado_gerado', 'certificado_enviado'], unique=False)
+        batch_op.create_index('ix_participants_active_evento_id', ['evento_id'], unique=False,
+                              sqlite_where=sa.text('deleted_at IS NULL'),
+                              postgresql_where=sa.text('deleted_at IS NULL'))
+
+    # Events: organization listings and active-only listings ordered by date
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.create_index('ix_events_organizacao_id_deleted_at_data_inicio',
+                              ['organizacao_id', 'deleted_at', 'data_inicio'], unique=False)
+        batch_op.create_index('ix_events_active_data_inicio', ['data_inicio'], unique=False,
+                              sqlite_where=sa.text('deleted_at IS NULL'),
+                              postgresql_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_active_data_inicio')
+        batch_op.drop_index('ix_events_organizacao_id_deleted_at_data_inicio')
+
+    with op.batch_alter_table('participants', schema=None) as batch_op:
+        batch_op.drop_index('ix_participants_active_evento_id')
+        batch_op.drop_index('ix_participants_evento_id_certificado')
+        batch_op.drop_index('ix_participants_evento_id_status')
+        batch_op.drop_index('ix_participants_evento_id_deleted_at')
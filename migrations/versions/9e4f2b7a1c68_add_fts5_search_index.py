@@ -0,0 +1,99 @@
+"""Add FTS5 search index for participants and events
+
+Revision ID: 9e4f2b7a1c68
+Revises: 7c3e9a1d5b42
+Create Date: 2026-10-19 14:41:07.518930
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4f2b7a1c68'
+down_revision = '7c3e9a1d5b42'
+branch_labels = None
+depends_on = None
+
+# Same DDL as app.services.search_service at the time of this revision
+SEARCH_INDEX_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS participants_fts USING fts5(
+        nome, email, empresa, observacoes,
+        content='participants', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS participants_fts_ai AFTER INSERT ON participants BEGIN
+        INSERT INTO participants_fts(rowid, nome, email, empresa, observacoes)
+        VALUES (new.id, new.nome, new.email, new.empresa, new.observacoes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS participants_fts_ad AFTER DELETE ON participants BEGIN
+        INSERT INTO participants_fts(participants_fts, rowid, nome, email, empresa, observacoes)
+        VALUES ('delete', old.id, old.nome, old.email, old.empresa, old.observacoes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS participants_fts_au
+    AFTER UPDATE OF nome, email, empresa, observacoes ON participants BEGIN
+        INSERT INTO participants_fts(participants_fts, rowid, nome, email, empresa, observacoes)
+        VALUES ('delete', old.id, old.nome, old.email, old.empresa, old.observacoes);
+        INSERT INTO participants_fts(rowid, nome, email, empresa, observacoes)
+        VALUES (new.id, new.nome, new.email, new.empresa, new.observacoes);
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        nome, local, formadora,
+        content='events', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, nome, local, formadora)
+        VALUES (new.id, new.nome, new.local, new.formadora);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, nome, local, formadora)
+        VALUES ('delete', old.id, old.nome, old.local, old.formadora);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF nome, local, formadora ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, nome, local, formadora)
+        VALUES ('delete', old.id, old.nome, old.local, old.formadora);
+        INSERT INTO events_fts(rowid, nome, local, formadora)
+        VALUES (new.id, new.nome, new.local, new.formadora);
+    END
+    """,
+]
+
+
+def upgrade():
+    # FTS5 virtual tables only exist on SQLite; other databases use LIKE search
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for statement in SEARCH_INDEX_DDL:
+        op.execute(statement)
+
+    # Index rows that already exist
+    op.execute("INSERT INTO participants_fts(participants_fts) VALUES ('rebuild')")
+    op.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for trigger in ('participants_fts_ai', 'participants_fts_ad', 'participants_fts_au',
+                    'events_fts_ai', 'events_fts_ad', 'events_fts_au'):
+        op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+
+    op.execute('DROP TABLE IF EXISTS participants_fts')
+    op.execute('DROP TABLE IF EXISTS events_fts')
@@ -0,0 +1,26 @@
+"""Add plan column to import_jobs for dry-run previews
+
+Revision ID: b6e1d3f8a2c7
+Revises: 4d8a6c2e9f13
+Create Date: 2026-10-19 15:32:40.771903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e1d3f8a2c7'
+down_revision = '4d8a6c2e9f13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('import_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('plan', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('import_jobs', schema=None) as batch_op:
+        batch_op.drop_column('plan')
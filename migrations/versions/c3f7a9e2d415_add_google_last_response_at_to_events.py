@@ -0,0 +1,26 @@
+"""Add google_last_response_at to events for incremental form sync
+
+Revision ID: c3f7a9e2d415
+Revises: b6e1d3f8a2c7
+Create Date: 2026-10-19 17:05:12.418230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f7a9e2d415'
+down_revision = 'b6e1d3f8a2c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('google_last_response_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_column('google_last_response_at')
@@ -0,0 +1,26 @@
+"""Add google_form_mapping to events for per-event form field overrides
+
+Revision ID: d8b2e5c1f736
+Revises: c3f7a9e2d415
+Create Date: 2026-10-19 18:12:47.305918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8b2e5c1f736'
+down_revision = 'c3f7a9e2d415'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('google_form_mapping', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_column('google_form_mapping')
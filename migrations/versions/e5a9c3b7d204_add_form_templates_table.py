@@ -0,0 +1,38 @@
+"""Add form_templates table for cloned registration forms
+
+Revision ID: e5a9c3b7d204
+Revises: d8b2e5c1f736
+Create Date: 2026-10-19 19:41:03.118462
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a9c3b7d204'
+down_revision = 'd8b2e5c1f736'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('form_templates',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('organizacao_id', sa.Integer(), nullable=True),
+        sa.Column('tipo_evento', sa.String(length=50), nullable=False),
+        sa.Column('form_id', sa.String(length=200), nullable=False),
+        sa.Column('layout', sa.String(length=16), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['organizacao_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('form_templates', schema=None) as batch_op:
+        batch_op.create_index('ix_form_templates_organizacao_id_tipo_evento', ['organizacao_id', 'tipo_evento'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('form_templates', schema=None) as batch_op:
+        batch_op.drop_index('ix_form_templates_organizacao_id_tipo_evento')
+
+    op.drop_table('form_templates')
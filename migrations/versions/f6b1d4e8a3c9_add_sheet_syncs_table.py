@@ -0,0 +1,35 @@
+"""Add sheet_syncs table for participant sheet mirroring
+
+Revision ID: f6b1d4e8a3c9
+Revises: e5a9c3b7d204
+Create Date: 2026-10-19 21:08:37.402915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6b1d4e8a3c9'
+down_revision = 'e5a9c3b7d204'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('sheet_syncs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('evento_id', sa.Integer(), nullable=False),
+        sa.Column('spreadsheet_id', sa.String(length=200), nullable=False),
+        sa.Column('sheet_id', sa.Integer(), nullable=False),
+        sa.Column('snapshot', sa.JSON(), nullable=True),
+        sa.Column('last_synced_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['evento_id'], ['events.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('evento_id')
+    )
+
+
+def downgrade():
+    op.drop_table('sheet_syncs')
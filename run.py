@@ -29,6 +29,11 @@ def init_db():
         db.create_all()
         print("Database tables created!")
 
+        # Full-text search index (FTS5 tables and sync triggers)
+        from app.services.search_service import SearchService
+        if SearchService().ensure_index():
+            print("Search index created!")
+
         # Create default admin user
         admin = User.query.filter_by(email='admin@gestorev2.local').first()
         if not admin:
@@ -0,0 +1,47 @@
+"""
+Shared fixtures: an app on a temporary SQLite database and the fake Google APIs
+"""
+
+import os
+import sys
+
+import pytest
+
+# Run from any directory: the app and the benchmarks live at the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_google_apis import FakeGoogleAPIs  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """App with the SQLite profile on an empty temporary database"""
+    monkeypatch.delenv('DATABASE_URL', raising=False)
+    monkeypatch.setenv('SQLITE_PATH', str(tmp_path / 'test.db'))
+    monkeypatch.setenv('FORM_SYNC_INTERVAL_SECONDS', '0')
+
+    from app import create_app, db
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def fake(app, monkeypatch):
+    """Fake Forms, Sheets and Drive APIs used by every Google service, without quota waits"""
+    from app.services.google_request_executor import google_requests
+
+    class NoWait:
+        def acquire(self, tokens=1):
+            return 0.0
+
+    monkeypatch.setattr(google_requests, '_bucket', lambda request: NoWait())
+
+    fake = FakeGoogleAPIs()
+    with fake.installed():
+        yield fake
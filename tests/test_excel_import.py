@@ -0,0 +1,30 @@
+"""
+ExcelImportService: the streaming (.xlsx) and pandas (.xls) paths agree
+"""
+
+from openpyxl import Workbook
+
+from app.services.excel_import_service import ExcelImportService
+
+
+def test_two_sheet_workbook_parses_the_same_on_both_paths(tmp_path):
+    workbook = Workbook()
+    event_sheet = workbook.active
+    event_sheet.title = 'Evento'
+    for row in (['Nome do Evento', 'Workshop de Inovação'], ['Data', '01/05/2026'], ['Duração', '2h'],
+                ['Local', 'Lisboa']):
+        event_sheet.append(row)
+    participants_sheet = workbook.create_sheet('Participantes')
+    participants_sheet.append(['Nome', 'Email', 'Telefone'])
+    participants_sheet.append(['Ana Silva', 'ana@example.com', '912345678'])
+    participants_sheet.append(['Bruno Costa', 'bruno@example.com', None])
+    path = str(tmp_path / 'evento.xlsx')
+    workbook.save(path)
+
+    service = ExcelImportService()
+    streamed = service._parse_file(path)
+    with_pandas = service._parse_event_dates(service._parse_excel_with_pandas(path))
+
+    assert [p['email'] for p in streamed['participants']] == ['ana@example.com', 'bruno@example.com']
+    assert with_pandas['participants'] == streamed['participants']
+    assert with_pandas['event'] == streamed['event']
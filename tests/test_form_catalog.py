@@ -0,0 +1,27 @@
+"""
+Form list and search of GoogleFormsService against the fake Drive API
+"""
+
+from datetime import date
+
+from app import db
+from app.models import Event, FormTemplate
+from app.services.google_forms_service import GoogleFormsService
+
+
+def test_template_forms_are_not_listed(fake):
+    fake.add_form('Inscrição: Workshop de Inovação')
+    service = GoogleFormsService()
+    # Loaded before the template exists, so building it must drop the cached list
+    assert len(service.list_recent_forms()) == 1
+
+    evento = Event(nome='Workshop', data_inicio=date(2026, 5, 1), duracao_minutos=60)
+    db.session.add(evento)
+    db.session.commit()
+    [created] = service.create_event_forms([evento])
+    template = FormTemplate.query.one()
+
+    listed = {form['id'] for form in service.list_recent_forms()}
+    assert created['form_id'] in listed
+    assert template.form_id not in listed
+    assert service.search_forms_by_name('modelo inscrição') == []
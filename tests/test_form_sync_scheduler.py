@@ -0,0 +1,141 @@
+"""
+FormSyncScheduler against the fake Forms API
+"""
+
+import threading
+import time
+from datetime import date, datetime
+
+import pytest
+
+from app import db
+from app.constants import GoogleConfig
+from app.models import Event
+from app.services.form_sync_scheduler import FormSyncScheduler
+
+INTERVAL = 60
+
+
+@pytest.fixture
+def scheduler(app, tmp_path, monkeypatch):
+    """Scheduler with a real worker pool but no loop thread: the tests call tick() themselves"""
+    monkeypatch.setattr(GoogleConfig, 'FORM_SYNC_LOCK_FILE', str(tmp_path / 'form_sync.lock'))
+    monkeypatch.setattr(GoogleConfig, 'FORM_SYNC_TICK_SECONDS', 0)  # new events are due at once
+    monkeypatch.setattr(GoogleConfig, 'FORM_SYNC_JITTER', 0)
+    monkeypatch.setattr(GoogleConfig, 'FORM_SYNC_MAX_BACKOFF_SECONDS', 300)
+    monkeypatch.setattr(GoogleConfig, 'API_MAX_RETRIES', 0)  # injected errors fail the sync right away
+    monkeypatch.setattr(GoogleConfig, 'FORM_SYNC_WORKERS', 2)
+
+    scheduler = FormSyncScheduler()
+    scheduler._loop = lambda: None
+    app.config['FORM_SYNC_INTERVAL_SECONDS'] = INTERVAL
+    scheduler.start(app)
+    yield scheduler
+    scheduler.stop()
+
+
+def add_event(fake, name, responses=0):
+    form_id = fake.add_form(f'Inscrição: {name}', responses=responses)
+    evento = Event(nome=name, data_inicio=date(2026, 5, 1), duracao_minutos=60, google_form_id=form_id)
+    db.session.add(evento)
+    db.session.commit()
+    return evento.id
+
+
+def wait_idle(scheduler, timeout=10):
+    deadline = time.monotonic() + timeout
+    while scheduler._running:
+        assert time.monotonic() < deadline, 'syncs still running'
+        time.sleep(0.01)
+
+
+def next_run(scheduler, event_id):
+    return scheduler.status()['events'][event_id]['next_run_in_seconds']
+
+
+def test_tick_runs_at_most_the_configured_workers(fake, scheduler):
+    event_ids = [add_event(fake, f'Evento {number}', responses=5) for number in range(6)]
+
+    # Count HTTP requests in flight at the same time (each sync is sequential)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    request = fake.request
+
+    def counting_request(*args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            return request(*args, **kwargs)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    fake.request = counting_request
+    fake.latency = 0.05
+
+    assert scheduler.tick() == 6
+    wait_idle(scheduler)
+
+    # The pool is kept busy, but never beyond its size
+    assert peak == GoogleConfig.FORM_SYNC_WORKERS
+    status = scheduler.status()
+    assert status['workers'] == 2
+    assert all(status['events'][event_id]['status'] == 'ok' for event_id in event_ids)
+    assert all(status['events'][event_id]['last_result']['imported'] == 5 for event_id in event_ids)
+    # Synced events are not due again until the interval passes
+    assert scheduler.tick() == 0
+
+
+def test_failures_back_off_exponentially_up_to_the_cap(fake, scheduler):
+    event_id = add_event(fake, 'Instável')
+    fake.inject_error(r'/responses', status=503, times=3)
+
+    expected = [INTERVAL * 2, INTERVAL * 4, GoogleConfig.FORM_SYNC_MAX_BACKOFF_SECONDS]
+    for failures, delay in enumerate(expected, start=1):
+        scheduler._sync_event(event_id)
+        state = scheduler.status()['events'][event_id]
+        assert state['status'] == 'erro'
+        assert state['failures'] == failures
+        assert '503' in state['last_error']
+        assert abs(next_run(scheduler, event_id) - delay) <= 1
+
+    # The next success resets the counter and the wait
+    scheduler._sync_event(event_id)
+    state = scheduler.status()['events'][event_id]
+    assert state['status'] == 'ok'
+    assert state['failures'] == 0
+    assert state['last_error'] is None
+    assert abs(next_run(scheduler, event_id) - INTERVAL) <= 1
+
+
+def test_sync_records_duration(fake, scheduler):
+    event_id = add_event(fake, 'Lento', responses=3)
+    fake.latency = 0.02
+
+    scheduler._sync_event(event_id)
+
+    state = scheduler.status()['events'][event_id]
+    assert state['last_duration_seconds'] >= 0.02
+    assert state['last_run_at'] is not None
+    assert state['last_result'] == {'responses': 3, 'imported': 3, 'updated': 0, 'errors': 0}
+
+
+def test_deleted_and_unlinked_events_leave_status(fake, scheduler):
+    deleted_id = add_event(fake, 'Apagado')
+    unlinked_id = add_event(fake, 'Desligado')
+    kept_id = add_event(fake, 'Mantido')
+
+    assert scheduler.tick() == 3
+    wait_idle(scheduler)
+    assert set(scheduler.status()['events']) == {deleted_id, unlinked_id, kept_id}
+
+    db.session.get(Event, deleted_id).deleted_at = datetime.utcnow()
+    db.session.get(Event, unlinked_id).google_form_id = None
+    db.session.commit()
+
+    scheduler.tick()
+    wait_idle(scheduler)
+    assert set(scheduler.status()['events']) == {kept_id}
@@ -0,0 +1,28 @@
+"""
+GoogleService and GoogleAuthService share one token file
+"""
+
+from datetime import datetime, timedelta
+
+from google.oauth2.credentials import Credentials
+
+from app.services.google_auth_service import GoogleAuthService
+from app.services.google_client_cache import google_clients
+from app.services.google_service import GoogleService
+
+
+def test_services_share_the_token_and_adopt_the_old_service_token(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(google_clients, 'get', lambda *args: None)
+    creds = Credentials(token='service-token', refresh_token='refresh', client_id='client', client_secret='secret',
+                        token_uri='https://oauth2.googleapis.com/token', scopes=GoogleAuthService.SCOPES,
+                        expiry=datetime.utcnow() + timedelta(hours=1))
+    (tmp_path / 'token_service.json').write_text(creds.to_json())
+
+    service = GoogleService()
+    service.authenticate()
+
+    assert not (tmp_path / 'token_service.json').exists()
+    assert (tmp_path / 'token.json').exists()
+    assert service.creds.token == 'service-token'
+    assert GoogleAuthService().get_credentials() is service.creds
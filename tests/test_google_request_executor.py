@@ -0,0 +1,64 @@
+"""
+GoogleRequestExecutor retries against the fake Google APIs
+"""
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from app.constants import GoogleConfig
+from app.services.google_request_executor import google_requests
+from app.services.google_service import GoogleService
+
+
+@pytest.fixture
+def sheets(fake, monkeypatch):
+    monkeypatch.setattr(GoogleConfig, 'API_MAX_RETRIES', 3)
+    monkeypatch.setattr(GoogleConfig, 'API_BACKOFF_BASE_SECONDS', 0)
+    service = GoogleService()
+    service.authenticate()
+    return service.sheets_service
+
+
+def calls(fake, endpoint):
+    return fake.stats()['calls'].get(endpoint, 0)
+
+
+def test_gets_are_retried_on_server_errors(fake, sheets):
+    spreadsheet_id = fake.add_spreadsheet('Folha', [['Nome']])
+    fake.inject_error(r'GET /v4/spreadsheets/[^/:]+$', status=503, times=2, retry_after=0)
+    fake.reset_stats()
+
+    google_requests.execute(sheets.spreadsheets().get(spreadsheetId=spreadsheet_id))
+
+    assert calls(fake, 'sheets_get') == 3
+
+
+def test_creates_are_not_retried_on_server_errors(fake, sheets):
+    fake.inject_error(r'POST /v4/spreadsheets$', status=503, retry_after=0)
+    fake.reset_stats()
+
+    with pytest.raises(HttpError):
+        google_requests.execute(sheets.spreadsheets().create(body={'properties': {'title': 'Nova'}}))
+
+    assert calls(fake, 'sheets_create') == 1
+
+
+def test_creates_are_retried_on_rate_limits(fake, sheets):
+    fake.inject_error(r'POST /v4/spreadsheets$', status=429, retry_after=0)
+    fake.reset_stats()
+
+    google_requests.execute(sheets.spreadsheets().create(body={'properties': {'title': 'Nova'}}))
+
+    assert calls(fake, 'sheets_create') == 2
+
+
+def test_value_updates_are_retried_on_server_errors(fake, sheets):
+    spreadsheet_id = fake.add_spreadsheet('Folha', [['Nome']])
+    fake.inject_error(r'values:batchUpdate', status=503, retry_after=0)
+    fake.reset_stats()
+
+    body = {'valueInputOption': 'RAW', 'data': [{'range': 'A2', 'values': [['Ana']]}]}
+    google_requests.execute(sheets.spreadsheets().values().batchUpdate(spreadsheetId=spreadsheet_id, body=body))
+
+    assert calls(fake, 'values_batch_update') == 2
+    assert fake.sheet_rows(spreadsheet_id) == [['Nome'], ['Ana']]
@@ -0,0 +1,35 @@
+"""
+ParticipantUpsertService statistics and the import job messages built from them
+"""
+
+from datetime import date
+
+from app import db
+from app.models import Event
+from app.services.import_job_service import ImportJobService
+from app.services.participant_upsert_service import ParticipantUpsertService
+
+RECORDS = [
+    {'nome': 'Ana', 'email': 'ana@example.com'},
+    {'nome': 'Bruno', 'email': 'bruno@example.com'},
+    {'nome': 'Ana Silva', 'email': 'ANA@example.com'},
+    {'nome': '', 'email': ''},
+]
+
+
+def test_invalid_rows_are_errors_not_skipped(app):
+    evento = Event(nome='Workshop', data_inicio=date(2026, 5, 1), duracao_minutos=60)
+    db.session.add(evento)
+    db.session.commit()
+    service = ParticipantUpsertService()
+
+    first = service.apply(evento.id, service.plan(evento.id, RECORDS))
+    assert (first['imported'], first['skipped'], first['duplicates'], first['errors']) == (2, 1, 1, 1)
+    assert len(first['error_details']) == 1
+
+    second = service.apply(evento.id, service.plan(evento.id, RECORDS))
+    assert (second['imported'], second['skipped'], second['duplicates'], second['errors']) == (0, 3, 1, 1)
+
+    result = ImportJobService()._participants_result(second)
+    assert result['message'] == '✓ Importação concluída: 2 já existentes (ignorados), 1 duplicados no ficheiro'
+    assert result['avisos'] == ['⚠️ 1 participantes sem nome ou email foram ignorados']
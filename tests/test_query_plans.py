@@ -0,0 +1,71 @@
+"""
+EXPLAIN QUERY PLAN of the hot soft-delete queries uses the composite and partial indexes
+"""
+
+import pytest
+
+from app import db
+from app.models import Event, Participant
+
+
+def query_plan(query):
+    """Details of the EXPLAIN QUERY PLAN rows of a Flask-SQLAlchemy query"""
+    statement = query.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True})
+    rows = db.session.execute(db.text(f'EXPLAIN QUERY PLAN {statement}')).all()
+    return ' | '.join(row[-1] for row in rows)
+
+
+def assert_uses_index(query, *indexes):
+    plan = query_plan(query)
+    assert any(f'INDEX {index}' in plan for index in indexes), plan
+
+
+@pytest.fixture(autouse=True)
+def sqlite_only(app):
+    if db.engine.dialect.name != 'sqlite':
+        pytest.skip('EXPLAIN QUERY PLAN is SQLite syntax')
+
+
+def test_organization_event_listing(app):
+    # main.py eventos_anarita / eventos_ardaterra
+    query = Event.query.filter(Event.deleted_at.is_(None), Event.organizacao_id == 1)
+    assert_uses_index(query, 'ix_events_organizacao_id_deleted_at_data_inicio')
+
+
+def test_organization_event_listing_by_date(app):
+    query = Event.query.filter(Event.deleted_at.is_(None), Event.organizacao_id == 1).order_by(Event.data_inicio)
+    assert_uses_index(query, 'ix_events_organizacao_id_deleted_at_data_inicio')
+    assert 'TEMP B-TREE' not in query_plan(query)
+
+
+def test_active_event_listing_by_date(app):
+    # events.py list_events
+    query = Event.query.filter(Event.deleted_at.is_(None)).order_by(Event.data_inicio.desc())
+    assert_uses_index(query, 'ix_events_active_data_inicio')
+    assert 'TEMP B-TREE' not in query_plan(query)
+
+
+def test_event_participants(app):
+    # main.py detalhe_evento
+    query = Participant.query.filter_by(evento_id=1).filter(Participant.deleted_at.is_(None))
+    assert_uses_index(query, 'ix_participants_active_evento_id', 'ix_participants_evento_id_deleted_at')
+
+
+def test_certificates_to_send(app):
+    # main.py certificate batch sending
+    query = Participant.query.filter_by(
+        evento_id=1, certificado_gerado=True, certificado_enviado=False
+    ).filter(Participant.deleted_at.is_(None))
+    assert_uses_index(query, 'ix_participants_evento_id_certificado')
+
+
+def test_confirmed_count(app):
+    # Event.get_confirmed_count (events.py and the event pages)
+    query = Participant.query.filter_by(evento_id=1, status='confirmado')
+    assert_uses_index(query, 'ix_participants_evento_id_status')
+
+
+def test_existing_participant_check(app):
+    # participants.py add_participant: resolved through the (email, evento_id) unique index
+    query = Participant.query.filter_by(email='a@example.com', evento_id=1, deleted_at=None)
+    assert 'SCAN participants' not in query_plan(query)
@@ -0,0 +1,40 @@
+"""
+Search API: results never cross organizations
+"""
+
+from datetime import date
+
+from app import db
+from app.models import Event, Organization, Participant
+from app.services.search_service import SearchService
+
+
+def add_event(organization, email):
+    evento = Event(nome='Workshop de Inovação', data_inicio=date(2026, 5, 1), duracao_minutos=60,
+                   organizacao_id=organization.id)
+    db.session.add(evento)
+    db.session.flush()
+    db.session.add(Participant(nome='Ana Silva', email=email, evento_id=evento.id))
+    return evento
+
+
+def test_search_requires_and_stays_within_an_organization(app):
+    SearchService().ensure_index()
+    first = Organization(nome='Primeira', slug='primeira')
+    second = Organization(nome='Segunda', slug='segunda')
+    db.session.add_all([first, second])
+    db.session.flush()
+    evento = add_event(first, 'ana@primeira.pt')
+    add_event(second, 'ana@segunda.pt')
+    db.session.commit()
+
+    client = app.test_client()
+    assert client.get('/api/search/?q=ana').status_code == 400
+
+    response = client.get(f'/api/search/?q=ana&organizacao_id={first.id}')
+    assert response.status_code == 200
+    participants = response.get_json()['participants']['items']
+    assert [item['email'] for item in participants] == ['ana@primeira.pt']
+
+    events = client.get(f'/api/search/?q=inovacao&tipo=events&organizacao_id={first.id}').get_json()['events']
+    assert [item['id'] for item in events['items']] == [evento.id]
@@ -0,0 +1,66 @@
+"""
+SheetSyncService against the fake Sheets API
+"""
+
+from datetime import date
+
+import pytest
+
+from app import db
+from app.models import Event, Participant, SheetSync
+from app.services.sheet_sync_service import SheetSyncService
+
+
+def add_event(count):
+    evento = Event(nome='Workshop', data_inicio=date(2026, 5, 1), duracao_minutos=60)
+    db.session.add(evento)
+    db.session.flush()
+    db.session.add_all([
+        Participant(nome=f'Participante {number}', email=f'p{number}@example.com', evento_id=evento.id)
+        for number in range(count)
+    ])
+    db.session.commit()
+    return evento
+
+
+def test_new_spreadsheet_is_kept_when_the_first_sync_fails(fake):
+    evento = add_event(2)
+    fake.inject_error(r'GET /v4/spreadsheets/', status=400)
+
+    with pytest.raises(Exception):
+        SheetSyncService().sync_event(evento)
+
+    sheet_sync = SheetSync.query.filter_by(evento_id=evento.id).one()
+    assert sheet_sync.spreadsheet_id in fake.spreadsheets
+
+    fake.reset_stats()
+    stats = SheetSyncService().sync_event(db.session.get(Event, evento.id))
+    assert stats['spreadsheet_id'] == sheet_sync.spreadsheet_id
+    assert 'sheets_create' not in fake.stats()['calls']
+    assert len(fake.sheet_rows(sheet_sync.spreadsheet_id)) == 3
+
+
+def test_growing_the_sheet_and_writing_rows_is_one_request(fake):
+    evento = add_event(5)
+    spreadsheet_id = fake.add_spreadsheet('Participantes', [])
+    fake.spreadsheets[spreadsheet_id]['sheets'][0]['row_count'] = 3
+
+    fake.reset_stats()
+    stats = SheetSyncService().sync_event(evento, spreadsheet_id=spreadsheet_id)
+
+    calls = fake.stats()['calls']
+    assert calls.get('sheets_batch_update') == 1
+    assert 'values_batch_update' not in calls
+    assert stats['added'] == 5
+    assert stats['cells'] == 6 * len(SheetSyncService.COLUMNS)
+    rows = fake.sheet_rows(spreadsheet_id)
+    assert rows[0][:2] == ['ID', 'Nome'] and len(rows) == 6
+
+    # Removed participants are blanked without growing the grid
+    Participant.query.filter_by(email='p4@example.com').delete()
+    db.session.commit()
+    fake.reset_stats()
+    stats = SheetSyncService().sync_event(evento)
+    assert stats['removed'] == 1
+    assert fake.stats()['calls'].get('sheets_batch_update') == 1
+    assert len(fake.sheet_rows(spreadsheet_id)) == 5
@@ -0,0 +1,45 @@
+"""
+Pruning of stored uploads in ExcelImportService.save_uploaded_file
+"""
+
+import io
+import os
+import time
+
+from werkzeug.datastructures import FileStorage
+
+from app import db
+from app.constants import ImportConfig
+from app.models import ImportJob
+from app.services.excel_import_service import ExcelImportService
+
+
+def old_upload(folder, name):
+    path = os.path.join(folder, name)
+    with open(path, 'wb') as f:
+        f.write(b'old')
+    past = time.time() - ImportConfig.UPLOAD_RETENTION_SECONDS - 60
+    os.utime(path, (past, past))
+    return path
+
+
+def test_uploads_of_open_jobs_are_kept(app, tmp_path):
+    folder = str(tmp_path / 'uploads')
+    os.makedirs(folder)
+    previewed = old_upload(folder, 'upload_' + 'a' * 64 + '.xlsx')
+    finished = old_upload(folder, 'upload_' + 'b' * 64 + '.xlsx')
+    orphan = old_upload(folder, 'upload_' + 'c' * 64 + '.xlsx')
+    db.session.add_all([
+        ImportJob(id='previewed', tipo='excel_participantes', status='pre_visualizacao', source=previewed),
+        ImportJob(id='finished', tipo='excel_participantes', status='concluido', source=finished),
+    ])
+    db.session.commit()
+
+    saved = ExcelImportService().save_uploaded_file(
+        FileStorage(stream=io.BytesIO(b'new'), filename='Participantes.xlsx'), folder
+    )
+
+    assert os.path.exists(previewed)
+    assert not os.path.exists(finished)
+    assert not os.path.exists(orphan)
+    assert os.path.exists(saved)